@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+#
+# Copyright 2017 Pixar Animation Studios
+#
+# Licensed under the Apache License, Version 2.0 (the "Apache License")
+# with the following modification; you may not use this file except in
+# compliance with the Apache License and the following modification to it:
+# Section 6. Trademarks. is deleted and replaced with:
+#
+# 6. Trademarks. This License does not grant permission to use the trade
+#    names, trademarks, service marks, or product names of the Licensor
+#    and its affiliates, except as required to comply with Section 4(c) of
+#    the License and to reproduce the content of the NOTICE file.
+#
+# You may obtain a copy of the Apache License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the Apache License with the above modification is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied. See the Apache License for the specific
+# language governing permissions and limitations under the Apache License.
+#
+
+"""Example OTIO script that measures the memory and time it takes to build
+and copy many TimeRanges, each holding two RationalTimes.
+
+Run it before and after a change to opentime to compare, for example:
+
+    python examples/time_range_memory.py -n 200000
+"""
+
+import argparse
+import copy
+import sys
+import timeit
+
+try:
+    import tracemalloc
+except ImportError:
+    # python 2
+    tracemalloc = None
+
+import opentimelineio as otio
+
+
+def _parsed_args():
+    parser = argparse.ArgumentParser(
+        description="Measure the cost of TimeRange and RationalTime."
+    )
+    parser.add_argument(
+        "-n",
+        "--count",
+        type=int,
+        default=200000,
+        help="Number of TimeRanges to build (default: 200000)."
+    )
+
+    return parser.parse_args()
+
+
+def _new_range(i):
+    return otio.opentime.TimeRange(
+        otio.opentime.RationalTime(i, 24),
+        otio.opentime.RationalTime(10, 24)
+    )
+
+
+def main():
+    args = _parsed_args()
+
+    if tracemalloc is None:
+        sys.stderr.write("Measuring memory needs tracemalloc (python 3).\n")
+        sys.exit(1)
+
+    tracemalloc.start()
+    ranges = [_new_range(i) for i in range(args.count)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    tr = ranges[0]
+    loops = 100000
+    construct = min(
+        timeit.repeat(lambda: _new_range(1), number=loops, repeat=5)
+    )
+    copied = min(
+        timeit.repeat(lambda: copy.copy(tr), number=loops, repeat=5)
+    )
+
+    print(
+        "{} TimeRanges: {:.1f} MB ({:.0f} B each)".format(
+            len(ranges),
+            size / 1e6,
+            float(size) / len(ranges)
+        )
+    )
+    print("construct: {:.1f} us".format(construct / loops * 1e6))
+    print("copy.copy: {:.1f} us".format(copied / loops * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -90,12 +90,24 @@ def from_filepath(filepath):
 
     example:
         "foo.otio" returns the "otio_json" adapter.
+
+    Suffixes of two parts, like "otio.gz", take precedence over the last part
+    of the suffix alone.
     """
 
-    outext = os.path.splitext(filepath)[1][1:]
+    root, outext = os.path.splitext(filepath)
+    outext = outext[1:]
+    innerext = os.path.splitext(root)[1][1:]
+
+    manifest = plugins.ActiveManifest()
+    if innerext:
+        try:
+            return manifest.from_filepath("{}.{}".format(innerext, outext))
+        except exceptions.NoKnownAdapterForExtensionError:
+            pass
 
     try:
-        return plugins.ActiveManifest().from_filepath(outext)
+        return manifest.from_filepath(outext)
     except exceptions.NoKnownAdapterForExtensionError:
         raise exceptions.NoKnownAdapterForExtensionError(
             "No adapter for suffix '{}' on file '{}'".format(
@@ -0,0 +1,528 @@
+#
+# Copyright 2017 Pixar Animation Studios
+#
+# Licensed under the Apache License, Version 2.0 (the "Apache License")
+# with the following modification; you may not use this file except in
+# compliance with the Apache License and the following modification to it:
+# Section 6. Trademarks. is deleted and replaced with:
+#
+# 6. Trademarks. This License does not grant permission to use the trade
+#    names, trademarks, service marks, or product names of the Licensor
+#    and its affiliates, except as required to comply with Section 4(c) of
+#    the License and to reproduce the content of the NOTICE file.
+#
+# You may obtain a copy of the Apache License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the Apache License with the above modification is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied. See the Apache License for the specific
+# language governing permissions and limitations under the Apache License.
+#
+
+"""This adapter reads and writes .otiob, a compact binary form of .otio
+
+It stores the same object model as the otio_json adapter, and reading either
+form of a timeline gives equivalent objects.
+
+Layout of a file:
+
+    magic           b"OTIOB"
+    version         varint (currently 1)
+    string count    varint
+    strings         varint byte length + utf-8, for every dictionary key and
+                    schema label, referenced by index from the values
+    root            value
+
+Each value starts with a one byte tag:
+
+    None, False, True
+    int             zigzag varint
+    float           little endian double
+    integral float  zigzag varint, read back as a float
+    string          varint byte length + utf-8
+    list            varint byte length, varint count, values
+    dict            varint byte length, varint count, (key index, value)s
+    object          label index, varint byte length, varint count,
+                    (key index, value)s
+    RationalTime    value, rate
+    TimeRange       start time value, start time rate, duration value,
+                    duration rate
+    TimeTransform   offset value, offset rate, scale
+
+where the byte length of the containers covers everything after it, so that
+readers can skip over subtrees, and the numbers inside the opentime values are
+themselves tagged int or float values.
+"""
+
+import struct
+
+from .. import (
+    core,
+    exceptions,
+    opentime,
+)
+from ..core import json_serializer
+
+
+_MAGIC = b"OTIOB"
+_FORMAT_VERSION = 1
+
+# @{ Value tags
+_NONE = 0
+_FALSE = 1
+_TRUE = 2
+_INT = 3
+_FLOAT = 4
+_INTEGRAL_FLOAT = 5
+_STRING = 6
+_LIST = 7
+_DICT = 8
+_OBJECT = 9
+_RATIONAL_TIME = 10
+_TIME_RANGE = 11
+_TIME_TRANSFORM = 12
+# @}
+
+_DOUBLE = struct.Struct("<d")
+
+# integral floats beyond this are not exactly representable as a varint
+_MAX_INTEGRAL_FLOAT = float(2 ** 53)
+
+
+def read_from_file(filepath):
+    with open(filepath, 'rb') as fo:
+        result = read_from_string(fo.read())
+
+    result._json_path = filepath
+    return result
+
+
+def read_from_string(input_str):
+    data = bytearray(input_str)
+    if data[:len(_MAGIC)] != _MAGIC:
+        raise exceptions.CouldNotReadFileError(
+            "Not an otio binary file, missing the '{}' header.".format(
+                _MAGIC.decode("ascii")
+            )
+        )
+
+    try:
+        version, pos = _decoded_varint(data, len(_MAGIC))
+        if version > _FORMAT_VERSION:
+            raise exceptions.CouldNotReadFileError(
+                "otio binary format version {} is newer than the supported "
+                "version {}.".format(version, _FORMAT_VERSION)
+            )
+
+        count, pos = _decoded_varint(data, pos)
+        strings = []
+        for _ in range(count):
+            length, pos = _decoded_varint(data, pos)
+            end = pos + length
+            strings.append(data[pos:end].decode("utf-8"))
+            pos = end
+
+        result, pos = _decoded_value(data, pos, strings)
+    except (IndexError, ValueError, struct.error) as err:
+        raise exceptions.CouldNotReadFileError(
+            "Corrupt otio binary data: {}".format(err)
+        )
+
+    if pos != len(data):
+        raise exceptions.CouldNotReadFileError(
+            "Corrupt otio binary data: {} trailing bytes.".format(
+                len(data) - pos
+            )
+        )
+
+    return result
+
+
+def write_to_string(input_otio):
+    strings = {}
+    body = bytearray()
+    _encode_value(input_otio, body, strings)
+
+    result = bytearray(_MAGIC)
+    _encode_varint(_FORMAT_VERSION, result)
+    _encode_varint(len(strings), result)
+    for string in sorted(strings, key=strings.get):
+        encoded = _utf8(string)
+        _encode_varint(len(encoded), result)
+        result += encoded
+    result += body
+
+    return bytes(result)
+
+
+def write_to_file(input_otio, filepath):
+    with open(filepath, 'wb') as fo:
+        fo.write(write_to_string(input_otio))
+
+
+# @{ Encoders
+
+
+def _encode_varint(value, out):
+    while value > 0x7f:
+        out.append((value & 0x7f) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _encode_int(value, out):
+    out.append(_INT)
+    _encode_varint(value << 1 if value >= 0 else (-value << 1) - 1, out)
+
+
+def _encode_float(value, out):
+    if (
+        value.is_integer() and
+        abs(value) < _MAX_INTEGRAL_FLOAT and
+        # keep the sign of -0.0
+        (value or str(value)[0] != "-")
+    ):
+        value = int(value)
+        out.append(_INTEGRAL_FLOAT)
+        _encode_varint(value << 1 if value >= 0 else (-value << 1) - 1, out)
+        return
+
+    out.append(_FLOAT)
+    out += _DOUBLE.pack(value)
+
+
+def _encode_number(value, out):
+    # numbers are stored the way the json module would write them
+    if value is True or value is False or value is None:
+        _encode_value(value, out, None)
+    elif isinstance(value, json_serializer._INTEGER_TYPES):
+        _encode_int(int(value), out)
+    elif isinstance(value, float):
+        _encode_float(float(value), out)
+    else:
+        raise TypeError(
+            "Object of type {} is not JSON serializable".format(
+                type(value).__name__
+            )
+        )
+
+
+def _utf8(value):
+    if isinstance(value, bytes):
+        # a str of Python 2, which the json module reads as utf-8
+        return value
+
+    return value.encode("utf-8")
+
+
+def _encode_string(value, out):
+    encoded = _utf8(value)
+    out.append(_STRING)
+    _encode_varint(len(encoded), out)
+    out += encoded
+
+
+def _string_index(value, strings):
+    try:
+        return strings[value]
+    except KeyError:
+        index = strings[value] = len(strings)
+        return index
+
+
+def _key_string(key):
+    # the json module writes keys that are not strings as strings
+    if isinstance(key, core.type_registry._STRING_TYPES):
+        return key
+    if isinstance(key, float):
+        return json_serializer._encoded_float(key)
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, json_serializer._INTEGER_TYPES):
+        return json_serializer._encoded_int(key)
+
+    raise TypeError(
+        "keys must be str, int, float, bool or None, not {}".format(
+            key.__class__.__name__
+        )
+    )
+
+
+def _encode_container(tag, count, body, out):
+    if tag is not None:
+        out.append(tag)
+    count_bytes = bytearray()
+    _encode_varint(count, count_bytes)
+    _encode_varint(len(count_bytes) + len(body), out)
+    out += count_bytes
+    out += body
+
+
+def _encode_items(items, body, strings):
+    count = 0
+    for key, item in items:
+        _encode_varint(_string_index(_key_string(key), strings), body)
+        _encode_value(item, body, strings)
+        count += 1
+
+    return count
+
+
+def _encode_rational_time(value, out):
+    _encode_number(value.value, out)
+    _encode_number(value.rate, out)
+
+
+def _encode_value(value, out, strings):
+    cls = type(value)
+    if cls is str:
+        _encode_string(value, out)
+    elif value is None:
+        out.append(_NONE)
+    elif value is True:
+        out.append(_TRUE)
+    elif value is False:
+        out.append(_FALSE)
+    elif cls is int:
+        _encode_int(value, out)
+    elif cls is float:
+        _encode_float(value, out)
+    elif cls is opentime.RationalTime:
+        out.append(_RATIONAL_TIME)
+        _encode_rational_time(value, out)
+    elif cls is opentime.TimeRange:
+        out.append(_TIME_RANGE)
+        _encode_rational_time(value.start_time, out)
+        _encode_rational_time(value.duration, out)
+    elif cls is opentime.TimeTransform:
+        out.append(_TIME_TRANSFORM)
+        _encode_rational_time(value.offset, out)
+        _encode_number(value.scale, out)
+    elif isinstance(value, (list, tuple)):
+        body = bytearray()
+        for item in value:
+            _encode_value(item, body, strings)
+        _encode_container(_LIST, len(value), body, out)
+    elif isinstance(value, dict):
+        body = bytearray()
+        count = _encode_items(value.items(), body, strings)
+        _encode_container(_DICT, count, body, out)
+    elif isinstance(value, core.type_registry._STRING_TYPES):
+        _encode_string(value, out)
+    elif isinstance(value, json_serializer._INTEGER_TYPES + (float,)):
+        _encode_number(value, out)
+    else:
+        _encode_serializable(value, out, strings)
+
+
+def _encode_serializable(value, out, strings):
+    try:
+        encfn = json_serializer._ENCODER_DISPATCH[type(value)]
+    except KeyError:
+        encfn = json_serializer._encoder_for_type(type(value))
+
+    if encfn is None:
+        raise TypeError(
+            "Object of type {} is not JSON serializable".format(
+                type(value).__name__
+            )
+        )
+
+    if encfn is json_serializer._encoded_serializable_object:
+        value._materialize_fields()
+        label = value._serializable_label
+        data = value.data
+        if label and "OTIO_SCHEMA" not in data:
+            body = bytearray()
+            count = _encode_items(data.items(), body, strings)
+            _encode_object_body(label, count, body, out, strings)
+            return
+
+    encoded = dict(encfn(value))
+    label = encoded.pop("OTIO_SCHEMA")
+    if isinstance(value, (
+        opentime.RationalTime,
+        opentime.TimeRange,
+        opentime.TimeTransform
+    )):
+        # subclasses of the opentime types
+        encoded["OTIO_SCHEMA"] = label
+        _encode_value(encoded, out, strings)
+        return
+
+    body = bytearray()
+    count = _encode_items(encoded.items(), body, strings)
+    _encode_object_body(label, count, body, out, strings)
+
+
+def _encode_object_body(label, count, body, out, strings):
+    out.append(_OBJECT)
+    _encode_varint(_string_index(label, strings), out)
+    _encode_container(None, count, body, out)
+# @}
+
+
+# @{ Decoders
+
+
+def _decoded_varint(data, pos):
+    byte = data[pos]
+    pos += 1
+    if byte < 0x80:
+        return byte, pos
+
+    result = byte & 0x7f
+    shift = 7
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _decoded_number(data, pos):
+    tag = data[pos]
+    if tag == _INT or tag == _INTEGRAL_FLOAT:
+        value = data[pos + 1]
+        if value < 0x80:
+            pos += 2
+        else:
+            value, pos = _decoded_varint(data, pos + 1)
+
+        value = -((value + 1) >> 1) if value & 1 else value >> 1
+        return (value if tag == _INT else float(value)), pos
+
+    if tag == _FLOAT:
+        return _DOUBLE.unpack_from(data, pos + 1)[0], pos + 9
+
+    # anything else the json module would have written in place of a number
+    return _decoded_value(data, pos, None)
+
+
+def _decoded_rational_time(data, pos):
+    value, pos = _decoded_number(data, pos)
+    rate, pos = _decoded_number(data, pos)
+    return opentime.RationalTime(value, rate), pos
+
+
+def _decoded_fields(data, pos, strings):
+    """Decode a count and that many (key index, value) pairs up to the end
+    given by the length before them.
+    """
+
+    end, pos = _decoded_varint(data, pos)
+    end += pos
+    count, pos = _decoded_varint(data, pos)
+
+    result = {}
+    for _ in range(count):
+        key = data[pos]
+        if key < 0x80:
+            pos += 1
+        else:
+            key, pos = _decoded_varint(data, pos)
+
+        # the most common values are decoded inline
+        tag = data[pos]
+        if tag == _STRING:
+            length = data[pos + 1]
+            if length < 0x80:
+                pos += 2
+            else:
+                length, pos = _decoded_varint(data, pos + 1)
+            value_end = pos + length
+            result[strings[key]] = data[pos:value_end].decode("utf-8")
+            pos = value_end
+        elif tag == _NONE:
+            result[strings[key]] = None
+            pos += 1
+        else:
+            result[strings[key]], pos = _decoded_value(data, pos, strings)
+
+    _check_end(pos, end)
+    return result, pos
+
+
+def _check_end(pos, end):
+    if pos != end:
+        raise ValueError("container length mismatch at byte {}".format(pos))
+
+
+def _decoded_value(data, pos, strings):
+    tag = data[pos]
+    pos += 1
+
+    if tag == _OBJECT:
+        label, pos = _decoded_varint(data, pos)
+        fields, pos = _decoded_fields(data, pos, strings)
+
+        return (
+            core.type_registry.instance_from_schema_label(
+                strings[label],
+                fields
+            ),
+            pos
+        )
+
+    if tag == _STRING:
+        length, pos = _decoded_varint(data, pos)
+        end = pos + length
+        return data[pos:end].decode("utf-8"), end
+
+    if tag == _TIME_RANGE:
+        start_time, pos = _decoded_rational_time(data, pos)
+        duration, pos = _decoded_rational_time(data, pos)
+        return opentime.TimeRange(start_time, duration), pos
+
+    if tag == _DICT:
+        result, pos = _decoded_fields(data, pos, strings)
+        if "OTIO_SCHEMA" in result:
+            # the same as a dictionary that looks like an object in json
+            result = json_serializer._as_otio(result)
+        return result, pos
+
+    if tag == _LIST:
+        end, pos = _decoded_varint(data, pos)
+        end += pos
+        count, pos = _decoded_varint(data, pos)
+
+        result = []
+        append = result.append
+        for _ in range(count):
+            item, pos = _decoded_value(data, pos, strings)
+            append(item)
+        _check_end(pos, end)
+
+        return result, pos
+
+    if tag == _INT or tag == _INTEGRAL_FLOAT or tag == _FLOAT:
+        return _decoded_number(data, pos - 1)
+
+    if tag == _NONE:
+        return None, pos
+
+    if tag == _TRUE:
+        return True, pos
+
+    if tag == _FALSE:
+        return False, pos
+
+    if tag == _RATIONAL_TIME:
+        return _decoded_rational_time(data, pos)
+
+    if tag == _TIME_TRANSFORM:
+        offset, pos = _decoded_rational_time(data, pos)
+        scale, pos = _decoded_number(data, pos)
+        return opentime.TimeTransform(offset, scale), pos
+
+    raise ValueError("unknown value tag {} at byte {}".format(tag, pos - 1))
+# @}
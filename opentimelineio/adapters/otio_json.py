@@ -22,22 +22,105 @@
 # language governing permissions and limitations under the Apache License.
 #
 
-"""This adapter lets you read and write native .otio files"""
+"""This adapter lets you read and write native .otio files
+
+Files with a .gz, .bz2 or .xz suffix (for example "timeline.otio.gz") are
+written compressed, and compressed files are read whatever their suffix.
+The .xz files need the lzma module, which python 2 does not have.
+
+Reading with lazy=True leaves the children of compositions undecoded until
+they are first accessed, see core.deserialize_json_from_string().  Media
+linking visits every clip, so combine it with
+media_linker_name=MediaLinkingPolicy.DoNotLinkMedia to keep the read lazy
+when a default media linker is configured.
+"""
+
+import bz2
+import codecs
+import gzip
+import os
+
+try:
+    import lzma
+except ImportError:
+    # python 2
+    lzma = None
 
 from .. import (
-    core
+    core,
+    exceptions,
 )
 
 
 # @TODO: Implement out of process plugins that hand around JSON
 
 
-def read_from_file(filepath):
-    return core.deserialize_json_from_file(filepath)
+# Map of file suffixes to the compressed file classes that write them.
+_COMPRESSED_FILE_TYPES = {
+    "gz": gzip.GzipFile,
+    "bz2": bz2.BZ2File,
+}
+
+# Magic numbers that compressed files start with, with their file classes.
+_COMPRESSED_FILE_MAGIC = [
+    (b"\x1f\x8b", gzip.GzipFile),
+    (b"BZh", bz2.BZ2File),
+]
+
+_XZ_MAGIC = b"\xfd7zXZ\x00"
+
+if lzma is not None:
+    _COMPRESSED_FILE_TYPES["xz"] = lzma.LZMAFile
+    _COMPRESSED_FILE_MAGIC.append((_XZ_MAGIC, lzma.LZMAFile))
+
+
+def _compressed_file_type_for_suffix(filepath):
+    suffix = os.path.splitext(filepath)[1][1:].lower()
+    if suffix == "xz" and lzma is None:
+        raise exceptions.WritingNotSupportedError(
+            "Cannot write {}: .xz files need the lzma module, which this "
+            "python does not have.".format(filepath)
+        )
+
+    return _COMPRESSED_FILE_TYPES.get(suffix)
 
 
-def read_from_string(input_str):
-    return core.deserialize_json_from_string(input_str)
+def _compressed_file_type_for_contents(filepath):
+    with open(filepath, 'rb') as fo:
+        header = fo.read(6)
+
+    if header.startswith(_XZ_MAGIC) and lzma is None:
+        raise exceptions.ReadingNotSupportedError(
+            "Cannot read {}: .xz files need the lzma module, which this "
+            "python does not have.".format(filepath)
+        )
+
+    for magic, file_type in _COMPRESSED_FILE_MAGIC:
+        if header.startswith(magic):
+            return file_type
+
+    return None
+
+
+def read_from_file(filepath, lazy=False):
+    file_type = _compressed_file_type_for_contents(filepath)
+    if file_type is None:
+        return core.deserialize_json_from_file(filepath, lazy)
+
+    # the compressed file is not read into memory, but like for other files
+    # the json module is given the whole decompressed text at once
+    with file_type(filepath, 'rb') as fo:
+        result = core.deserialize_json_from_string(
+            fo.read().decode("utf-8"),
+            lazy
+        )
+
+    result._json_path = filepath
+    return result
+
+
+def read_from_string(input_str, lazy=False):
+    return core.deserialize_json_from_string(input_str, lazy)
 
 
 def write_to_string(input_otio):
@@ -45,4 +128,10 @@ def write_to_string(input_otio):
 
 
 def write_to_file(input_otio, filepath):
-    return core.serialize_json_to_file(input_otio, filepath)
+    file_type = _compressed_file_type_for_suffix(filepath)
+    if file_type is None:
+        return core.serialize_json_to_file(input_otio, filepath)
+
+    # the text is compressed as it is written, so it is never all in memory
+    with codecs.getwriter("utf-8")(file_type(filepath, 'wb')) as fo:
+        core.serialize_json_to_stream(input_otio, fo)
@@ -36,5 +36,21 @@ from .stack_algo import (
 
 from .filter import (
     filtered_composition,
-    filtered_with_sequence_context
+    filtered_with_sequence_context,
+    FilterPipeline
+)
+
+from .time_index import (
+    TimeIndex
+)
+
+from .diff_algo import (
+    diff,
+    DiffEdit,
+    DiffEditKind
+)
+
+from .batch import (
+    flattened_stacks,
+    filtered_compositions
 )
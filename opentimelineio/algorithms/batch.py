@@ -0,0 +1,139 @@
+#
+# Copyright 2017 Pixar Animation Studios
+#
+# Licensed under the Apache License, Version 2.0 (the "Apache License")
+# with the following modification; you may not use this file except in
+# compliance with the Apache License and the following modification to it:
+# Section 6. Trademarks. is deleted and replaced with:
+#
+# 6. Trademarks. This License does not grant permission to use the trade
+#    names, trademarks, service marks, or product names of the Licensor
+#    and its affiliates, except as required to comply with Section 4(c) of
+#    the License and to reproduce the content of the NOTICE file.
+#
+# You may obtain a copy of the Apache License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the Apache License with the above modification is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied. See the Apache License for the specific
+# language governing permissions and limitations under the Apache License.
+#
+
+__doc__ = """ Run algorithms over many timelines in parallel processes. """
+
+import multiprocessing
+
+from .filter import filtered_composition
+from .stack_algo import flatten_stack
+from ..adapters import otio_binary
+
+
+def flattened_stacks(stacks, max_workers=None):
+    """Return a list of flatten_stack() of each of stacks, in order.
+
+    stacks:: iterable of what flatten_stack() accepts, a Stack or a list of
+        Tracks, for example [tl.video_tracks() for tl in collection]
+    max_workers:: number of processes to use, by default one per CPU.  With
+        1, or when processes cannot be started on this platform, the work is
+        done in this process.
+
+    Each stack is sent to the worker processes, and each result sent back,
+    in the otio_binary format.
+    """
+
+    return _mapped(flatten_stack, stacks, (), max_workers)
+
+
+def filtered_compositions(
+    roots,
+    unary_filter_fn,
+    types_to_prune=None,
+    max_workers=None
+):
+    """Return a list of filtered_composition() of each of roots, in order.
+
+    roots:: iterable of compositions or timelines, for example a
+        SerializableCollection
+    unary_filter_fn:: as for filtered_composition().  It is called in the
+        worker processes, so it has to be picklable, which means a function
+        defined at the top level of a module, not a lambda or a closure.
+    types_to_prune:: as for filtered_composition()
+    max_workers:: as for flattened_stacks()
+    """
+
+    return _mapped(
+        filtered_composition,
+        roots,
+        (unary_filter_fn, types_to_prune),
+        max_workers
+    )
+
+
+def _mapped(fn, items, args, max_workers):
+    """Return [fn(item, *args) for item in items], computed in max_workers
+    processes when there is more than one item.
+    """
+
+    items = list(items)
+
+    if max_workers is None:
+        try:
+            max_workers = multiprocessing.cpu_count()
+        except NotImplementedError:
+            max_workers = 1
+    max_workers = min(max_workers, len(items))
+
+    pool = None
+    if max_workers > 1:
+        try:
+            pool = multiprocessing.Pool(max_workers)
+        except (ImportError, OSError):
+            # no working multiprocessing on this platform
+            pass
+
+    if pool is None:
+        return [fn(item, *args) for item in items]
+
+    try:
+        # items are packed as the workers ask for them, and results unpacked
+        # as they arrive, so that this process packs and unpacks while the
+        # workers compute
+        return [
+            _unpacked(result) for result in pool.imap(
+                _packed_call,
+                ((fn, _packed(item), args) for item in items)
+            )
+        ]
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def _packed_call(task):
+    """Run in the worker processes: unpack the item, call fn on it and pack
+    the result.
+    """
+
+    fn, packed_item, args = task
+
+    return _packed(fn(_unpacked(packed_item), *args))
+
+
+def _packed(value):
+    # otio_binary reads back tuples as lists
+    return (
+        isinstance(value, tuple),
+        otio_binary.write_to_string(value)
+    )
+
+
+def _unpacked(packed_value):
+    is_tuple, data = packed_value
+    result = otio_binary.read_from_string(data)
+    if is_tuple:
+        result = tuple(result)
+
+    return result
@@ -0,0 +1,479 @@
+#
+# Copyright 2017 Pixar Animation Studios
+#
+# Licensed under the Apache License, Version 2.0 (the "Apache License")
+# with the following modification; you may not use this file except in
+# compliance with the Apache License and the following modification to it:
+# Section 6. Trademarks. is deleted and replaced with:
+#
+# 6. Trademarks. This License does not grant permission to use the trade
+#    names, trademarks, service marks, or product names of the Licensor
+#    and its affiliates, except as required to comply with Section 4(c) of
+#    the License and to reproduce the content of the NOTICE file.
+#
+# You may obtain a copy of the Apache License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the Apache License with the above modification is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied. See the Apache License for the specific
+# language governing permissions and limitations under the Apache License.
+#
+
+__doc__ = """ Algorithms for finding what changed between two timelines. """
+
+import bisect
+import collections
+
+from .. import (
+    core,
+    schema,
+)
+from ..core import serializable_object
+
+
+class DiffEditKind(object):
+    """ enum for the kinds of DiffEdit """
+
+    # an item in after that is not in before
+    Insert = "insert"
+
+    # an item in before that is not in after
+    Delete = "delete"
+
+    # an item that is in a different place in after
+    Move = "move"
+
+    # an item with a different source_range
+    Trim = "trim"
+
+    # an item with different metadata
+    MetadataChange = "metadata_change"
+
+    # an item with other fields that differ, for example its name, media
+    # reference, effects or markers
+    Change = "change"
+
+
+class DiffEdit(
+    collections.namedtuple("DiffEdit", ("kind", "before", "after"))
+):
+    """One step of the edit script returned by diff().
+
+    kind is a DiffEditKind, before is the object in the old timeline and after
+    is the matching object in the new timeline.  before is None for an Insert
+    and after is None for a Delete.
+    """
+
+    __slots__ = ()
+
+
+def diff(before, after, hashes=None):
+    """Return the list of DiffEdits that turns before into after.
+
+    before and after are Timelines, or Compositions of the same kind.  Their
+    children are aligned recursively: first by the kind, name (and media url)
+    of each child, using a patience-style alignment that anchors on the
+    children that are unique in both lists, with a Myers diff of what is
+    left between the anchors.  Children left over with the same kind and name
+    as one elsewhere in the other list are reported as moved, and those in
+    the same place as one with the same name or media url (or for
+    Compositions, just the same kind) as changed in place.
+
+    Matched children whose content_hash() is the same are skipped without
+    looking inside them.  Each object is hashed once, into hashes, a memo as
+    taken by SerializableObject.content_hash(), or a new one if it is None.
+    Pass the memo of an earlier call to reuse the hashes of the objects that
+    were not edited since, for example of the previous revision when diffing
+    each revision of a timeline against the next.
+    """
+
+    edits = []
+    if hashes is None:
+        hashes = {}
+
+    if isinstance(before, schema.Timeline):
+        _diff_fields(before, after, edits, ("tracks",))
+        before = before.tracks
+        after = after.tracks
+
+    _diff_matched(before, after, edits, hashes)
+
+    return edits
+
+
+def _equivalent(lhs, rhs):
+    """Return True if lhs and rhs are equivalent field values, as compared
+    by SerializableObject.is_equivalent_to().
+    """
+
+    return serializable_object._first_difference(lhs, rhs) is None
+
+
+def _diff_fields(before, after, edits, ignored=("children",)):
+    """Add the edits for the fields that differ between the matched objects
+    before and after to edits.
+    """
+
+    trimmed = False
+    metadata_changed = False
+    changed = False
+
+    before_fields = before.data
+    after_fields = after.data
+    for name in set(before_fields).union(after_fields):
+        if name in ignored:
+            continue
+
+        if name in before_fields and name in after_fields:
+            if _equivalent(before_fields[name], after_fields[name]):
+                continue
+
+        if name == "source_range":
+            trimmed = True
+        elif name == "metadata":
+            metadata_changed = True
+        else:
+            changed = True
+
+    if trimmed:
+        edits.append(DiffEdit(DiffEditKind.Trim, before, after))
+    if metadata_changed:
+        edits.append(DiffEdit(DiffEditKind.MetadataChange, before, after))
+    if changed:
+        edits.append(DiffEdit(DiffEditKind.Change, before, after))
+
+
+def _diff_matched(before, after, edits, hashes):
+    """Add the edits that turn before into the matched object after to
+    edits.
+    """
+
+    if before.content_hash(hashes) == after.content_hash(hashes):
+        return
+
+    _diff_fields(before, after, edits)
+
+    if (
+        isinstance(before, core.Composition) and
+        isinstance(after, core.Composition)
+    ):
+        _diff_children(before, after, edits, hashes)
+
+
+def _identity_hint(child):
+    """The key that children are aligned by."""
+
+    media_reference = getattr(child, "media_reference", None)
+
+    return (
+        child.schema_name(),
+        getattr(child, "kind", None),
+        child.name,
+        getattr(media_reference, "target_url", None),
+    )
+
+
+def _diff_children(before, after, edits, hashes):
+    before_keys = [_identity_hint(child) for child in before]
+    after_keys = [_identity_hint(child) for child in after]
+
+    matches = _aligned_indices(before_keys, after_keys)
+    matched_before = [i for i, _ in matches]
+    matched_after = [j for _, j in matches]
+
+    unmatched_before = set(range(len(before))).difference(matched_before)
+    unmatched_after = sorted(set(range(len(after))).difference(matched_after))
+
+    # the children that were not aligned, but have the same key as a child
+    # on the other side, were moved
+    deleted_by_key = {}
+    for index in sorted(unmatched_before):
+        deleted_by_key.setdefault(before_keys[index], []).append(index)
+
+    moved_from = {}
+    for index in unmatched_after:
+        deleted = deleted_by_key.get(after_keys[index])
+        if deleted:
+            moved_from[index] = deleted.pop(0)
+            unmatched_before.remove(moved_from[index])
+
+    # the children that are left in the same gap between two aligned
+    # children on both sides, and share either their name or their media url,
+    # were changed in place.  So were Compositions of the same kind, which are
+    # often unnamed, and are better compared by their children.
+    by_name = {}
+    by_url = {}
+    compositions_by_kind = {}
+    for index in sorted(unmatched_before):
+        gap = bisect.bisect_left(matched_before, index)
+        schema_name, kind, name, url = before_keys[index]
+        by_name.setdefault((gap, schema_name, kind, name), []).append(index)
+        if url is not None:
+            by_url.setdefault((gap, schema_name, kind, url), []).append(index)
+        if isinstance(before[index], core.Composition):
+            compositions_by_kind.setdefault(
+                (gap, schema_name, kind),
+                []
+            ).append(index)
+
+    changed_from = {}
+    for index in unmatched_after:
+        if index in moved_from:
+            continue
+
+        gap = bisect.bisect_left(matched_after, index)
+        schema_name, kind, name, url = after_keys[index]
+        candidates = by_name.get((gap, schema_name, kind, name), [])
+        if url is not None:
+            candidates = candidates + by_url.get(
+                (gap, schema_name, kind, url),
+                []
+            )
+        if isinstance(after[index], core.Composition):
+            candidates = candidates + compositions_by_kind.get(
+                (gap, schema_name, kind),
+                []
+            )
+
+        for before_index in candidates:
+            if before_index in unmatched_before:
+                changed_from[index] = before_index
+                unmatched_before.remove(before_index)
+                break
+
+    for index in sorted(unmatched_before):
+        edits.append(DiffEdit(DiffEditKind.Delete, before[index], None))
+
+    before_index_of = dict((j, i) for i, j in matches)
+    for index, child in enumerate(after):
+        if index in before_index_of:
+            _diff_matched(
+                before[before_index_of[index]],
+                child,
+                edits,
+                hashes
+            )
+
+        elif index in changed_from:
+            _diff_matched(before[changed_from[index]], child, edits, hashes)
+
+        elif index in moved_from:
+            before_child = before[moved_from[index]]
+            edits.append(DiffEdit(DiffEditKind.Move, before_child, child))
+            _diff_matched(before_child, child, edits, hashes)
+
+        else:
+            edits.append(DiffEdit(DiffEditKind.Insert, None, child))
+
+
+def _aligned_indices(before_keys, after_keys):
+    """Return a list of (before_index, after_index) pairs of equal keys,
+    increasing in both indices, that aligns the two lists of keys.
+    """
+
+    matches = []
+    _align_range(
+        before_keys,
+        0,
+        len(before_keys),
+        after_keys,
+        0,
+        len(after_keys),
+        matches
+    )
+
+    return matches
+
+
+def _align_range(a, a_start, a_end, b, b_start, b_end, matches):
+    """Append the alignment of a[a_start:a_end] and b[b_start:b_end] to
+    matches.
+    """
+
+    # common prefix
+    while a_start < a_end and b_start < b_end and a[a_start] == b[b_start]:
+        matches.append((a_start, b_start))
+        a_start += 1
+        b_start += 1
+
+    # common suffix
+    suffix = []
+    while a_start < a_end and b_start < b_end and a[a_end - 1] == b[b_end - 1]:
+        a_end -= 1
+        b_end -= 1
+        suffix.append((a_end, b_end))
+
+    if a_start < a_end and b_start < b_end:
+        anchors = _unique_anchors(a, a_start, a_end, b, b_start, b_end)
+        if anchors:
+            for a_anchor, b_anchor in anchors:
+                _align_range(
+                    a,
+                    a_start,
+                    a_anchor,
+                    b,
+                    b_start,
+                    b_anchor,
+                    matches
+                )
+                matches.append((a_anchor, b_anchor))
+                a_start = a_anchor + 1
+                b_start = b_anchor + 1
+
+            _align_range(a, a_start, a_end, b, b_start, b_end, matches)
+        else:
+            matches.extend(
+                _myers_matches(a, a_start, a_end, b, b_start, b_end) or
+                _greedy_matches(a, a_start, a_end, b, b_start, b_end)
+            )
+
+    matches.extend(reversed(suffix))
+
+
+def _unique_anchors(a, a_start, a_end, b, b_start, b_end):
+    """Return the longest increasing list of (a_index, b_index) pairs of keys
+    that appear exactly once in both ranges.
+    """
+
+    before_counts = collections.Counter(a[a_start:a_end])
+    after_counts = collections.Counter(b[b_start:b_end])
+
+    unique_after_index = {}
+    for index in range(b_start, b_end):
+        key = b[index]
+        if after_counts[key] == 1 and before_counts.get(key) == 1:
+            unique_after_index[key] = index
+
+    # sorted by the a index
+    pairs = [
+        (index, unique_after_index[a[index]])
+        for index in range(a_start, a_end)
+        if a[index] in unique_after_index
+    ]
+
+    # longest increasing subsequence of the b indices (patience sorting)
+    tails = []
+    tail_indices = []
+    previous = []
+    for position, (_, b_index) in enumerate(pairs):
+        slot = bisect.bisect_left(tails, b_index)
+        if slot == len(tails):
+            tails.append(b_index)
+            tail_indices.append(position)
+        else:
+            tails[slot] = b_index
+            tail_indices[slot] = position
+        previous.append(tail_indices[slot - 1] if slot else None)
+
+    anchors = []
+    position = tail_indices[-1] if tail_indices else None
+    while position is not None:
+        anchors.append(pairs[position])
+        position = previous[position]
+    anchors.reverse()
+
+    return anchors
+
+
+# The Myers diff takes time quadratic in the number of differences, so past
+# this many, _greedy_matches() is used instead.
+_MAX_MYERS_DISTANCE = 1024
+
+
+def _myers_matches(a, a_start, a_end, b, b_start, b_end):
+    """Return the (a_index, b_index) pairs of a longest common subsequence of
+    a[a_start:a_end] and b[b_start:b_end], found with the Myers diff
+    algorithm, or None if they differ by more than _MAX_MYERS_DISTANCE.
+    """
+
+    n = a_end - a_start
+    m = b_end - b_start
+
+    if set(a[a_start:a_end]).isdisjoint(b[b_start:b_end]):
+        return []
+
+    # furthest x reached on each diagonal k = x - y, for each edit distance
+    furthest = {1: 0}
+    trace = []
+    for distance in range(n + m + 1):
+        if distance > _MAX_MYERS_DISTANCE:
+            return None
+
+        trace.append(dict(furthest))
+        done = False
+        for k in range(-distance, distance + 1, 2):
+            if k == -distance or (
+                k != distance and furthest[k - 1] < furthest[k + 1]
+            ):
+                x = furthest[k + 1]
+            else:
+                x = furthest[k - 1] + 1
+            y = x - k
+
+            while x < n and y < m and a[a_start + x] == b[b_start + y]:
+                x += 1
+                y += 1
+
+            furthest[k] = x
+            if x >= n and y >= m:
+                done = True
+                break
+
+        if done:
+            break
+
+    # walk back through the trace, collecting the diagonal moves
+    matches = []
+    x = n
+    y = m
+    for distance in range(len(trace) - 1, -1, -1):
+        furthest = trace[distance]
+        k = x - y
+        if k == -distance or (
+            k != distance and furthest[k - 1] < furthest[k + 1]
+        ):
+            previous_k = k + 1
+        else:
+            previous_k = k - 1
+        previous_x = furthest[previous_k]
+        previous_y = previous_x - previous_k
+
+        while x > previous_x and y > previous_y:
+            x -= 1
+            y -= 1
+            matches.append((a_start + x, b_start + y))
+
+        x = previous_x
+        y = previous_y
+
+    matches.reverse()
+
+    return matches
+
+
+def _greedy_matches(a, a_start, a_end, b, b_start, b_end):
+    """Return increasing (a_index, b_index) pairs of equal keys, matching
+    each key in a[a_start:a_end] with its next occurrence in
+    b[b_start:b_end].  Not the longest such list, but found in O(n log n).
+    """
+
+    b_indices = {}
+    for index in range(b_start, b_end):
+        b_indices.setdefault(b[index], []).append(index)
+
+    matches = []
+    next_b = b_start
+    for index in range(a_start, a_end):
+        indices = b_indices.get(a[index])
+        if not indices:
+            continue
+
+        position = bisect.bisect_left(indices, next_b)
+        if position < len(indices):
+            matches.append((index, indices[position]))
+            next_b = indices[position] + 1
+
+    return matches
@@ -25,14 +25,9 @@
 
 """Algorithms for filtering OTIO files.  """
 
-import copy
 import opentimelineio as otio
 
 
-def _is_in(thing, container):
-    return any(thing is item for item in container)
-
-
 def _isinstance_in(child, typelist):
     return any(isinstance(child, t) for t in typelist)
 
@@ -46,7 +41,7 @@ def filtered_composition(
 
     types_to_prune:: tuple of types, example: (otio.schema.Gap,...)
 
-    1. Make a deep copy of root
+    1. Make a copy of root
     2. Starting with root, perform a depth first traversal
     3. For each item (including root):
         a. if types_to_prune is not None and item is an instance of a type
@@ -56,7 +51,11 @@ def filtered_composition(
             II.  returns a tuple: insert it into the list, replacing original
             III. returns None: prune it
     4. If an item is pruned, do not traverse its children
-    5. Return the new deep copy.
+    5. Return the new copy.
+
+    The copy is built as the traversal goes, so the children of an item are
+    only copied if the item survives, and the children an item has after
+    unary_filter_fn returns are the ones that get traversed.
 
     EXAMPLE 1 (filter):
         If your unary function is:
@@ -96,57 +95,7 @@ def filtered_composition(
                 track, lambda _:_, types_to_prune=(otio.schema.Gap,)) => [A]
     """
 
-    # deep copy everything
-    mutable_object = copy.deepcopy(root)
-
-    prune_list = set()
-
-    header_list = [mutable_object]
-
-    if isinstance(mutable_object, otio.schema.Timeline):
-        header_list.append(mutable_object.tracks)
-
-    iter_list = header_list + list(mutable_object.each_child())
-
-    for child in iter_list:
-        if _safe_parent(child) is not None and _is_in(child.parent(), prune_list):
-            prune_list.add(child)
-            continue
-
-        parent = None
-        child_index = None
-        if _safe_parent(child) is not None:
-            child_index = child.parent().index(child)
-            parent = child.parent()
-            del child.parent()[child_index]
-
-        # first try to prune
-        if (types_to_prune and _isinstance_in(child, types_to_prune)):
-            result = None
-        # finally call the user function
-        else:
-            result = unary_filter_fn(child)
-
-        if child is mutable_object:
-            mutable_object = result
-
-        if result is None:
-            prune_list.add(child)
-            continue
-
-        if type(result) is not tuple:
-            result = [result]
-
-        if parent is not None:
-            parent[child_index:child_index] = result
-
-    return mutable_object
-
-
-def _safe_parent(child):
-    if hasattr(child, 'parent'):
-        return child.parent()
-    return None
+    return _filtered(root, [_unary_stage(unary_filter_fn, types_to_prune)])
 
 
 def filtered_with_sequence_context(
@@ -159,7 +108,7 @@ def filtered_with_sequence_context(
     reduce_fn::function(previous_item, current, next_item) (see below)
     types_to_prune:: tuple of types, example: (otio.schema.Gap,...)
 
-    1. Make a deep copy of root
+    1. Make a copy of root
     2. Starting with root, perform a depth first traversal
     3. For each item (including root):
         a. if types_to_prune is not None and item is an instance of a type
@@ -170,9 +119,9 @@ def filtered_with_sequence_context(
             III. returns None: prune it
 
             ** note that reduce_fn is always passed objects from the original
-                deep copy, not what prior calls return.  See below for examples
+                copy, not what prior calls return.  See below for examples
     4. If an item is pruned, do not traverse its children
-    5. Return the new deep copy.
+    5. Return the new copy.
 
     EXAMPLE 1 (filter):
         >>> track = [A,B,C]
@@ -216,57 +165,207 @@ def filtered_with_sequence_context(
             fn(B, C, D) => C # !! note that it was passed B instead of D.
     """
 
-    # deep copy everything
-    mutable_object = copy.deepcopy(root)
+    return _filtered(root, [(reduce_fn, types_to_prune)])
 
-    prune_list = set()
 
-    header_list = [mutable_object]
+class FilterPipeline(object):
+    """A list of filters to apply to a copy of root (and children) one after
+    the other, in a single traversal.
 
-    if isinstance(mutable_object, otio.schema.Timeline):
-        header_list.append(mutable_object.tracks)
+    Filtering with a pipeline gives the same result as chaining calls to
+    filtered_composition() and filtered_with_sequence_context(), with the
+    filters in the order they were added, but root is only copied and
+    traversed once instead of once per filter.  Each item goes through all
+    the filters before its children are traversed:
 
-    iter_list = header_list + list(mutable_object.each_child())
+    1. Make a copy of root
+    2. Starting with root, perform a depth first traversal
+    3. For each item (including root), pass it to the first filter.  Pass
+        each item that filter returns (an object, or each item of a tuple)
+        to the next filter, and so on.  Items pruned by a filter are not
+        passed to the following ones.
+    4. The children of an item are filtered with the filters the item was
+        passed to.  Items a filter creates are only passed to the filters
+        after it, and so are their children.
+    5. Return the new copy.  If the filters expand root into more than one
+        item, a tuple of them is returned.
+
+    As with the sequence context of filtered_with_sequence_context(), each
+    filter is passed the neighbors an item has among what the previous
+    filter returned, not what prior calls to the same filter return.
+
+    Since the filters are interleaved rather than run one after the other, a
+    filter that looks at the parent or children of the item it is passed
+    sees them as they are at that point of the traversal, which may not be
+    the same as with chained calls.
+
+    EXAMPLE:
+        >>> pipeline = FilterPipeline()
+        >>> pipeline.add_filter(fn, types_to_prune=(otio.schema.Gap,))
+        >>> pipeline.add_filter_with_sequence_context(reduce_fn)
+        >>> pipeline.filtered(timeline)
+
+        returns the same as:
+
+        >>> filtered_with_sequence_context(
+        ...     filtered_composition(
+        ...         timeline,
+        ...         fn,
+        ...         types_to_prune=(otio.schema.Gap,)
+        ...     ),
+        ...     reduce_fn
+        ... )
+    """
 
-    # expand to include prev, next when appropriate
-    expanded_iter_list = []
-    for child in iter_list:
-        if _safe_parent(child) and isinstance(child.parent(), otio.schema.Track):
-            prev_item, next_item = child.parent().neighbors_of(child)
-            expanded_iter_list.append((prev_item, child, next_item))
-        else:
-            expanded_iter_list.append((None, child, None))
+    def __init__(self):
+        self._stages = []
+
+    def add_filter(self, unary_filter_fn, types_to_prune=None):
+        """Add a filter like the unary_filter_fn of filtered_composition()."""
+
+        self._stages.append(_unary_stage(unary_filter_fn, types_to_prune))
+
+    def add_filter_with_sequence_context(self, reduce_fn, types_to_prune=None):
+        """Add a filter like the reduce_fn of
+        filtered_with_sequence_context().
+        """
 
-    for prev_item, child, next_item in expanded_iter_list:
-        if _safe_parent(child) is not None and _is_in(child.parent(), prune_list):
-            prune_list.add(child)
-            continue
+        self._stages.append((reduce_fn, types_to_prune))
 
-        parent = None
-        child_index = None
-        if _safe_parent(child) is not None:
-            child_index = child.parent().index(child)
-            parent = child.parent()
-            del child.parent()[child_index]
+    def filtered(self, root):
+        """Filter a copy of root (and children) with each of the filters."""
+
+        return _filtered(root, self._stages)
+
+
+def _unary_stage(unary_filter_fn, types_to_prune):
+    return (lambda _, child, __: unary_filter_fn(child), types_to_prune)
+
+
+def _filtered(root, stages):
+    """Filter a copy of root with stages, a list of (reduce_fn,
+    types_to_prune) tuples, see FilterPipeline.
+
+    root is copied with copy_on_write(), so each Composition in the copy only
+    copies its children once they are traversed.  Nothing below a pruned
+    item is ever copied.
+
+    With a single stage, what its filter returns for root is returned as it
+    is, a tuple of any length included.
+    """
+
+    mutable_object = root.copy_on_write()
+
+    root_results = []
+    results = _filtered_items([mutable_object], stages, False, root_results)
+
+    if len(stages) == 1:
+        return root_results[0]
+    if not results:
+        return None
+    if len(results) == 1:
+        return results[0]
+
+    return tuple(results)
+
+
+def _filtered_items(items, stages, in_track, last_results=None):
+    """Return the list of what filtering items, siblings in a Track if
+    in_track is set, through each of stages results in.  The children of
+    the items are filtered along the way.
+
+    If last_results is a list, what the filter of the last stage returns
+    for each item is appended to it.
+    """
+
+    # each stage is a generator of (item, stages the item was passed to)
+    # reading from the one before it, so the items go through all of the
+    # stages one at a time
+    stream = ((item, []) for item in items)
+    for index, stage in enumerate(stages):
+        stream = _filtered_stage(
+            stream,
+            stage,
+            in_track,
+            last_results if index == len(stages) - 1 else None
+        )
+
+    results = []
+    for item, item_stages in stream:
+        _filter_descendants(item, item_stages)
+        results.append(item)
+
+    return results
+
+
+def _filtered_stage(stream, stage, in_track, results=None):
+    reduce_fn, types_to_prune = stage
+
+    prev_item = None
+    item, item_stages = next(stream, (None, None))
+    while item is not None:
+        next_item, next_stages = next(stream, (None, None))
 
         # first try to prune
-        if types_to_prune and _isinstance_in(child, types_to_prune):
+        if types_to_prune and _isinstance_in(item, types_to_prune):
             result = None
         # finally call the user function
+        elif in_track:
+            result = reduce_fn(prev_item, item, next_item)
         else:
-            result = reduce_fn(prev_item, child, next_item)
+            result = reduce_fn(None, item, None)
 
-        if child is mutable_object:
-            mutable_object = result
+        if results is not None:
+            results.append(result)
 
         if result is None:
-            prune_list.add(child)
-            continue
+            # the tracks of a pruned Timeline are still filtered
+            if isinstance(item, otio.schema.Timeline):
+                item_stages = item_stages + [stage]
+            _filter_descendants(item, item_stages)
+        else:
+            if type(result) is not tuple:
+                result = [result]
+
+            item_stages = item_stages + [stage]
+            if not any(r is item for r in result):
+                # the descendants of item are filtered even if result
+                # replaces it
+                _filter_descendants(item, item_stages)
 
-        if type(result) is not tuple:
-            result = [result]
+            for r in result:
+                yield r, (item_stages if r is item else [])
 
-        if parent is not None:
-            parent[child_index:child_index] = result
+        prev_item = item
+        item, item_stages = next_item, next_stages
+
+
+def _filter_descendants(item, stages):
+    """Filter the children of item, which is part of the copy being
+    filtered, with the stages item was passed to.
+    """
 
-    return mutable_object
+    if not stages:
+        return
+
+    if isinstance(item, otio.schema.Timeline):
+        # the tracks of a Timeline are filtered, but cannot be replaced
+        tracks = item.tracks
+        stages = [
+            (reduce_fn, types_to_prune)
+            for reduce_fn, types_to_prune in stages
+            if not (types_to_prune and _isinstance_in(tracks, types_to_prune))
+            and reduce_fn(None, tracks, None) is not None
+        ]
+        _filter_descendants(tracks, stages)
+    elif isinstance(item, otio.core.Composition):
+        children = list(item)
+        del item[:]
+
+        item.extend(
+            _filtered_items(
+                children,
+                stages,
+                isinstance(item, otio.schema.Track)
+            )
+        )
@@ -27,7 +27,9 @@ __doc__ = """ Algorithms for stack objects. """
 import copy
 
 from .. import (
+    opentime,
     schema,
+    exceptions,
 )
 from . import (
     track_algo
@@ -37,50 +39,73 @@ from . import (
 def flatten_stack(in_stack):
     """Flatten a Stack, or a list of Tracks, into a single Track.
     Note that the 1st Track is the bottom one, and the last is the top.
+
+    The top Track is swept once in time order.  Each range hidden by a Gap
+    is resolved against the Track below by bisecting its child ranges, so
+    no Track is ever copied; only the items, or the trimmed fragments of
+    items, that end up in the result are.
     """
 
     flat_track = schema.Track()
     flat_track.name = "Flattened"
 
-    # map of track to track.range_of_all_children
+    # map of track index to track.range_of_all_children
     range_track_map = {}
 
-    def _get_next_item(
-            in_stack,
-            track_index=None,
-            trim_range=None
-    ):
-        if track_index is None:
-            # start with the top-most track
-            track_index = len(in_stack) - 1
+    def _get_next_item(track_index, trim_range=None):
+        """Yield (item, source_range) for the visible parts of the tracks at
+        or below track_index, within trim_range.  source_range is None when
+        the whole item is visible.
+        """
+
         if track_index < 0:
             # if you get to the bottom, you're done
             return
 
         track = in_stack[track_index]
-        if trim_range is not None:
-            track = track_algo.track_trimmed_to_range(track, trim_range)
 
-        track_map = range_track_map.get(track)
+        track_map = range_track_map.get(track_index)
         if track_map is None:
             track_map = track.range_of_all_children()
-            range_track_map[track] = track_map
+            range_track_map[track_index] = track_map
+
+        if trim_range is None:
+            children = track
+        else:
+            children = track.children_in_range(trim_range)
+
+        for item in children:
+            item_range = track_map[item]
+            source_range = None
+            if trim_range is not None and not trim_range.contains(item_range):
+                if isinstance(item, schema.Transition):
+                    raise exceptions.CannotTrimTransitionsError(
+                        "Cannot trim in the middle of a Transition."
+                    )
+                source_range = track_algo._trimmed_source_range(
+                    item,
+                    item_range,
+                    trim_range
+                )
+                item_range = opentime.TimeRange(
+                    max(item_range.start_time, trim_range.start_time),
+                    source_range.duration
+                )
 
-        for item in track:
             if (
                     item.visible()
                     or track_index == 0
                     or isinstance(item, schema.Transition)
             ):
-                yield item
+                yield item, source_range
             else:
-                trim = track_map[item]
-                if trim_range is not None:
-                    trim.start_time += trim_range.start_time
-                for more in _get_next_item(in_stack, track_index - 1, trim):
+                for more in _get_next_item(track_index - 1, item_range):
                     yield more
 
-    for item in _get_next_item(in_stack):
-        flat_track.append(copy.deepcopy(item))
+    for item, source_range in _get_next_item(len(in_stack) - 1):
+        item = copy.deepcopy(item)
+        if source_range is not None:
+            item.source_range = source_range
+        flat_track.append(item)
 
     return flat_track
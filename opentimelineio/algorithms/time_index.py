@@ -0,0 +1,426 @@
+#
+# Copyright 2017 Pixar Animation Studios
+#
+# Licensed under the Apache License, Version 2.0 (the "Apache License")
+# with the following modification; you may not use this file except in
+# compliance with the Apache License and the following modification to it:
+# Section 6. Trademarks. is deleted and replaced with:
+#
+# 6. Trademarks. This License does not grant permission to use the trade
+#    names, trademarks, service marks, or product names of the Licensor
+#    and its affiliates, except as required to comply with Section 4(c) of
+#    the License and to reproduce the content of the NOTICE file.
+#
+# You may obtain a copy of the Apache License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the Apache License with the above modification is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied. See the Apache License for the specific
+# language governing permissions and limitations under the Apache License.
+#
+
+__doc__ = """ Index of the items in a timeline by the time they occupy. """
+
+import bisect
+import copy
+
+from .. import (
+    core,
+    exceptions,
+    opentime,
+    schema,
+)
+from ..schema.track import _comparable_float
+
+
+def _visible_part(range_in_root, window):
+    """Return the part of range_in_root inside window, or None if it is
+    entirely outside.
+    """
+
+    start_time = max(range_in_root.start_time, window.start_time)
+    end_time = min(
+        range_in_root.end_time_exclusive(),
+        window.end_time_exclusive()
+    )
+
+    if end_time < start_time:
+        return None
+    if end_time == start_time and range_in_root.duration.value != 0:
+        # touching the edge of the window is not being inside it
+        return None
+
+    return opentime.range_from_start_end_time(start_time, end_time)
+
+
+class TimeIndex(object):
+    """Index of the items below a Timeline, Stack or Track by the range they
+    occupy in its time.
+
+    The range of every item is transformed into the coordinate system of the
+    root once, when the index is built, and trimmed to the part of it that
+    is visible through the source_range of its parents.  Queries are then
+    answered from an interval tree over those ranges, rather than by walking
+    and transforming every item in the timeline:
+
+        >>> index = otio.algorithms.TimeIndex(timeline)
+        >>> index.items_in_range(shot_range)
+        >>> index.items_at_time(otio.opentime.RationalTime(86400, 24))
+        >>> index.nearest_item(otio.opentime.RationalTime(86400, 24))
+
+    Results are returned in the order each_child() would yield them.  For a
+    Timeline, times are in the coordinate system of its tracks, as for
+    Timeline.range_of_child().
+
+    The index does not watch the timeline for changes.  After editing it,
+    call update() with the composition whose children changed, or with the
+    item whose range changed, to re-index only the items that may have moved.
+    """
+
+    def __init__(self, root, descended_from_type=core.Item):
+        """Index every item below root that is an instance of
+        descended_from_type.
+        """
+
+        if isinstance(root, schema.Timeline):
+            root = root.tracks
+
+        self._root = root
+        self._descended_from_type = descended_from_type
+
+        # map of indexed item to (path, range in root), where path is the
+        # tuple of child indices leading from the root to the item, so that
+        # sorting by path gives the order of each_child()
+        self._entries = {}
+
+        # map of composition to the list of children last indexed below it
+        self._children_of = {}
+
+        # interval tree over self._entries, built on demand by _tree()
+        self._tree_cache = None
+
+        self._rebuild()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, item):
+        return item in self._entries
+
+    def range_of(self, item):
+        """Return the range that item occupies in the time of the root."""
+
+        try:
+            return copy.copy(self._entries[item][1])
+        except KeyError:
+            raise exceptions.NotAChildError(
+                "{} is not in this index.".format(item)
+            )
+
+    def items_in_range(self, search_range):
+        """Return the items whose range overlaps search_range."""
+
+        return self._overlapping(
+            _comparable_float(search_range.start_time),
+            _comparable_float(search_range.end_time_exclusive()),
+            False
+        )
+
+    def items_at_time(self, t):
+        """Return the items whose range contains time t."""
+
+        t_float = _comparable_float(t)
+
+        return self._overlapping(t_float, t_float, True)
+
+    def nearest_item(self, t):
+        """Return the item whose range is nearest to time t, or None if the
+        index is empty.
+
+        An item that contains t is always the nearest.  Otherwise the distance
+        is measured from t to the end of items before it and to the start of
+        items after it, preferring the item before t on a tie.
+        """
+
+        items = self.items_at_time(t)
+        if items:
+            return items[0]
+
+        tree = self._tree()
+        if not tree.entries:
+            return None
+
+        t_float = _comparable_float(t)
+
+        after = None
+        index = bisect.bisect_right(tree.starts, t_float)
+        if index < len(tree.starts):
+            # entries are sorted by path after start, so the first entry with
+            # this start is the first in each_child() order
+            after = tree.entries[index]
+
+        before = None
+        index = bisect.bisect_right(tree.sorted_ends, t_float) - 1
+        if index >= 0:
+            index = bisect.bisect_left(
+                tree.sorted_ends,
+                tree.sorted_ends[index]
+            )
+            before = tree.entries_by_end[index]
+
+        if after is None:
+            return before[3]
+        if before is None:
+            return after[3]
+
+        if t_float - before[1] <= after[0] - t_float:
+            return before[3]
+
+        return after[3]
+
+    def update(self, item=None):
+        """Re-index after item was edited.
+
+        item is either a composition whose children were inserted, removed
+        or replaced, or an item whose range changed.  Only item, the items
+        below it and the items that it may have moved (the ones following it
+        in each Track above it) are re-indexed.  With no item, or the root,
+        the whole index is rebuilt.
+        """
+
+        self._tree_cache = None
+
+        if item is None or item is self._root:
+            self._rebuild()
+            return
+
+        if not self._root.is_parent_of(item):
+            raise exceptions.NotAChildError(
+                "{} is not a child of {}.".format(item, self._root)
+            )
+
+        ancestors = [item]
+        while ancestors[-1].parent() is not self._root:
+            ancestors.append(ancestors[-1].parent())
+        ancestors.reverse()
+
+        parent = self._root
+        offset = opentime.RationalTime()
+        window = self._root.trimmed_range()
+        path = ()
+
+        for child in ancestors:
+            index = parent.index(child)
+
+            # children of a Stack all start at the same time, but in any
+            # other composition the following children may have moved
+            stop = None
+            if isinstance(parent, schema.Stack):
+                stop = index + 1
+
+            if child is item:
+                self._index_children(parent, offset, window, path, index, stop)
+                return
+
+            if stop is None:
+                self._index_children(parent, offset, window, path, index + 1)
+
+            offset, window, path = self._index_child(
+                parent,
+                index,
+                offset,
+                window,
+                path,
+                recurse=False
+            )
+            if window is None:
+                return
+
+            parent = child
+
+    def _rebuild(self):
+        self._entries = {}
+        self._children_of = {}
+        self._tree_cache = None
+
+        self._index_children(
+            self._root,
+            opentime.RationalTime(),
+            self._root.trimmed_range(),
+            ()
+        )
+
+    def _drop(self, item):
+        """Remove item and everything indexed below it."""
+
+        self._entries.pop(item, None)
+        for child in self._children_of.pop(item, ()):
+            self._drop(child)
+
+    def _index_children(
+        self,
+        composition,
+        offset,
+        window,
+        path,
+        start=0,
+        stop=None
+    ):
+        """(Re-)index composition[start:stop] and everything below them.
+
+        offset converts times in composition to the time of the root, path is
+        the path to composition and window is the part of the root's time
+        that composition is visible in.
+        """
+
+        if stop is None:
+            stop = len(composition)
+
+        children = self._children_of.setdefault(composition, [])
+        for child in children[start:stop]:
+            self._drop(child)
+        children[start:stop] = [
+            composition[index] for index in range(start, stop)
+        ]
+
+        for index in range(start, stop):
+            self._index_child(composition, index, offset, window, path)
+
+    def _index_child(
+        self,
+        composition,
+        index,
+        offset,
+        window,
+        path,
+        recurse=True
+    ):
+        """Index composition[index], and if recurse is set, the items below
+        it.  Returns the (offset, window, path) for the children of
+        composition[index], where window is None if it is not visible.
+        """
+
+        child = composition[index]
+        child_path = path + (index,)
+
+        child_range = composition.range_of_child_at_index(index)
+        range_in_root = opentime.TimeRange(
+            child_range.start_time + offset,
+            child_range.duration
+        )
+        visible_range = _visible_part(range_in_root, window)
+
+        if recurse:
+            self._drop(child)
+        else:
+            self._entries.pop(child, None)
+
+        if visible_range is None:
+            self._drop(child)
+            return None, None, child_path
+
+        if isinstance(child, self._descended_from_type):
+            self._entries[child] = (child_path, visible_range)
+
+        if not isinstance(child, core.Composition):
+            return None, visible_range, child_path
+
+        child_offset = (
+            range_in_root.start_time - child.trimmed_range().start_time
+        )
+        if recurse:
+            self._index_children(child, child_offset, visible_range, child_path)
+
+        return child_offset, visible_range, child_path
+
+    def _tree(self):
+        """Return the interval tree over the indexed ranges, building it if
+        the index changed since it was last built.
+        """
+
+        if self._tree_cache is None:
+            self._tree_cache = _IntervalTree(
+                (
+                    _comparable_float(item_range.start_time),
+                    _comparable_float(item_range.end_time_exclusive()),
+                    path,
+                    item
+                )
+                for item, (path, item_range) in self._entries.items()
+            )
+
+        return self._tree_cache
+
+    def _overlapping(self, start, end, closed):
+        """Return the items with a range that ends after start and starts
+        before end (or at end, if closed is set), in each_child() order.
+        """
+
+        tree = self._tree()
+        starts = tree.starts
+        ends = tree.ends
+        max_ends = tree.max_ends
+
+        found = []
+        pending = [(0, len(starts))]
+        while pending:
+            first, last = pending.pop()
+            if first >= last:
+                continue
+
+            mid = (first + last) // 2
+            if max_ends[mid] <= start:
+                # nothing in this subtree ends after start
+                continue
+
+            pending.append((first, mid))
+
+            if starts[mid] < end or (closed and starts[mid] == end):
+                if ends[mid] > start:
+                    found.append(tree.entries[mid])
+                pending.append((mid + 1, last))
+
+        found.sort(key=lambda entry: entry[2])
+
+        return [entry[3] for entry in found]
+
+
+class _IntervalTree(object):
+    """Entries of (start, end, path, item), sorted by start, with an
+    implicit balanced binary tree over them: the root of entries[first:last]
+    is entries[(first + last) // 2], and max_ends holds the latest end in the
+    subtree rooted at each entry.
+    """
+
+    def __init__(self, entries):
+        self.entries = sorted(
+            entries,
+            key=lambda entry: (entry[0], entry[2])
+        )
+        self.starts = [entry[0] for entry in self.entries]
+        self.ends = [entry[1] for entry in self.entries]
+
+        self.max_ends = list(self.ends)
+        self._fill_max_ends(0, len(self.entries))
+
+        self.entries_by_end = sorted(
+            self.entries,
+            key=lambda entry: (entry[1], entry[2])
+        )
+        self.sorted_ends = [entry[1] for entry in self.entries_by_end]
+
+    def _fill_max_ends(self, first, last):
+        if first >= last:
+            return float("-inf")
+
+        mid = (first + last) // 2
+        self.max_ends[mid] = max(
+            self.ends[mid],
+            self._fill_max_ends(first, mid),
+            self._fill_max_ends(mid + 1, last)
+        )
+
+        return self.max_ends[mid]
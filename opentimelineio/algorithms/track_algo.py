@@ -38,46 +38,71 @@ def track_trimmed_to_range(in_track, trim_range):
     trim_range. Note that the track is never expanded, only shortened.
     Please note that you could do nearly the same thing non-destructively by
     just setting the Track's source_range but sometimes you want to really cut
-    away the stuff outside and that's what this function is meant for."""
-    new_track = copy.deepcopy(in_track)
-
-    track_map = new_track.range_of_all_children()
-
-    # iterate backwards so we can delete items
-    for c, child in reversed(list(enumerate(new_track))):
-        child_range = track_map[child]
-        if not trim_range.overlaps(child_range):
-            # completely outside the trim range, so we discard it
-            del new_track[c]
-        elif trim_range.contains(child_range):
-            # completely contained, keep the whole thing
-            pass
-        else:
+    away the stuff outside and that's what this function is meant for.
+
+    Only the items overlapping the trim_range are copied, and they are found
+    by bisecting the cached child ranges of in_track, so the cost depends on
+    the size of the trim_range rather than on the length of in_track."""
+
+    new_track = _copy_without_children(in_track)
+
+    for child in in_track.children_in_range(trim_range):
+        child_range = in_track.range_of_child_at_index(in_track.index(child))
+        new_child = copy.deepcopy(child)
+
+        if not trim_range.contains(child_range):
             if isinstance(child, schema.Transition):
                 raise exceptions.CannotTrimTransitionsError(
                     "Cannot trim in the middle of a Transition."
                 )
 
-            # we need to clip the end(s)
-            child_source_range = child.trimmed_range()
+            # set the new child's trims
+            new_child.source_range = _trimmed_source_range(
+                child,
+                child_range,
+                trim_range
+            )
 
-            # should we trim the start?
-            if trim_range.start_time > child_range.start_time:
-                trim_amount = trim_range.start_time - child_range.start_time
-                child_source_range.start_time += trim_amount
-                child_source_range.duration -= trim_amount
+        new_track.append(new_child)
 
-            # should we trim the end?
-            trim_end = trim_range.end_time_exclusive()
-            child_end = child_range.end_time_exclusive()
-            if trim_end < child_end:
-                trim_amount = child_end - trim_end
-                child_source_range.duration -= trim_amount
+    return new_track
 
-            # set the new child's trims
-            child.source_range = child_source_range
 
-    return new_track
+def _copy_without_children(composition):
+    """Return a deep copy of composition that has no children."""
+
+    result = type(composition)()
+    result.data = copy.deepcopy(
+        dict(
+            (key, value) for key, value in composition.data.items()
+            if key != "children"
+        )
+    )
+    result.data["children"] = []
+
+    return result
+
+
+def _trimmed_source_range(child, child_range, trim_range):
+    """Return the source_range child needs to keep only the part of it, at
+    child_range in its track, that falls inside trim_range."""
+
+    child_source_range = child.trimmed_range()
+
+    # should we trim the start?
+    if trim_range.start_time > child_range.start_time:
+        trim_amount = trim_range.start_time - child_range.start_time
+        child_source_range.start_time += trim_amount
+        child_source_range.duration -= trim_amount
+
+    # should we trim the end?
+    trim_end = trim_range.end_time_exclusive()
+    child_end = child_range.end_time_exclusive()
+    if trim_end < child_end:
+        trim_amount = child_end - trim_end
+        child_source_range.duration -= trim_amount
+
+    return child_source_range
 
 
 def track_with_expanded_transitions(in_track):
@@ -51,12 +51,17 @@ from .type_registry import (
     schema_name_from_label,
     schema_version_from_label,
     instance_from_schema,
+    instance_from_schema_label,
+    class_from_schema_label,
 )
 from .json_serializer import (
     serialize_json_to_string,
     serialize_json_to_file,
+    serialize_json_to_stream,
     deserialize_json_from_string,
     deserialize_json_from_file,
+    deserialize_json_items_from_stream,
+    deserialize_json_items_from_file,
 )
 from .media_reference import (
     MediaReference,
@@ -94,6 +94,33 @@ class Composable(serializable_object.SerializableObject):
     def _set_parent(self, new_parent):
         self._parent = new_parent
 
+    def _invalidate_parent_ranges(self):
+        """Notify the parent that the range of this Composable changed, so
+        that any child ranges it has cached are recomputed.
+        """
+
+        if self._parent is not None:
+            self._parent._invalidate_cached_ranges()
+
+    def _detach_shared_copies(self):
+        """Make the copy_on_write() copies that share self (copies of self or
+        of any of its ancestors, whose children have not been copied yet) copy
+        their children, before self is written to.
+
+        Ancestors are handled from the top down, since copying the children
+        of one makes new copies that share the children of the next.
+        """
+
+        for ancestor in reversed([self] + self._ancestors()):
+            ancestor._unshare_children()
+
+    def _unshare_children(self):
+        """Make the copies sharing the children of self copy them.  Only
+        Compositions have children to share.
+        """
+
+        pass
+
     def is_parent_of(self, other):
         """Returns true if self is a parent or ancestor of other."""
 
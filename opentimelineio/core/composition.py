@@ -25,6 +25,8 @@
 """Composition base class.  An object that contains `Items`."""
 
 import collections
+import copy
+import weakref
 
 from . import (
     serializable_object,
@@ -52,6 +54,20 @@ class Composition(item.Item, collections.MutableSequence):
     _modname = "core"
     _composable_base_class = composable.Composable
 
+    # A copy_on_write() copy shares the list of children of the Composition
+    # it was copied from, its _children_source, until the children are first
+    # accessed.  The source keeps weak references to the copies sharing its
+    # children in _sharing_copies, so that they can copy the children before
+    # they are written to.
+    _children_source = None
+    _sharing_copies = None
+
+    # A Composition loaded lazily (see core.deserialize_json_from_string())
+    # keeps the undecoded JSON of its children in its "children" field until
+    # they are first accessed, and the function that decodes each of them in
+    # _children_decoder.
+    _children_decoder = None
+
     def __init__(
         self,
         name=None,
@@ -71,9 +87,18 @@ class Composition(item.Item, collections.MutableSequence):
         )
         collections.MutableSequence.__init__(self)
 
-        # Because we know that all children are unique, we store a set
-        # of all the children as well to speed up __contain__ checks.
-        self._child_lookup = set()
+        # Because we know that all children are unique, we store a map of
+        # each child to its index as well to speed up __contains__ checks and
+        # index() lookups.  Inserting or deleting a child shifts the ones
+        # after it, so rather than renumbering them right away, the first
+        # index that may be out of date is recorded and the rest of the map is
+        # renumbered the next time an index at or past it is looked up.
+        self._child_lookup = {}
+        self._stale_child_index = None
+
+        # available_range() is cached until the children change, see
+        # _invalidate_cached_ranges()
+        self._available_range_cache = None
 
         self._children = []
         if children:
@@ -82,12 +107,33 @@ class Composition(item.Item, collections.MutableSequence):
             # internal membership set _child_lookup.
             self.extend(children)
 
-    _children = serializable_object.serializable_field(
+    _children_data = serializable_object.serializable_field(
         "children",
         list,
         "Items contained by this composition."
     )
 
+    @property
+    def _children(self):
+        """Items contained by this composition."""
+
+        if (
+            self._children_source is not None or
+            self._children_decoder is not None
+        ):
+            self._materialize_children()
+
+        return self._children_data
+
+    @_children.setter
+    def _children(self, val):
+        # replacing the children of a copy means it no longer shares them
+        if self._children_source is not None:
+            self._children_source = None
+            serializable_object._SHARING_COPIES.discard(self)
+        self._children_decoder = None
+        self._children_data = val
+
     @property
     def composition_kind(self):
         """Returns a label specifying the kind of composition."""
@@ -123,12 +169,12 @@ class Composition(item.Item, collections.MutableSequence):
     transform = serializable_object.deprecated_field()
 
     def each_child(self, search_range=None, descended_from_type=composable.Composable):
-        for i, child in enumerate(self._children):
+        children = self._children
+        if search_range:
             # filter out children who are not in the search range
-            if search_range and not self.range_of_child_at_index(i).overlaps(
-                    search_range):
-                continue
+            children = self.children_in_range(search_range)
 
+        for child in children:
             # filter out children who are not descended from the specified type
             is_descendant = descended_from_type == composable.Composable
             if is_descendant or isinstance(child, descended_from_type):
@@ -159,6 +205,43 @@ class Composition(item.Item, collections.MutableSequence):
 
         raise NotImplementedError
 
+    def available_range(self):
+        """The range of the children of this composition.
+
+        Computed by _computed_available_range() and cached until the children
+        change, so that asking for the duration of an unchanged timeline does
+        not walk the whole tree.
+        """
+
+        if self._available_range_cache is None:
+            self._available_range_cache = self._computed_available_range()
+
+        return copy.copy(self._available_range_cache)
+
+    def _computed_available_range(self):
+        """Compute the available_range() from the children.
+
+        To be implemented by subclass of Composition.
+        """
+
+        raise NotImplementedError
+
+    def _invalidate_cached_ranges(self):
+        """Discard any values that this composition has cached from the
+        ranges of its children.
+
+        Called whenever the children (or their ranges) change.  Since that
+        may also change the duration of this composition, the parent is
+        invalidated as well.  The parent can only have cached anything that
+        depends on the duration of this composition by first computing its
+        available_range(), so if that is not cached either, there is nothing
+        to invalidate further up the tree.
+        """
+
+        if self._available_range_cache is not None:
+            self._available_range_cache = None
+            self._invalidate_parent_ranges()
+
     def trimmed_range_of_child_at_index(self, index):
         """Return the trimmed range of the child item at index in the time
         range of this composition.
@@ -202,15 +285,139 @@ class Composition(item.Item, collections.MutableSequence):
     def __deepcopy__(self, md):
         result = super(Composition, self).__deepcopy__(md)
 
+        if self._children_decoder is not None:
+            # the undecoded children were copied along with the other fields
+            result._children_decoder = self._children_decoder
+            return result
+
         # deepcopy should have already copied the children, so only parent
         # pointers need to be updated.
         [c._set_parent(result) for c in result._children]
 
-        # we also need to reconstruct the membership set of _child_lookup.
-        result._child_lookup.update(result._children)
+        # we also need to reconstruct the index map of _child_lookup.
+        result._child_lookup = dict(
+            (c, i) for i, c in enumerate(result._children)
+        )
 
         return result
 
+    def copy_on_write(self):
+        """Return a deep copy of self that shares the children of self until
+        they are first accessed.
+
+        The children are then copied one level at a time, each with its own
+        copy_on_write(), so deriving a new timeline from a large one with
+        copy_on_write() only costs the memory of the parts of it that are
+        accessed.  The other fields are copied right away.
+
+        Writing to self or to anything below it through the fields of
+        SerializableObjects or the methods of Composition makes the copies
+        sharing the written part copy it first.  Edits made in place to the
+        value of a field below self (for example to a metadata dictionary, a
+        TimeRange or a media reference) are not detected, so make those on
+        the copy, or before copying.
+        """
+
+        if self._children_decoder is not None:
+            self._decode_children()
+
+        source = self._children_source
+        if source is None:
+            source = self
+
+        result = type(self)()
+        result.data = dict(
+            (key, serializable_object._copied_on_write(value))
+            for key, value in self.data.items()
+            if key != "children"
+        )
+        result.data["children"] = source.data["children"]
+        result._children_source = source
+        serializable_object._SHARING_COPIES.add(result)
+
+        # drop the references to copies that were since collected
+        source._sharing_copies = [
+            copy_ref for copy_ref in source._sharing_copies or []
+            if copy_ref() is not None
+        ]
+        source._sharing_copies.append(weakref.ref(result))
+
+        return result
+
+    def _copy_shared_children(self):
+        """Replace the children shared with the _children_source of this
+        copy_on_write() copy with copies of them.
+        """
+
+        source = self._children_source
+        self._children_source = None
+        serializable_object._SHARING_COPIES.discard(self)
+
+        children = [child.copy_on_write() for child in source._children]
+        for child in children:
+            child._set_parent(self)
+
+        self.data["children"] = children
+        self._child_lookup = dict((c, i) for i, c in enumerate(children))
+        self._stale_child_index = None
+
+    def _decode_children(self):
+        """Replace the undecoded children of a lazily loaded Composition with
+        the objects they decode to.
+        """
+
+        decoder = self._children_decoder
+        self._children_decoder = None
+
+        # decoding does not change the contents of self, so unlike update()
+        # this does not go through the write hooks of insert()
+        children = [decoder(child) for child in self.data["children"]]
+        for child in children:
+            if not isinstance(child, self._composable_base_class):
+                raise TypeError(
+                    "Not allowed to decode an object of type {0} into a {1},"
+                    " only objects descending from {2}.".format(
+                        type(child),
+                        type(self),
+                        self._composable_base_class
+                    )
+                )
+            child._set_parent(self)
+
+        self.data["children"] = children
+        self._child_lookup = dict((c, i) for i, c in enumerate(children))
+        self._stale_child_index = None
+
+    def _materialize_children(self):
+        """Make the children of self real, if they are still shared with the
+        Composition self was copied from, or still undecoded.
+        """
+
+        if self._children_source is not None:
+            self._copy_shared_children()
+        if self._children_decoder is not None:
+            self._decode_children()
+
+    def _materialize_fields(self):
+        # children shared with a copy_on_write() source compare and hash the
+        # same as copies of them would, so only undecoded ones need decoding
+        if self._children_decoder is not None:
+            self._decode_children()
+
+    def _unshare_children(self):
+        sharing_copies = self._sharing_copies
+        if not sharing_copies:
+            return
+
+        self._sharing_copies = None
+        for copy_ref in sharing_copies:
+            shared_copy = copy_ref()
+            if (
+                shared_copy is not None and
+                shared_copy._children_source is self
+            ):
+                shared_copy._copy_shared_children()
+
     def _path_to_child(self, child):
         if not isinstance(child, composable.Composable):
             raise TypeError(
@@ -284,6 +491,14 @@ class Composition(item.Item, collections.MutableSequence):
 
         return result_range
 
+    def children_in_range(self, search_range):
+        """Return the children whose range overlaps search_range."""
+
+        return [
+            child for index, child in enumerate(self._children)
+            if self.range_of_child_at_index(index).overlaps(search_range)
+        ]
+
     def children_at_time(self, t):
         """ Which children overlap time t? """
 
@@ -437,13 +652,58 @@ class Composition(item.Item, collections.MutableSequence):
         # ...except for the 'children' field, which needs to run through the
         # insert method so that _parent pointers are correctly set on children.
         self._children = []
+        self._child_lookup = {}
+        self._stale_child_index = None
+        self._invalidate_cached_ranges()
         self.extend(d.get('children', []))
     # @}
 
+    def _mark_child_indices_stale(self, index):
+        """Note that the children from index onwards may have moved."""
+
+        if self._stale_child_index is None or index < self._stale_child_index:
+            self._stale_child_index = index
+
     # @{ collections.MutableSequence implementation
     def __getitem__(self, item):
         return self._children[item]
 
+    def index(self, item, start=0, stop=None):
+        """Return the index of item in this composition.
+
+        Uses the internal child to index map, so this is constant time rather
+        than a scan over the children.
+        """
+
+        self._materialize_children()
+
+        try:
+            result = self._child_lookup[item]
+        except KeyError:
+            raise ValueError(
+                "{} is not in composition: {}".format(item, self)
+            )
+
+        stale_index = self._stale_child_index
+        if stale_index is not None and result >= stale_index:
+            for i in range(stale_index, len(self._children)):
+                self._child_lookup[self._children[i]] = i
+            self._stale_child_index = None
+            result = self._child_lookup[item]
+
+        if stop is None:
+            stop = len(self._children)
+        if start < 0:
+            start += len(self._children)
+        if stop < 0:
+            stop += len(self._children)
+        if not start <= result < stop:
+            raise ValueError(
+                "{} is not in composition: {}".format(item, self)
+            )
+
+        return result
+
     def _setitem_slice(self, key, value):
         set_value = set(value)
 
@@ -467,19 +727,28 @@ class Composition(item.Item, collections.MutableSequence):
                     "Compositions".format(isect)
                 )
 
-            # update old parent
+            # update old parent and membership
             for val in old:
                 val._set_parent(None)
+                del self._child_lookup[val]
 
         # insert into _children
+        start, _, step = key.indices(len(self._children))
         self._children[key] = value
 
-        # update new parent
+        # update new parent and membership
         if value:
             for val in value:
                 val._set_parent(self)
+                self._child_lookup[val] = start
+
+        self._mark_child_indices_stale(start if step == 1 else 0)
+        self._invalidate_cached_ranges()
 
     def __setitem__(self, key, value):
+        if self._copies_on_write_exist:
+            self._detach_shared_copies()
+
         # fetch the current thing at that index/slice
         old = self._children[key]
 
@@ -499,10 +768,12 @@ class Composition(item.Item, collections.MutableSequence):
         # unset the old child's parent and delete the membership entry.
         if old is not None:
             old._set_parent(None)
-            self._child_lookup.remove(old)
+            del self._child_lookup[old]
 
-        # put it into our membership tracking set
-        self._child_lookup.add(value)
+        # put it into our membership tracking map
+        if key < 0:
+            key += len(self._children)
+        self._child_lookup[value] = key
 
         # put it into our list of children
         self._children[key] = value
@@ -511,9 +782,14 @@ class Composition(item.Item, collections.MutableSequence):
         if value is not None:
             value._set_parent(self)
 
+        self._invalidate_cached_ranges()
+
     def insert(self, index, item):
         """Insert an item into the composition at location `index`."""
 
+        if self._copies_on_write_exist:
+            self._detach_shared_copies()
+
         if not isinstance(item, self._composable_base_class):
             raise TypeError(
                 "Not allowed to insert an object of type {0} into a {1}, only"
@@ -534,11 +810,24 @@ class Composition(item.Item, collections.MutableSequence):
         # set the item's parent and add it to our membership tracking and list
         # of children
         item._set_parent(self)
-        self._child_lookup.add(item)
+        length = len(self._children)
+        if index < 0:
+            index = max(index + length, 0)
+        index = min(index, length)
+        self._child_lookup[item] = index
         self._children.insert(index, item)
 
+        # everything from the new item onwards has moved
+        if index < length:
+            self._mark_child_indices_stale(index)
+
+        self._invalidate_cached_ranges()
+
     def __contains__(self, item):
-        """Use our internal membership tracking set to speed up searches."""
+        """Use our internal membership tracking map to speed up searches."""
+
+        self._materialize_children()
+
         return item in self._child_lookup
 
     def __len__(self):
@@ -549,18 +838,28 @@ class Composition(item.Item, collections.MutableSequence):
         return len(self._children)
 
     def __delitem__(self, key):
+        if self._copies_on_write_exist:
+            self._detach_shared_copies()
+
         # grab the old value
         old = self._children[key]
 
-        # remove it from the membership tracking set
+        # remove it from the membership tracking map
         if old is not None:
             if isinstance(key, slice):
                 for val in old:
-                    self._child_lookup.remove(val)
+                    del self._child_lookup[val]
             else:
-                self._child_lookup.remove(old)
+                del self._child_lookup[old]
 
         # remove it from our list of children
+        if isinstance(key, slice):
+            start, _, step = key.indices(len(self._children))
+            self._mark_child_indices_stale(start if step == 1 else 0)
+        else:
+            self._mark_child_indices_stale(
+                key + len(self._children) if key < 0 else key
+            )
         del self._children[key]
 
         # unset the old value's parent
@@ -570,4 +869,6 @@ class Composition(item.Item, collections.MutableSequence):
                     val._set_parent(None)
             else:
                 old._set_parent(None)
+
+        self._invalidate_cached_ranges()
     # @}
@@ -70,11 +70,26 @@ class Item(composable.Composable):
         self.record_range = copy.deepcopy(record_range)
 
     name = serializable_object.serializable_field("name", doc="Item name.")
-    source_range = serializable_object.serializable_field(
+    _source_range = serializable_object.serializable_field(
         "source_range",
         opentime.TimeRange,
         doc="Range of source to trim to.  Can be None or a TimeRange."
     )
+
+    @property
+    def source_range(self):
+        """Range of source to trim to.  Can be None or a TimeRange.
+
+        Note that assigning a new source_range invalidates the child ranges
+        cached by the parent, but editing the TimeRange in place does not.
+        """
+
+        return self._source_range
+
+    @source_range.setter
+    def source_range(self, val):
+        self._source_range = val
+        self._invalidate_parent_ranges()
     record_range = serializable_object.serializable_field(
         "record_range",
         opentime.TimeRange,
@@ -136,39 +151,29 @@ class Item(composable.Composable):
 
         return self.parent().range_of_child(self)
 
-    def transformed_time(self, t, to_item):
-        """Converts time t in the coordinate system of self to coordinate
-        system of to_item.
-
-        Note that self and to_item must be part of the same timeline (they must
-        have a common ancestor).
-
-        Example:
-
-            0                      20
-            [------t----D----------]
-            [--A-][t----B---][--C--]
-            100    101    110
-            101 in B = 6 in D
+    def _time_offset_to(self, to_item):
+        """Return the RationalTime that converts times in the coordinate
+        system of self to the coordinate system of to_item, or None if they
+        share the same coordinate system.
 
-        t = t argument
+        Walks from self up to the common ancestor and back down to to_item
+        once, summing the offset introduced at each hop.
         """
 
-        # does not operate in place
-        result = copy.copy(t)
-
-        if to_item is None:
-            return result
+        offset = None
 
         root = self._root_parent()
 
-        # transform t to root  parent's coordinate system
+        # transform to root parent's coordinate system
         item = self
         while item != root and item != to_item:
 
             parent = item._parent
-            result -= item.trimmed_range().start_time
-            result += parent.range_of_child(item).start_time
+            hop = (
+                parent.range_of_child_at_index(parent.index(item)).start_time -
+                item.trimmed_range().start_time
+            )
+            offset = hop if offset is None else offset + hop
 
             item = parent
 
@@ -179,25 +184,107 @@ class Item(composable.Composable):
         while item != root and item != ancestor:
 
             parent = item._parent
-            result += item.trimmed_range().start_time
-            result -= parent.range_of_child(item).start_time
+            hop = (
+                item.trimmed_range().start_time -
+                parent.range_of_child_at_index(parent.index(item)).start_time
+            )
+            offset = hop if offset is None else offset + hop
 
             item = parent
 
         assert(item == ancestor)
 
-        return result
+        return offset
+
+    def time_transform_to(self, to_item):
+        """Return an opentime.TimeTransform that converts times in the
+        coordinate system of self to the coordinate system of to_item.
+
+        The path between the two items is only resolved once, so this is the
+        way to map many times between the same pair of items, see also
+        transformed_times() and transformed_time_ranges().
+
+        The transform has no rate, so applied_to() returns times at the rate
+        of the times it is given, where transformed_times() returns them at
+        the rate of the faster of each time and the offset between the items,
+        as adding RationalTimes does.  The times are the same either way.
+
+        Note that self and to_item must be part of the same timeline (they must
+        have a common ancestor).
+        """
+
+        offset = None
+        if to_item is not None:
+            offset = self._time_offset_to(to_item)
+
+        if offset is None:
+            return opentime.TimeTransform()
+
+        return opentime.TimeTransform(offset=offset)
+
+    def transformed_time(self, t, to_item):
+        """Converts time t in the coordinate system of self to coordinate
+        system of to_item.
+
+        Note that self and to_item must be part of the same timeline (they must
+        have a common ancestor).
+
+        Example:
+
+            0                      20
+            [------t----D----------]
+            [--A-][t----B---][--C--]
+            100    101    110
+            101 in B = 6 in D
+
+        t = t argument
+        """
+
+        return self.transformed_times([t], to_item)[0]
+
+    def transformed_times(self, times, to_item):
+        """Converts each time in times from the coordinate system of self to
+        the coordinate system of to_item.  Returns a list.
+
+        Same as calling transformed_time() for each time, but the path between
+        self and to_item is only walked once.
+        """
+
+        # does not operate in place
+        if to_item is None:
+            return [copy.copy(t) for t in times]
+
+        offset = self._time_offset_to(to_item)
+        if offset is None:
+            return [copy.copy(t) for t in times]
+
+        return [t + offset for t in times]
 
     def transformed_time_range(self, tr, to_item):
         """Transforms the timerange tr to the range of child or self to_item.
 
         """
 
-        return opentime.TimeRange(
-            self.transformed_time(tr.start_time, to_item),
-            tr.duration
+        return self.transformed_time_ranges([tr], to_item)[0]
+
+    def transformed_time_ranges(self, ranges, to_item):
+        """Transforms each timerange in ranges to the range of child or self
+        to_item.  Returns a list.
+
+        Same as calling transformed_time_range() for each range, but the path
+        between self and to_item is only walked once.
+        """
+
+        start_times = self.transformed_times(
+            [tr.start_time for tr in ranges],
+            to_item
         )
 
+        return [
+            opentime.TimeRange(start_time, tr.duration)
+            for start_time, tr in zip(start_times, ranges)
+        ]
+
     markers = serializable_object.serializable_field(
         "markers",
         doc="List of markers on this item."
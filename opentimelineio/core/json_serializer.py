@@ -28,12 +28,15 @@ Used for the otio_json adapter as well as for plugins and manifests.
 """
 
 import json
+import re
 
 from . import (
     SerializableObject,
     type_registry,
 )
 
+from .composition import Composition
+
 from .unknown_schema import UnknownSchema
 
 from .. import (
@@ -44,15 +47,23 @@ from .. import (
 
 # @TODO: Handle file version drifting
 
+# The writer produces many small fragments; they are gathered into writes of
+# this many fragments.
+_STREAM_WRITE_FRAGMENTS = 16 * 1024
+
 
 class _SerializableObjectEncoder(json.JSONEncoder):
 
     """ Encoder for the SerializableObject OTIO Class and its descendents. """
 
     def default(self, obj):
-        for typename, encfn in _ENCODER_LIST:
-            if isinstance(obj, typename):
-                return encfn(obj)
+        try:
+            encfn = _ENCODER_DISPATCH[type(obj)]
+        except KeyError:
+            encfn = _encoder_for_type(type(obj))
+
+        if encfn is not None:
+            return encfn(obj)
 
         return json.JSONEncoder.default(self, obj)
 
@@ -63,28 +74,51 @@ def serialize_json_to_string(root, sort_keys=True, indent=4):
     Returns a JSON string.
     """
 
-    return _SerializableObjectEncoder(
-        sort_keys=sort_keys,
-        indent=indent
-    ).encode(root)
+    if indent is None:
+        # the C accelerated encoder of the json module only handles compact
+        # output, where it beats _JsonWriter
+        return _SerializableObjectEncoder(
+            sort_keys=sort_keys,
+            indent=indent
+        ).encode(root)
+
+    result = []
+    _JsonWriter(sort_keys, indent, result.append).write(root)
+    return str("".join(result))
+
+
+def serialize_json_to_stream(root, to_stream, sort_keys=True, indent=4):
+    """Serialize a tree of SerializableObject to JSON.
+
+    Writes the result incrementally to the given text file object, so the
+    complete document is never held in memory.  The output is identical to
+    that of serialize_json_to_string.
+    """
+
+    _JsonWriter(sort_keys, indent, to_stream.write).write(root)
 
 
-def serialize_json_to_file(root, to_file):
+def serialize_json_to_file(root, to_file, sort_keys=True, indent=4):
     """
     Serialize a tree of SerializableObject to JSON.
 
     Writes the result to the given file path.
     """
 
-    content = serialize_json_to_string(root)
-
     with open(to_file, 'w') as file_contents:
-        file_contents.write(content)
+        serialize_json_to_stream(
+            root,
+            file_contents,
+            sort_keys=sort_keys,
+            indent=indent
+        )
+
 
 # @{ Encoders
 
 
 def _encoded_serializable_object(input_otio):
+    input_otio._materialize_fields()
     if not input_otio._serializable_label:
         raise exceptions.InvalidSerializableLabelError(
             input_otio._serializable_label
@@ -146,6 +180,291 @@ _ENCODER_LIST = [
     (SerializableObject, _encoded_serializable_object)
 ]
 
+# Map of exact types to the function from _ENCODER_LIST that encodes them
+# (None if there is none), filled in as new types are encountered.
+_ENCODER_DISPATCH = {}
+
+
+def _encoder_for_type(cls):
+    """Return the encoding function for instances of cls, or None."""
+
+    result = None
+    for typename, encfn in _ENCODER_LIST:
+        if issubclass(cls, typename):
+            result = encfn
+            break
+
+    _ENCODER_DISPATCH[cls] = result
+    return result
+
+
+def _encoded_float(value):
+    # matches the json module's handling of special values (allow_nan=True)
+    if value != value:
+        return "NaN"
+    if value == _INFINITY:
+        return "Infinity"
+    if value == -_INFINITY:
+        return "-Infinity"
+
+    return float.__repr__(value)
+
+
+_INFINITY = float("inf")
+_encoded_string = json.encoder.encode_basestring_ascii
+
+try:
+    # Python 2, where the json module writes ints and longs with str()
+    _INTEGER_TYPES = (int, long)
+    _encoded_int = str
+except NameError:
+    _INTEGER_TYPES = (int,)
+    _encoded_int = int.__repr__
+
+
+class _JsonWriter(object):
+
+    """Writes JSON for a tree of SerializableObject without intermediates.
+
+    Produces exactly the output of _SerializableObjectEncoder for the same
+    sort_keys and indent, but dispatches on exact types and writes the fields
+    of SerializableObjects straight from their data rather than building a
+    dictionary for each of them and walking it with the generator based
+    encoder of the json module.  Fragments are passed to emit in batches, as
+    text (unicode on Python 2).
+    """
+
+    def __init__(self, sort_keys, indent, emit):
+        if indent is not None and not isinstance(
+            indent,
+            type_registry._STRING_TYPES
+        ):
+            indent = " " * indent
+
+        self.sort_keys = sort_keys
+        self.indent = indent
+        # "," when indenting, except on Python 2, which keeps ", "
+        self.item_separator = json.JSONEncoder(indent=indent).item_separator
+        self.emit = emit
+        self.fragments = []
+        self.markers = set()
+        self.writers = {
+            float: self._write_float,
+            bool: self._write_constant,
+            type(None): self._write_constant,
+            list: self._write_list,
+            tuple: self._write_list,
+            dict: self._write_dict,
+        }
+        for cls in type_registry._STRING_TYPES:
+            self.writers[cls] = self._write_string
+        for cls in _INTEGER_TYPES:
+            self.writers[cls] = self._write_int
+
+    def write(self, value):
+        """Write value and pass any remaining fragments on to emit."""
+
+        self._write_value(value, 0)
+        if self.fragments:
+            self.emit(u"".join(self.fragments))
+            self.fragments = []
+
+    def _write_value(self, value, level):
+        try:
+            writer = self.writers[type(value)]
+        except KeyError:
+            writer = self._writer_for_type(type(value))
+
+        writer(value, level)
+
+    def _writer_for_type(self, cls):
+        # mirrors the order of the checks in the json module
+        if issubclass(cls, type_registry._STRING_TYPES):
+            writer = self._write_string
+        elif issubclass(cls, _INTEGER_TYPES):
+            writer = self._write_int
+        elif issubclass(cls, float):
+            writer = self._write_float
+        elif issubclass(cls, (list, tuple)):
+            writer = self._write_list
+        elif issubclass(cls, dict):
+            writer = self._write_dict
+        else:
+            try:
+                encfn = _ENCODER_DISPATCH[cls]
+            except KeyError:
+                encfn = _encoder_for_type(cls)
+
+            if encfn is _encoded_serializable_object:
+                writer = self._write_serializable_object
+            elif encfn is not None:
+                writer = self._encoded_writer(encfn)
+            else:
+                raise TypeError(
+                    "Object of type {} is not JSON serializable".format(
+                        cls.__name__
+                    )
+                )
+
+        self.writers[cls] = writer
+        return writer
+
+    def _encoded_writer(self, encfn):
+        def write_encoded(value, level):
+            self._mark(value)
+            self._write_dict(encfn(value), level)
+            self.markers.discard(id(value))
+
+        return write_encoded
+
+    def _mark(self, value):
+        marker = id(value)
+        if marker in self.markers:
+            raise ValueError("Circular reference detected")
+        self.markers.add(marker)
+
+    def _write_string(self, value, level):
+        self.fragments.append(_encoded_string(value))
+
+    def _write_int(self, value, level):
+        self.fragments.append(_encoded_int(value))
+
+    def _write_float(self, value, level):
+        self.fragments.append(_encoded_float(value))
+
+    def _write_constant(self, value, level):
+        self.fragments.append(
+            "null" if value is None else "true" if value else "false"
+        )
+
+    def _write_list(self, value, level):
+        fragments = self.fragments
+        if not value:
+            fragments.append("[]")
+            return
+
+        self._mark(value)
+        level += 1
+        if self.indent is not None:
+            newline_indent = "\n" + self.indent * level
+            separator = self.item_separator + newline_indent
+            fragments.append("[" + newline_indent)
+        else:
+            separator = self.item_separator
+            fragments.append("[")
+
+        writers = self.writers
+        first = True
+        for item in value:
+            if first:
+                first = False
+            else:
+                fragments.append(separator)
+
+            try:
+                writer = writers[type(item)]
+            except KeyError:
+                writer = self._writer_for_type(type(item))
+            writer(item, level)
+
+            if len(fragments) >= _STREAM_WRITE_FRAGMENTS:
+                self.emit(u"".join(fragments))
+                del fragments[:]
+
+        if self.indent is not None:
+            fragments.append("\n" + self.indent * (level - 1))
+        fragments.append("]")
+        self.markers.discard(id(value))
+
+    def _write_dict(self, value, level):
+        if not value:
+            self.fragments.append("{}")
+            return
+
+        self._mark(value)
+        if self.sort_keys:
+            self._write_items(sorted(value.items()), level)
+        else:
+            self._write_items(value.items(), level)
+        self.markers.discard(id(value))
+
+    def _write_serializable_object(self, value, level):
+        value._materialize_fields()
+        label = value._serializable_label
+        data = value.data
+        if not label or "OTIO_SCHEMA" in data:
+            self._encoded_writer(_encoded_serializable_object)(value, level)
+            return
+
+        self._mark(value)
+        schema_item = ("OTIO_SCHEMA", label)
+        if self.sort_keys:
+            items = sorted(data.items())
+            index = 0
+            while index < len(items) and items[index][0] < "OTIO_SCHEMA":
+                index += 1
+            items.insert(index, schema_item)
+        else:
+            items = [schema_item]
+            items.extend(data.items())
+
+        self._write_items(items, level)
+        self.markers.discard(id(value))
+
+    def _write_items(self, items, level):
+        fragments = self.fragments
+        level += 1
+        if self.indent is not None:
+            newline_indent = "\n" + self.indent * level
+            separator = self.item_separator + newline_indent
+            fragments.append("{" + newline_indent)
+        else:
+            separator = self.item_separator
+            fragments.append("{")
+
+        writers = self.writers
+        first = True
+        for key, item in items:
+            if isinstance(key, type_registry._STRING_TYPES):
+                pass
+            elif isinstance(key, float):
+                key = _encoded_float(key)
+            elif key is True:
+                key = "true"
+            elif key is False:
+                key = "false"
+            elif key is None:
+                key = "null"
+            elif isinstance(key, _INTEGER_TYPES):
+                key = _encoded_int(key)
+            else:
+                raise TypeError(
+                    "keys must be str, int, float, bool or None, "
+                    "not {}".format(key.__class__.__name__)
+                )
+
+            if first:
+                first = False
+            else:
+                fragments.append(separator)
+            fragments.append(_encoded_string(key))
+            fragments.append(": ")
+
+            try:
+                writer = writers[type(item)]
+            except KeyError:
+                writer = self._writer_for_type(type(item))
+            writer(item, level)
+
+            if len(fragments) >= _STREAM_WRITE_FRAGMENTS:
+                self.emit(u"".join(fragments))
+                del fragments[:]
+
+        if self.indent is not None:
+            fragments.append("\n" + self.indent * (level - 1))
+        fragments.append("}")
+
+
 # @{ Decoders
 
 
@@ -190,29 +509,339 @@ def _as_otio(dct):
         if schema_label in _DECODER_FUNCTION_MAP:
             return _DECODER_FUNCTION_MAP[schema_label](dct)
 
-        schema_name = type_registry.schema_name_from_label(schema_label)
-        schema_version = type_registry.schema_version_from_label(schema_label)
         del dct["OTIO_SCHEMA"]
 
-        return type_registry.instance_from_schema(
-            schema_name,
-            schema_version,
-            dct
-        )
+        return type_registry.instance_from_schema_label(schema_label, dct)
 
     return dct
 
 
-def deserialize_json_from_string(otio_string):
-    """ Deserialize a string containing JSON to OTIO objects. """
+def deserialize_json_from_string(otio_string, lazy=False):
+    """ Deserialize a string containing JSON to OTIO objects.
+
+    If lazy is True, the children of Compositions are kept as undecoded JSON
+    until they are first accessed, so opening a large timeline only builds
+    the parts of it that are looked at.
+    """
+
+    if lazy:
+        return _decoded_lazily(json.loads(otio_string))
 
     return json.loads(otio_string, object_hook=_as_otio)
 
 
-def deserialize_json_from_file(otio_filepath):
-    """ Deserialize the file at otio_filepath containing JSON to OTIO.  """
+def deserialize_json_from_file(otio_filepath, lazy=False):
+    """ Deserialize the file at otio_filepath containing JSON to OTIO.
+
+    See deserialize_json_from_string for lazy.
+    """
 
     with open(otio_filepath, 'r') as file_contents:
-        result = deserialize_json_from_string(file_contents.read())
+        result = deserialize_json_from_string(file_contents.read(), lazy)
         result._json_path = otio_filepath
         return result
+
+
+def _decoded_lazily(value):
+    """Decode the JSON value, as loaded without _as_otio, to OTIO objects
+    leaving the children of Compositions undecoded.
+
+    The dictionaries in value are decoded in place.
+    """
+
+    if isinstance(value, list):
+        return [_decoded_lazily(item) for item in value]
+
+    if not isinstance(value, dict):
+        return value
+
+    children = None
+    schema_label = value.get("OTIO_SCHEMA")
+    if (
+        schema_label is not None and
+        schema_label not in _DECODER_FUNCTION_MAP and
+        isinstance(value.get("children"), list) and
+        issubclass(
+            type_registry.class_from_schema_label(schema_label),
+            Composition
+        )
+    ):
+        children = value.pop("children")
+
+    for key, item in value.items():
+        if isinstance(item, (dict, list)):
+            value[key] = _decoded_lazily(item)
+
+    result = _as_otio(value)
+
+    if children is not None:
+        result.data["children"] = children
+        result._children_decoder = _decoded_lazily
+
+    return result
+
+
+def deserialize_json_items_from_stream(
+    from_stream,
+    descended_from_type=SerializableObject
+):
+    """Incrementally deserialize the leaf objects of an OTIO JSON document.
+
+    Reads the given text file object a chunk at a time and yields
+    ``(item, path)`` pairs for every object in a ``children`` list that does
+    not itself have children, such as the clips, gaps and transitions of a
+    timeline or the members of a SerializableCollection.  Compositions,
+    collections and timelines are walked but never built, so memory use is
+    bounded by the largest leaf rather than the whole document.
+
+    path is a tuple of ``(schema_name, index)`` pairs from the root down to
+    and including the item, where index is the position in the parent's
+    children (None for the root and for a Timeline's tracks).  Only objects
+    that are instances of descended_from_type are yielded.
+    """
+
+    reader = _IncrementalReader(from_stream)
+    char = reader.peek()
+    if char == "{":
+        reader.advance()
+        for result in _streamed_object(reader, (), None, descended_from_type):
+            yield result
+    elif char == "[":
+        reader.advance()
+        for result in _streamed_children(reader, (), descended_from_type):
+            yield result
+    else:
+        reader.value()
+
+    if reader.peek():
+        reader.fail("Extra data")
+
+
+def deserialize_json_items_from_file(
+    otio_filepath,
+    descended_from_type=SerializableObject
+):
+    """Incrementally deserialize the leaf objects of the file at otio_filepath.
+
+    See deserialize_json_items_from_stream.
+    """
+
+    with open(otio_filepath, 'r') as file_contents:
+        for result in deserialize_json_items_from_stream(
+            file_contents,
+            descended_from_type
+        ):
+            yield result
+
+
+# Keys whose values are walked incrementally rather than decoded whole.
+_STREAMED_CHILDREN_KEY = "children"
+_STREAMED_OBJECT_KEY = "tracks"
+
+_STREAM_READ_SIZE = 64 * 1024
+
+
+class _IncrementalReader(object):
+
+    """Buffered cursor over a JSON text stream.
+
+    Only the unconsumed part of the stream is kept in memory; complete values
+    are decoded from the buffer with the regular OTIO object hook.
+    """
+
+    _decoder = json.JSONDecoder(object_hook=_as_otio)
+    _whitespace = re.compile(r"[ \t\n\r]*")
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.buffer = ""
+        self.pos = 0
+        self.offset = 0
+        self.at_eof = False
+
+    def fill(self, size=_STREAM_READ_SIZE):
+        """Read more of the stream, returning False at the end of it."""
+
+        if self.at_eof:
+            return False
+
+        chunk = self.stream.read(size)
+        if not chunk:
+            self.at_eof = True
+            return False
+
+        self.offset += self.pos
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Return the next non-whitespace character, or '' at the end."""
+
+        while True:
+            buffer = self.buffer
+            pos = self._whitespace.match(buffer, self.pos).end()
+            self.pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not self.fill():
+                return ""
+
+    def advance(self):
+        self.pos += 1
+
+    def expect(self, char):
+        if self.peek() != char:
+            self.fail("Expecting {!r} delimiter".format(char))
+        self.pos += 1
+
+    def value(self):
+        """Decode the complete JSON value at the cursor."""
+
+        self.peek()
+        size = _STREAM_READ_SIZE
+        while True:
+            try:
+                result, end = self._decoder.raw_decode(self.buffer, self.pos)
+            except ValueError:
+                if not self.fill(size):
+                    raise
+            else:
+                # a value running up to the end of the buffer (a number, or a
+                # literal) may continue in the next chunk
+                if end < len(self.buffer) or not self.fill(size):
+                    self.pos = end
+                    return result
+                continue
+
+            # grow the reads so that large values are not re-parsed too often
+            size *= 2
+
+    def fail(self, message):
+        raise ValueError(
+            "{}: char {}".format(message, self.offset + self.pos)
+        )
+
+
+def _streamed_children(reader, path, descended_from_type):
+    """Walk a JSON list of children, the opening '[' already consumed."""
+
+    index = 0
+    if reader.peek() == "]":
+        reader.advance()
+        return
+
+    while True:
+        if reader.peek() == "{":
+            reader.advance()
+            for result in _streamed_object(
+                reader,
+                path,
+                index,
+                descended_from_type
+            ):
+                yield result
+        else:
+            reader.value()
+
+        index += 1
+        char = reader.peek()
+        reader.advance()
+        if char == "]":
+            return
+        if char != ",":
+            reader.pos -= 1
+            reader.fail("Expecting ',' delimiter")
+
+
+def _streamed_object(reader, path, index, descended_from_type):
+    """Walk a JSON object, the opening '{' already consumed.
+
+    The object is yielded if it turns out to be a leaf, otherwise its
+    children are yielded as they are read.  Children that come before the
+    OTIO_SCHEMA of the object (which OTIO writes first, but other writers
+    may not) are held back until it is known, as it is part of their path.
+    """
+
+    fields = {}
+    is_leaf = True
+    deferred = []
+
+    if reader.peek() == "}":
+        reader.advance()
+    else:
+        while True:
+            if reader.peek() != '"':
+                reader.fail("Expecting property name enclosed in double quotes")
+            key = reader.value()
+            reader.expect(":")
+
+            char = reader.peek()
+            if key == _STREAMED_CHILDREN_KEY and char == "[":
+                reader.advance()
+                is_leaf = False
+                results = _streamed_children(
+                    reader,
+                    path + ((_streamed_schema_name(fields), index),),
+                    descended_from_type
+                )
+            elif key == _STREAMED_OBJECT_KEY and char == "{":
+                reader.advance()
+                is_leaf = False
+                results = _streamed_object(
+                    reader,
+                    path + ((_streamed_schema_name(fields), index),),
+                    None,
+                    descended_from_type
+                )
+            else:
+                fields[key] = reader.value()
+                results = ()
+
+            if "OTIO_SCHEMA" not in fields:
+                deferred.extend(results)
+            else:
+                for result in _with_schema_name(deferred, path, index, fields):
+                    yield result
+                deferred = []
+                for result in results:
+                    yield result
+
+            char = reader.peek()
+            reader.advance()
+            if char == "}":
+                break
+            if char != ",":
+                reader.pos -= 1
+                reader.fail("Expecting ',' delimiter")
+
+    for result in _with_schema_name(deferred, path, index, fields):
+        yield result
+
+    if not is_leaf:
+        return
+
+    # _as_otio() consumes the OTIO_SCHEMA of fields
+    schema_name = _streamed_schema_name(fields)
+    result = _as_otio(fields)
+    if isinstance(result, descended_from_type):
+        yield result, path + ((schema_name, index),)
+
+
+def _with_schema_name(results, path, index, fields):
+    """Fill in the schema name of the object with fields, at path, in the
+    paths of results read before it was known.
+    """
+
+    depth = len(path)
+    element = ((_streamed_schema_name(fields), index),)
+    for item, item_path in results:
+        yield item, item_path[:depth] + element + item_path[depth + 1:]
+
+
+def _streamed_schema_name(fields):
+    label = fields.get("OTIO_SCHEMA")
+    if label is None:
+        return None
+
+    return type_registry.schema_name_from_label(label)
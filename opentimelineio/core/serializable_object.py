@@ -25,11 +25,25 @@
 """Implements the otio.core.SerializableObject"""
 
 import copy
+import hashlib
+import json
+import numbers
+import weakref
 
 from . import (
     type_registry,
 )
 
+from .. import (
+    opentime,
+)
+
+
+# The copy_on_write() copies that still share the children of the Composition
+# they were copied from.  They are dropped once they copy their children, or
+# are collected.
+_SHARING_COPIES = weakref.WeakSet()
+
 
 class SerializableObject(object):
     """Base object for things that can be [de]serialized to/from .otio files.
@@ -72,6 +86,15 @@ class SerializableObject(object):
     _serializable_label = None
     _class_path = "core.SerializableObject"
 
+    @property
+    def _copies_on_write_exist(self):
+        """Whether any copy_on_write() copy still shares anything.  While none
+        does, writes need not look for copies sharing the object being written
+        to.
+        """
+
+        return len(_SHARING_COPIES) > 0
+
     def __init__(self):
         self.data = {}
 
@@ -88,34 +111,66 @@ class SerializableObject(object):
     def is_equivalent_to(self, other):
         """Returns true if the contents of self and other match."""
 
-        try:
-            if self.data == other.data:
-                return True
-
-            # XXX: Gross hack takes OTIO->JSON String->Python Dictionaries
-            #
-            # using the serializer ensures that we only compare fields that are
-            # serializable, which is how we define equivalence.
-            #
-            # we use json.loads() to turn the string back into dictionaries
-            # so we can use python's equivalence for things like floating
-            # point numbers (ie 5.0 == 5) without having to do string
-            # processing.
-
-            from . import json_serializer
-            import json
-
-            lhs_str = json_serializer.serialize_json_to_string(self)
-            lhs = json.loads(lhs_str)
-
-            rhs_str = json_serializer.serialize_json_to_string(other)
-            rhs = json.loads(rhs_str)
-
-            return (lhs == rhs)
-        except AttributeError:
-            return False
+        return self.first_difference(other) is None
+
+    def first_difference(self, other):
+        """Return the path to the first field that differs between self and
+        other, or None if their contents match.
+
+        Only the fields that are serialized are compared, the same way they
+        would compare after a round trip through JSON: numbers compare by
+        value (ie 5.0 == 5), tuples compare like lists, and RationalTimes,
+        TimeRanges and TimeTransforms compare by their serialized fields.  The
+        comparison stops at the first difference.
+
+        The path starts with the schema name of self, for example:
+            "Timeline.tracks.children[1].source_range.duration.rate"
+        """
+
+        path = _first_difference(self, other)
+        if path is None:
+            return None
+
+        if self._serializable_label:
+            path.append(self.schema_name())
+        else:
+            path.append(type(self).__name__)
+        path.reverse()
+
+        return "".join(path)
     # @}
 
+    def content_hash(self, hashes=None):
+        """Return a hash (a hex string) of the contents of self.
+
+        Objects that are equivalent (see is_equivalent_to()) have the same
+        content hash, so comparing the hashes of two objects is a cheap way to
+        check whether they differ, or to find duplicates.
+
+        The contents of SerializableObjects in the fields of self (including
+        the children of a Composition) are not hashed again, only their own
+        content_hash().
+
+        hashes, if given, is a dictionary of the hashes of SerializableObjects
+        keyed by object.  The hashes found in it are used instead of hashing
+        those objects, and the hashes computed are added to it, so passing the
+        same dictionary to several calls only hashes each object once.  Nothing
+        in it is updated when an object is edited: it is up to the caller to
+        discard it, or the hashes of the edited objects and their parents.
+        """
+
+        if hashes is not None and self in hashes:
+            return hashes[self]
+
+        parts = []
+        _append_serializable_object_fields(self, parts, hashes)
+        result = hashlib.sha256("".join(parts).encode("utf-8")).hexdigest()
+
+        if hashes is not None:
+            hashes[self] = result
+
+        return result
+
     def update(self, d):
         """Like the dictionary .update() method.
 
@@ -123,6 +178,9 @@ class SerializableObject(object):
         of d if d is a SerializableObject or if d is a dictionary, d itself.
         """
 
+        if self._copies_on_write_exist:
+            self._detach_shared_copies()
+
         if isinstance(d, SerializableObject):
             self.data.update(d.data)
         else:
@@ -164,6 +222,293 @@ class SerializableObject(object):
     def deepcopy(self):
         return self.__deepcopy__({})
 
+    def copy_on_write(self):
+        """Return a deep copy of self that shares what it can with self until
+        it is written to.
+
+        By default nothing is shared, and this is the same as deepcopy(),
+        except that SerializableObjects in the fields of self are copied with
+        their own copy_on_write().  Compositions share their children, see
+        Composition.copy_on_write().
+        """
+
+        result = type(self)()
+        result.data = dict(
+            (key, _copied_on_write(value)) for key, value in self.data.items()
+        )
+
+        return result
+
+    def _detach_shared_copies(self):
+        """Called before self is written to, to make any copy_on_write()
+        copies that still share contents with self copy them.
+
+        Nothing is shared by default.
+        """
+
+        pass
+
+    def _materialize_fields(self):
+        """Called before the fields of self are compared, hashed or
+        serialized, to turn any that are only held in a deferred form into
+        their real values.
+
+        Lazily loaded Compositions defer decoding their children, see
+        core.deserialize_json_from_string().
+        """
+
+        pass
+
+
+def _serialized_label_and_fields(obj):
+    """Return the schema label and the dictionary of fields that obj is
+    serialized with.
+    """
+
+    obj._materialize_fields()
+
+    if obj.is_unknown_schema:
+        fields = dict(obj.data)
+        label = fields.pop(obj._original_label, None)
+        return label, fields
+
+    return obj._serializable_label, obj.data
+
+
+# map of opentime type to the fields it is serialized with
+_OPENTIME_FIELDS = {
+    opentime.RationalTime: ("value", "rate"),
+    opentime.TimeRange: ("start_time", "duration"),
+    opentime.TimeTransform: ("offset", "scale", "rate"),
+}
+
+
+def _first_difference(lhs, rhs):
+    """Compare lhs and rhs for SerializableObject.first_difference().
+
+    Returns None if they match, otherwise the path to the first difference,
+    as a list of ".name" and "[index]" parts in reverse order, so that parts
+    can be appended cheaply on the way out of the recursion.
+    """
+
+    if lhs is rhs:
+        return None
+
+    if isinstance(lhs, SerializableObject):
+        if not isinstance(rhs, SerializableObject):
+            return []
+
+        lhs_label, lhs = _serialized_label_and_fields(lhs)
+        rhs_label, rhs = _serialized_label_and_fields(rhs)
+        if lhs_label != rhs_label:
+            return [".OTIO_SCHEMA"]
+
+        return _first_dict_difference(lhs, rhs)
+
+    fields = _OPENTIME_FIELDS.get(type(lhs))
+    if fields is not None:
+        if type(rhs) is not type(lhs):
+            return []
+
+        for name in fields:
+            path = _first_difference(getattr(lhs, name), getattr(rhs, name))
+            if path is not None:
+                path.append("." + name)
+                return path
+
+        return None
+
+    if isinstance(lhs, dict):
+        if not isinstance(rhs, dict):
+            return []
+
+        return _first_dict_difference(lhs, rhs)
+
+    if isinstance(lhs, (list, tuple)):
+        if not isinstance(rhs, (list, tuple)):
+            return []
+
+        for index, (lhs_item, rhs_item) in enumerate(zip(lhs, rhs)):
+            path = _first_difference(lhs_item, rhs_item)
+            if path is not None:
+                path.append("[{}]".format(index))
+                return path
+
+        if len(lhs) != len(rhs):
+            return ["[{}]".format(min(len(lhs), len(rhs)))]
+
+        return None
+
+    if (
+        isinstance(rhs, (SerializableObject, dict, list, tuple)) or
+        type(rhs) in _OPENTIME_FIELDS or
+        lhs != rhs
+    ):
+        return []
+
+    return None
+
+
+def _first_dict_difference(lhs, rhs):
+    """_first_difference() for two dictionaries."""
+
+    for key, lhs_value in lhs.items():
+        try:
+            rhs_value = rhs[key]
+        except KeyError:
+            return [".{}".format(key)]
+
+        path = _first_difference(lhs_value, rhs_value)
+        if path is not None:
+            path.append(".{}".format(key))
+            return path
+
+    if len(lhs) != len(rhs):
+        for key in rhs:
+            if key not in lhs:
+                return [".{}".format(key)]
+
+    return None
+
+
+def _append_content_hash_parts(value, parts, hashes):
+    """Append the strings that value is hashed as to parts, for
+    SerializableObject.content_hash().
+
+    The encoding follows the comparison made by _first_difference(), so
+    that equivalent values are encoded the same.
+    """
+
+    try:
+        append = _CONTENT_HASH_APPENDERS[type(value)]
+    except KeyError:
+        append = _content_hash_appender_for_type(type(value))
+
+    append(value, parts, hashes)
+
+
+def _append_serializable_object_fields(value, parts, hashes):
+    label, fields = _serialized_label_and_fields(value)
+    parts.append("<")
+    _append_content_hash_parts(label, parts, hashes)
+    _append_dict_parts(fields, parts, hashes)
+    parts.append(">")
+
+
+def _append_serializable_object_parts(value, parts, hashes):
+    parts.append("#")
+    parts.append(value.content_hash(hashes))
+
+
+def _append_null_parts(value, parts, hashes):
+    parts.append("null")
+
+
+def _append_string_parts(value, parts, hashes):
+    parts.append(_encoded_string(value))
+
+
+def _append_number_parts(value, parts, hashes):
+    # equal numbers must be encoded the same, so whole floats are encoded
+    # like ints, and bools like 0 and 1
+    if isinstance(value, float) and not value.is_integer():
+        parts.append(repr(value))
+    else:
+        try:
+            parts.append(str(int(value)))
+        except (OverflowError, ValueError):
+            # inf and nan
+            parts.append(repr(value))
+
+
+def _append_dict_parts(value, parts, hashes):
+    items = []
+    for key, item in value.items():
+        key_parts = []
+        _append_content_hash_parts(key, key_parts, hashes)
+        items.append(("".join(key_parts), item))
+    items.sort(key=lambda pair: pair[0])
+
+    parts.append("{")
+    for key, item in items:
+        parts.append(key)
+        parts.append(":")
+        _append_content_hash_parts(item, parts, hashes)
+        parts.append(",")
+    parts.append("}")
+
+
+def _append_list_parts(value, parts, hashes):
+    parts.append("[")
+    for item in value:
+        _append_content_hash_parts(item, parts, hashes)
+        parts.append(",")
+    parts.append("]")
+
+
+def _append_opentime_parts(value, parts, hashes):
+    parts.append(type(value).__name__)
+    parts.append("(")
+    for name in _OPENTIME_FIELDS[type(value)]:
+        _append_content_hash_parts(getattr(value, name), parts, hashes)
+        parts.append(",")
+    parts.append(")")
+
+
+def _content_hash_appender_for_type(cls):
+    """Return the function that appends the content hash parts of values of
+    type cls, and add it to _CONTENT_HASH_APPENDERS.
+    """
+
+    if issubclass(cls, SerializableObject):
+        append = _append_serializable_object_parts
+    elif issubclass(cls, type_registry._STRING_TYPES):
+        append = _append_string_parts
+    elif issubclass(cls, (numbers.Integral, float)):
+        append = _append_number_parts
+    elif issubclass(cls, dict):
+        append = _append_dict_parts
+    elif issubclass(cls, (list, tuple)):
+        append = _append_list_parts
+    else:
+        raise TypeError(
+            "Cannot compute the content hash of a value of type {}.".format(
+                cls
+            )
+        )
+
+    _CONTENT_HASH_APPENDERS[cls] = append
+    return append
+
+
+_encoded_string = json.encoder.encode_basestring_ascii
+
+# The functions that append the content hash parts of values, by exact type.
+# Subclasses are added as they are met, see _content_hash_appender_for_type().
+_CONTENT_HASH_APPENDERS = {
+    type(None): _append_null_parts,
+    bool: _append_number_parts,
+    int: _append_number_parts,
+    float: _append_number_parts,
+    dict: _append_dict_parts,
+    list: _append_list_parts,
+    tuple: _append_list_parts,
+}
+for _cls in type_registry._STRING_TYPES:
+    _CONTENT_HASH_APPENDERS[_cls] = _append_string_parts
+for _cls in _OPENTIME_FIELDS:
+    _CONTENT_HASH_APPENDERS[_cls] = _append_opentime_parts
+del _cls
+
+
+def _copied_on_write(value):
+    """Copy a field value for SerializableObject.copy_on_write()."""
+
+    if isinstance(value, SerializableObject):
+        return value.copy_on_write()
+
+    return copy.deepcopy(value)
+
 
 def serializable_field(name, required_type=None, doc=None):
     """Create a serializable_field for child classes of SerializableObject.
@@ -206,6 +551,9 @@ def serializable_field(name, required_type=None, doc=None):
                     )
                 )
 
+        if self._copies_on_write_exist:
+            self._detach_shared_copies()
+
         self.data[name] = val
 
     return property(getter, setter, doc=doc)
@@ -24,6 +24,8 @@
 
 """Core type registry system for registering OTIO types for serialization."""
 
+import copy
+
 from .. import (
     exceptions
 )
@@ -35,6 +37,22 @@ _OTIO_TYPES = {}
 # maps types to a map of versions to upgrade functions
 _UPGRADE_FUNCTIONS = {}
 
+# the types of text strings, which include unicode on Python 2
+try:
+    _STRING_TYPES = (str, unicode)
+except NameError:
+    _STRING_TYPES = (str,)
+
+# maps schema labels to the _SchemaPlan for reading them, filled in as labels
+# are encountered and cleared whenever the registry changes
+_SCHEMA_PLANS = {}
+
+# types of instance attributes that may be shared between the objects built
+# from the same template by instance_from_schema_label()
+_IMMUTABLE_TYPES = (
+    (type(None), bool, int, float, tuple, frozenset) + _STRING_TYPES
+)
+
 
 def schema_name_from_label(label):
     """Return the schema name from the label name."""
@@ -75,6 +93,7 @@ def register_type(classobj, schemaname=None):
         schemaname = schema_name_from_label(classobj._serializable_label)
 
     _OTIO_TYPES[schemaname] = classobj
+    _SCHEMA_PLANS.clear()
 
     return classobj
 
@@ -102,6 +121,7 @@ def upgrade_function_for(cls, version_to_upgrade_to):
         """ Decorator for marking upgrade functions """
 
         _UPGRADE_FUNCTIONS.setdefault(cls, {})[version_to_upgrade_to] = func
+        _SCHEMA_PLANS.clear()
 
         return func
 
@@ -111,12 +131,136 @@ def upgrade_function_for(cls, version_to_upgrade_to):
 def instance_from_schema(schema_name, schema_version, data_dict):
     """Return an instance, of the schema from data in the data_dict."""
 
+    plan = _schema_plan(
+        schema_label_from_name_version(schema_name, schema_version),
+        schema_name,
+        int(schema_version)
+    )
+    data_dict = plan.upgraded(data_dict)
+
+    obj = plan.cls()
+    obj.update(data_dict)
+
+    return obj
+
+
+def instance_from_schema_label(schema_label, data_dict):
+    """Return an instance of the schema named by schema_label, for example
+    "Clip.1", from data in the data_dict.
+
+    Unlike instance_from_schema, the data_dict may become the data of the
+    result, so it should not be used by the caller afterwards.
+    """
+
+    return _schema_plan_for_label(schema_label).instance(data_dict)
+
+
+def class_from_schema_label(schema_label):
+    """Return the class that instance_from_schema_label() builds for
+    schema_label (UnknownSchema for schemas that are not registered).
+    """
+
+    return _schema_plan_for_label(schema_label).cls
+
+
+class _SchemaPlan(object):
+
+    """How to build objects from the data of one schema label.
+
+    Resolves the class and the chain of upgrade functions for the label once,
+    and where it is safe, keeps a default constructed template of the class so
+    that instances can be built from it without running the constructor and
+    then update() over the defaults it made.
+    """
+
+    def __init__(self, cls, upgrade_functions, original_label):
+        self.cls = cls
+        self.upgrade_functions = upgrade_functions
+        self.original_label = original_label
+        self.template_attributes = None
+        self.template_data = None
+        self.mutable_defaults = ()
+
+        from .serializable_object import SerializableObject
+
+        if cls.update is not SerializableObject.update:
+            return
+
+        template = cls()
+        attributes = dict(vars(template))
+        del attributes["data"]
+        if not all(
+            isinstance(value, _IMMUTABLE_TYPES)
+            for value in attributes.values()
+        ):
+            return
+
+        self.template_attributes = attributes
+        self.template_data = template.data
+        self.mutable_defaults = tuple(
+            key for key, value in template.data.items()
+            if not isinstance(value, _IMMUTABLE_TYPES)
+        )
+
+    def upgraded(self, data_dict):
+        if self.original_label is not None:
+            from .unknown_schema import UnknownSchema
+
+            data_dict[UnknownSchema._original_label] = self.original_label
+
+        for upgrade_func in self.upgrade_functions:
+            data_dict = upgrade_func(data_dict)
+
+        return data_dict
+
+    def instance(self, data_dict):
+        data_dict = self.upgraded(data_dict)
+
+        if self.template_attributes is None:
+            obj = self.cls()
+            obj.update(data_dict)
+            return obj
+
+        obj = self.cls.__new__(self.cls)
+        obj.__dict__.update(self.template_attributes)
+
+        data = dict(self.template_data)
+        data.update(data_dict)
+        for key in self.mutable_defaults:
+            if key not in data_dict:
+                data[key] = copy.deepcopy(self.template_data[key])
+        obj.data = data
+
+        return obj
+
+
+def _schema_plan_for_label(schema_label):
+    try:
+        return _SCHEMA_PLANS[schema_label]
+    except KeyError:
+        return _schema_plan(
+            schema_label,
+            schema_name_from_label(schema_label),
+            schema_version_from_label(schema_label)
+        )
+
+
+def _schema_plan(schema_label, schema_name, schema_version):
+    """Return the _SchemaPlan for schema_label, resolving it if needed."""
+
+    plan = _SCHEMA_PLANS.get(schema_label)
+    if plan is not None:
+        return plan
+
+    original_label = None
     if schema_name not in _OTIO_TYPES:
         from .unknown_schema import UnknownSchema
 
         # create an object of UnknownSchema type to represent the data
-        schema_label = schema_label_from_name_version(schema_name, schema_version)
-        data_dict[UnknownSchema._original_label] = schema_label
+        original_label = schema_label_from_name_version(
+            schema_name,
+            schema_version
+        )
         unknown_label = UnknownSchema._serializable_label
         schema_name = schema_name_from_label(unknown_label)
         schema_version = schema_version_from_label(unknown_label)
@@ -134,6 +278,7 @@ def instance_from_schema(schema_name, schema_version, data_dict):
             )
         )
 
+    upgrade_functions = []
     if cls.schema_version() != schema_version:
         # since the keys are the versions to upgrade to, sorting the keys
         # before iterating through them should ensure that upgrade functions
@@ -144,9 +289,9 @@ def instance_from_schema(schema_name, schema_version, data_dict):
             if version < schema_version:
                 continue
 
-            data_dict = upgrade_func(data_dict)
+            upgrade_functions.append(upgrade_func)
 
-    obj = cls()
-    obj.update(data_dict)
+    plan = _SchemaPlan(cls, tuple(upgrade_functions), original_label)
+    _SCHEMA_PLANS[schema_label] = plan
 
-    return obj
+    return plan
@@ -31,6 +31,7 @@ simple.
 
 import math
 import copy
+import collections
 
 
 VALID_NON_DROPFRAME_TIMECODE_RATES = (
@@ -52,12 +53,49 @@ VALID_DROPFRAME_TIMECODE_RATES = (
 VALID_TIMECODE_RATES = (
     VALID_NON_DROPFRAME_TIMECODE_RATES + VALID_DROPFRAME_TIMECODE_RATES)
 
+# NumPy is an optional dependency, only imported by the functions and types
+# that can make use of it.
+_numpy_module = None
+
+
+def _optional_numpy():
+    """Return the numpy module, importing it on first use, or None if it is
+    not available.
+    """
+
+    global _numpy_module
+    if _numpy_module is None:
+        try:
+            import numpy
+        except ImportError:
+            return None
+        _numpy_module = numpy
+
+    return _numpy_module
+
+
+def _numpy():
+    """Return the numpy module, raising ImportError if it is not available."""
+
+    numpy = _optional_numpy()
+    if numpy is None:
+        raise ImportError(
+            "RationalTimeArray and TimeRangeArray require numpy, which could "
+            "not be imported."
+        )
+
+    return numpy
+
 
 class RationalTime(object):
     """ Represents an instantaneous point in time, value * (1/rate) seconds
     from time 0seconds.
     """
 
+    # RationalTime is allocated in very large numbers, so it uses __slots__
+    # rather than a per instance __dict__.
+    __slots__ = ('value', 'rate')
+
     def __init__(self, value=0, rate=1):
         self.value = value
         self.rate = rate
@@ -69,6 +107,15 @@ class RationalTime(object):
     # Always deepcopy, since we want this class to behave like a value type
     __deepcopy__ = __copy__
 
+    def __getstate__(self):
+        # pickle the state as the __dict__ __slots__ replaced, as pickles from
+        # before they were used hold
+        return {'value': self.value, 'rate': self.rate}
+
+    def __setstate__(self, state):
+        self.value = state['value']
+        self.rate = state['rate']
+
     def rescaled_to(self, new_rate):
         """Returns the time for this time converted to new_rate"""
 
@@ -315,20 +362,39 @@ class TimeRange(object):
     start_time of the TimeRange.
     """
 
+    # TimeRange is allocated in very large numbers, so it uses __slots__
+    # rather than a per instance __dict__.
+    __slots__ = ('start_time', '_duration')
+
     def __init__(self, start_time=RationalTime(), duration=RationalTime()):
-        self.start_time = copy.copy(start_time)
-        self.duration = copy.copy(duration)
+        # TimeRange behaves like a value type, so it holds copies of the
+        # times it is given.  Plain RationalTimes are constructed directly,
+        # which is much faster than going through copy.copy().
+        if type(start_time) is RationalTime:
+            self.start_time = RationalTime(start_time.value, start_time.rate)
+        else:
+            self.start_time = copy.copy(start_time)
+
+        if type(duration) is RationalTime and duration.value >= 0.0:
+            self._duration = RationalTime(duration.value, duration.rate)
+        else:
+            self.duration = copy.copy(duration)
 
     def __copy__(self, memodict=None):
-        # Construct a new one directly to avoid the overhead of deepcopy
-        return TimeRange(
-            copy.copy(self.start_time),
-            copy.copy(self.duration)
-        )
+        # __init__ already copies the times, so don't copy them twice
+        return TimeRange(self.start_time, self._duration)
 
     # Always deepcopy, since we want this class to behave like a value type
     __deepcopy__ = __copy__
 
+    def __getstate__(self):
+        # see RationalTime.__getstate__()
+        return {'start_time': self.start_time, '_duration': self._duration}
+
+    def __setstate__(self, state):
+        self.start_time = state['start_time']
+        self._duration = state['_duration']
+
     @property
     def duration(self):
         return self._duration
@@ -551,24 +617,90 @@ def validate_timecode_rate(rate):
                 valid=VALID_TIMECODE_RATES))
 
 
-def from_timecode(timecode_str, rate):
-    """Convert a timecode string into a RationalTime.
+# Constants for converting to and from timecode at a given rate, see
+# _timecode_rate_info()
+_TimecodeRateInfo = collections.namedtuple(
+    '_TimecodeRateInfo',
+    (
+        'is_dropframe',
+        'dropframes',
+        'nominal_fps',
+        'frames_per_24_hours',
+        'frames_per_10_minutes',
+        'frames_per_minute',
+    )
+)
 
-    :param timecode_str: (:class:`str`) A colon-delimited timecode.
-    :param rate: (:class:`float`) The frame-rate to calculate timecode in
-        terms of.
+# maps rates to their _TimecodeRateInfo
+_TIMECODE_RATE_INFO = {}
 
-    :return: (:class:`RationalTime`) Instance for the timecode provided.
+# zero padded strings for the numbers 0 - 99, for formatting timecode
+_TWO_DIGITS = ["{:02d}".format(i) for i in range(100)]
+
+# batches at least this long are converted with numpy, if it is available
+_NUMPY_TIMECODE_BATCH_SIZE = 64
+
+
+def _timecode_rate_info(rate):
+    """Validate rate and return the constants for timecode at that rate.
+
+    Both are only computed the first time a rate is seen.
     """
+
+    try:
+        return _TIMECODE_RATE_INFO[rate]
+    except (KeyError, TypeError):
+        pass
+
     # Validate rate
     validate_timecode_rate(rate)
 
     # Check if rate is drop frame
     rate_is_dropframe = rate in VALID_DROPFRAME_TIMECODE_RATES
 
+    # Timecode is declared in terms of nominal fps
+    nominal_fps = int(math.ceil(rate))
+
+    calc_rate = rate
+    if not rate_is_dropframe:
+        # Check for variantions of ~24 fps and convert to 24 for calculations
+        if round(rate) == 24:
+            calc_rate = round(rate)
+
+    dropframes = 0
+    if rate_is_dropframe:
+        if rate == 29.97:
+            dropframes = 2
+
+        elif rate == 59.94:
+            dropframes = 4
+
+    # Number of frames in an hour
+    frames_per_hour = int(round(calc_rate * 60 * 60))
+
+    info = _TimecodeRateInfo(
+        is_dropframe=rate_is_dropframe,
+        dropframes=dropframes,
+        nominal_fps=nominal_fps,
+        # Number of frames in a day - timecode rolls over after 24 hours
+        frames_per_24_hours=frames_per_hour * 24,
+        # Number of frames per ten minutes
+        frames_per_10_minutes=int(round(calc_rate * 60 * 10)),
+        # Number of frames per minute is the round of the framerate * 60
+        # minus the number of dropped frames
+        frames_per_minute=int(round(calc_rate) * 60) - dropframes,
+    )
+    _TIMECODE_RATE_INFO[rate] = info
+
+    return info
+
+
+def _timecode_fields(timecode_str, rate, info):
+    """Split a timecode string into (total_minutes, seconds, frames)."""
+
     # Check if timecode indicates drop frame
     if ';' in timecode_str:
-        if not rate_is_dropframe:
+        if not info.is_dropframe:
             raise ValueError(
                 'Timecode "{}" indicates drop-frame rate '
                 'due to the ";" frame divider. '
@@ -582,77 +714,77 @@ def from_timecode(timecode_str, rate):
 
     hours, minutes, seconds, frames = timecode_str.split(":")
 
-    # Timecode is declared in terms of nominal fps
-    nominal_fps = int(math.ceil(rate))
-
-    if int(frames) >= nominal_fps:
+    frames = int(frames)
+    if frames >= info.nominal_fps:
         raise ValueError(
             'Frame rate mismatch. Timecode "{}" has frames beyond {}.'.format(
-                timecode_str, nominal_fps - 1))
-
-    dropframes = 0
-    if rate_is_dropframe:
-        if rate == 29.97:
-            dropframes = 2
-
-        elif rate == 59.94:
-            dropframes = 4
+                timecode_str, info.nominal_fps - 1))
 
     # To use for drop frame compensation
     total_minutes = int(hours) * 60 + int(minutes)
 
+    return total_minutes, int(seconds), frames
+
+
+def from_timecode(timecode_str, rate):
+    """Convert a timecode string into a RationalTime.
+
+    :param timecode_str: (:class:`str`) A colon-delimited timecode.
+    :param rate: (:class:`float`) The frame-rate to calculate timecode in
+        terms of.
+
+    :return: (:class:`RationalTime`) Instance for the timecode provided.
+    """
+
+    info = _timecode_rate_info(rate)
+    total_minutes, seconds, frames = _timecode_fields(timecode_str, rate, info)
+
     # convert to frames
     value = (
-        ((total_minutes * 60) + int(seconds)) * nominal_fps + int(frames)) - \
-        (dropframes * (total_minutes - (total_minutes // 10)))
+        ((total_minutes * 60) + seconds) * info.nominal_fps + frames) - \
+        (info.dropframes * (total_minutes - (total_minutes // 10)))
 
     return RationalTime(value, rate)
 
 
-def to_timecode(time_obj, rate=None):
-    """Convert a RationalTime into a timecode string.
+def from_timecodes(timecode_strs, rate):
+    """Convert many timecode strings into RationalTimes.
 
-    :param time_obj: (:class:`RationalTime`) instance to express as timecode.
+    Equivalent to calling from_timecode() on each string, but the rate is
+    only validated once.
+
+    :param timecode_strs: (:class:`list`) Colon-delimited timecode strings.
     :param rate: (:class:`float`) The frame-rate to calculate timecode in
-        terms of. (Default time_obj.rate)
+        terms of.
 
-    :return: (:class:`str`) The timecode.
+    :return: (:class:`list`) of (:class:`RationalTime`), one per timecode.
     """
-    if time_obj is None:
-        return None
 
-    rate = rate or time_obj.rate
-
-    # Validate rate
-    validate_timecode_rate(rate)
-
-    # Check if rate is drop frame
-    rate_is_dropframe = rate in VALID_DROPFRAME_TIMECODE_RATES
-
-    if not rate_is_dropframe:
-        # Check for variantions of ~24 fps and convert to 24 for calculations
-        if round(rate) == 24:
-            rate = round(rate)
+    info = _timecode_rate_info(rate)
+    nominal_fps = info.nominal_fps
+    dropframes = info.dropframes
 
-    dropframes = 0
-    if rate_is_dropframe:
-        if rate == 29.97:
-            dropframes = 2
+    result = []
+    for timecode_str in timecode_strs:
+        total_minutes, seconds, frames = _timecode_fields(
+            timecode_str, rate, info
+        )
+        result.append(
+            RationalTime(
+                (((total_minutes * 60) + seconds) * nominal_fps + frames) -
+                (dropframes * (total_minutes - (total_minutes // 10))),
+                rate
+            )
+        )
 
-        elif rate == 59.94:
-            dropframes = 4
+    return result
 
-    # Number of frames in an hour
-    frames_per_hour = int(round(rate * 60 * 60))
-    # Number of frames in a day - timecode rolls over after 24 hours
-    frames_per_24_hours = frames_per_hour * 24
-    # Number of frames per ten minutes
-    frames_per_10_minutes = int(round(rate * 60 * 10))
-    # Number of frames per minute is the round of the framerate * 60 minus
-    # the number of dropped frames
-    frames_per_minute = int(round(rate) * 60) - dropframes
 
-    value = time_obj.value
+def _frames_in_day(value, info):
+    """Return value rolled over to a single day, with drop frames added, so
+    that it can be split into hours, minutes, seconds and frames at the
+    nominal rate.
+    """
 
     if value < 0:
         raise ValueError(
@@ -660,32 +792,148 @@ def to_timecode(time_obj, rate=None):
 
     # If frame_number is greater than 24 hrs, next operation will rollover
     # clock
-    value %= frames_per_24_hours
+    value %= info.frames_per_24_hours
 
-    if rate_is_dropframe:
-        d = value // frames_per_10_minutes
-        m = value % frames_per_10_minutes
+    if info.is_dropframe:
+        dropframes = info.dropframes
+        d = value // info.frames_per_10_minutes
+        m = value % info.frames_per_10_minutes
         if m > dropframes:
             value += (dropframes * 9 * d) + \
-                dropframes * ((m - dropframes) // frames_per_minute)
+                dropframes * ((m - dropframes) // info.frames_per_minute)
         else:
             value += dropframes * 9 * d
 
-    nominal_fps = int(math.ceil(rate))
+    return value
+
+
+def _formatted_timecode(hours, minutes, seconds, frames, is_dropframe):
+    return "".join(
+        (
+            _TWO_DIGITS[hours],
+            ":",
+            _TWO_DIGITS[minutes],
+            ":",
+            _TWO_DIGITS[seconds],
+            is_dropframe and ";" or ":",
+            _TWO_DIGITS[frames],
+        )
+    )
+
+
+def to_timecode(time_obj, rate=None):
+    """Convert a RationalTime into a timecode string.
+
+    :param time_obj: (:class:`RationalTime`) instance to express as timecode.
+    :param rate: (:class:`float`) The frame-rate to calculate timecode in
+        terms of. (Default time_obj.rate)
+
+    :return: (:class:`str`) The timecode.
+    """
+    if time_obj is None:
+        return None
+
+    rate = rate or time_obj.rate
+    info = _timecode_rate_info(rate)
+
+    value = _frames_in_day(time_obj.value, info)
+
+    nominal_fps = info.nominal_fps
 
     frames = value % nominal_fps
     seconds = (value // nominal_fps) % 60
     minutes = ((value // nominal_fps) // 60) % 60
     hours = (((value // nominal_fps) // 60) // 60)
 
-    tc = "{HH:02d}:{MM:02d}:{SS:02d}{div}{FF:02d}"
+    return _formatted_timecode(
+        int(hours),
+        int(minutes),
+        int(seconds),
+        int(frames),
+        info.is_dropframe
+    )
+
+
+def to_timecodes(values, rate):
+    """Convert many RationalTimes (or frame values) into timecode strings.
+
+    Equivalent to calling to_timecode(t, rate) on each time, but the rate
+    is only validated once, and the arithmetic is done with numpy for large
+    batches if it is available.  None is converted to None, as in
+    to_timecode().
+
+    :param values: (:class:`list`) of (:class:`RationalTime`) or numbers, or
+        a (:class:`RationalTimeArray`), to express as timecode.
+    :param rate: (:class:`float`) The frame-rate to calculate timecode in
+        terms of.
+
+    :return: (:class:`list`) of (:class:`str`), one per value.
+    """
+
+    info = _timecode_rate_info(rate)
+
+    if isinstance(values, RationalTimeArray):
+        values = values.value.tolist()
+    else:
+        values = [
+            v.value if isinstance(v, RationalTime) else v for v in values
+        ]
+
+    np = None
+    if len(values) >= _NUMPY_TIMECODE_BATCH_SIZE and None not in values:
+        np = _optional_numpy()
+
+    nominal_fps = info.nominal_fps
+
+    if np is None:
+        result = []
+        for value in values:
+            if value is None:
+                result.append(None)
+                continue
+
+            value = _frames_in_day(value, info)
+            total_seconds = value // nominal_fps
+            result.append(
+                _formatted_timecode(
+                    int(((total_seconds // 60) // 60)),
+                    int((total_seconds // 60) % 60),
+                    int(total_seconds % 60),
+                    int(value % nominal_fps),
+                    info.is_dropframe
+                )
+            )
+        return result
+
+    value = np.asarray(values)
+    if (value < 0).any():
+        raise ValueError(
+            "Negative values are not supported for converting to timecode.")
+
+    value = value % info.frames_per_24_hours
+
+    if info.is_dropframe:
+        dropframes = info.dropframes
+        d = value // info.frames_per_10_minutes
+        m = value % info.frames_per_10_minutes
+        value = value + np.where(
+            m > dropframes,
+            (dropframes * 9 * d) +
+            dropframes * ((m - dropframes) // info.frames_per_minute),
+            dropframes * 9 * d
+        )
 
-    return tc.format(
-        HH=int(hours),
-        MM=int(minutes),
-        SS=int(seconds),
-        div=rate_is_dropframe and ";" or ":",
-        FF=int(frames))
+    total_seconds = value // nominal_fps
+
+    return [
+        _formatted_timecode(hours, minutes, seconds, frames, info.is_dropframe)
+        for hours, minutes, seconds, frames in zip(
+            ((total_seconds // 60) // 60).astype(np.int64).tolist(),
+            ((total_seconds // 60) % 60).astype(np.int64).tolist(),
+            (total_seconds % 60).astype(np.int64).tolist(),
+            (value % nominal_fps).astype(np.int64).tolist(),
+        )
+    ]
 
 
 def from_time_string(time_str, rate):
@@ -803,3 +1051,357 @@ def range_from_start_end_time(start_time, end_time_exclusive):
         start_time,
         duration=duration_from_start_end_time(start_time, end_time_exclusive)
     )
+
+
+# @{ Vectorized time types
+#
+# RationalTimeArray and TimeRangeArray hold many times in contiguous NumPy
+# arrays so that they can be operated on in bulk.
+
+
+def _rates_of(thing):
+    """Return the rate(s) of a number, RationalTime or RationalTimeArray."""
+
+    if isinstance(thing, (RationalTime, RationalTimeArray)):
+        return thing.rate
+    return thing
+
+
+class RationalTimeArray(object):
+    """An array of RationalTimes, stored as a NumPy array of values and a
+    NumPy array of rates.
+
+    Supports the same arithmetic and comparisons as RationalTime, applied
+    element-wise.  Operands may be another RationalTimeArray of the same
+    length or a single RationalTime, which is broadcast (the array must be
+    the left hand operand).  Comparisons return NumPy arrays of booleans.
+
+    >>> times = RationalTimeArray.from_times(clip_start_times)
+    >>> frames = (times + offset).to_frames(24)
+    """
+
+    def __init__(self, value=(), rate=1):
+        np = _numpy()
+        self.value = np.asarray(value)
+        self.rate = np.broadcast_to(
+            np.asarray(rate, dtype=float),
+            self.value.shape
+        ).copy()
+
+    @classmethod
+    def from_times(cls, times):
+        """Construct from a list of RationalTime."""
+
+        return cls(
+            [t.value for t in times],
+            [t.rate for t in times]
+        )
+
+    def to_times(self):
+        """Return a list of RationalTime."""
+
+        return [
+            RationalTime(value, rate)
+            for value, rate in zip(self.value.tolist(), self.rate.tolist())
+        ]
+
+    def __len__(self):
+        return len(self.value)
+
+    def __iter__(self):
+        return iter(self.to_times())
+
+    def __getitem__(self, key):
+        value = self.value[key]
+        rate = self.rate[key]
+        if value.ndim == 0:
+            return RationalTime(value.item(), rate.item())
+
+        return RationalTimeArray(value, rate)
+
+    def __copy__(self, memodict=None):
+        return RationalTimeArray(self.value.copy(), self.rate)
+
+    __deepcopy__ = __copy__
+
+    def rescaled_to(self, new_rate):
+        """Returns the times converted to new_rate (a number, RationalTime or
+        array of rates).
+        """
+
+        new_rate = _rates_of(new_rate)
+
+        return RationalTimeArray(
+            self.value_rescaled_to(new_rate),
+            new_rate
+        )
+
+    def value_rescaled_to(self, new_rate):
+        """Returns the time values converted to new_rate as a NumPy array."""
+
+        np = _numpy()
+        new_rate = _rates_of(new_rate)
+
+        return np.where(
+            self.rate == new_rate,
+            self.value,
+            (self.value * np.asarray(new_rate, dtype=float)) / self.rate
+        )
+
+    def _aligned_with(self, other):
+        """Return (self_values, other_values, rate), with both sets of values
+        expressed in the faster of the two rates, element-wise.
+        """
+
+        if not isinstance(other, (RationalTime, RationalTimeArray)):
+            raise TypeError(
+                "RationalTimeArray may only be combined with RationalTime or "
+                "RationalTimeArray, not {}.".format(type(other))
+            )
+
+        scale = _numpy().maximum(self.rate, other.rate)
+        if isinstance(other, RationalTime):
+            other = RationalTimeArray(
+                _numpy().full(self.value.shape, other.value),
+                other.rate
+            )
+
+        return (
+            self.value_rescaled_to(scale),
+            other.value_rescaled_to(scale),
+            scale
+        )
+
+    def __add__(self, other):
+        """Element-wise sum.  As with RationalTime, each result has the rate
+        of the faster of the two times.
+        """
+
+        lhs, rhs, scale = self._aligned_with(other)
+        return RationalTimeArray(lhs + rhs, scale)
+
+    def __sub__(self, other):
+        lhs, rhs, scale = self._aligned_with(other)
+        return RationalTimeArray(lhs - rhs, scale)
+
+    def _comparable_floats(self, other):
+        if not isinstance(other, (RationalTime, RationalTimeArray)):
+            raise TypeError(
+                "RationalTimeArray can only be compared to RationalTime or "
+                "RationalTimeArray, not {}".format(type(other))
+            )
+
+        np = _numpy()
+        return (
+            self.value / self.rate,
+            np.asarray(other.value, dtype=float) / other.rate
+        )
+
+    def __gt__(self, other):
+        f_self, f_other = self._comparable_floats(other)
+        return f_self > f_other
+
+    def __lt__(self, other):
+        f_self, f_other = self._comparable_floats(other)
+        return f_self < f_other
+
+    def __le__(self, other):
+        f_self, f_other = self._comparable_floats(other)
+        return f_self <= f_other
+
+    def __ge__(self, other):
+        f_self, f_other = self._comparable_floats(other)
+        return f_self >= f_other
+
+    def __eq__(self, other):
+        if not isinstance(other, (RationalTime, RationalTimeArray)):
+            return False
+        return self.value_rescaled_to(other.rate) == other.value
+
+    def __ne__(self, other):
+        if not isinstance(other, (RationalTime, RationalTimeArray)):
+            return True
+        return self.value_rescaled_to(other.rate) != other.value
+
+    # arrays of times are mutable, and compare element-wise
+    __hash__ = None
+
+    def to_frames(self, fps=None):
+        """Return the frame numbers as a NumPy array of ints."""
+
+        np = _numpy()
+        value = self.value
+        if fps:
+            value = self.value_rescaled_to(fps)
+
+        return np.trunc(value).astype(np.int64)
+
+    def to_seconds(self):
+        """Return the times in seconds as a NumPy array of floats."""
+
+        return self.value_rescaled_to(1)
+
+    def __repr__(self):
+        return (
+            "otio.opentime.RationalTimeArray(value={}, rate={})".format(
+                repr(self.value.tolist()),
+                repr(self.rate.tolist()),
+            )
+        )
+
+    def __str__(self):
+        return "RationalTimeArray({}, {})".format(
+            str(self.value.tolist()),
+            str(self.rate.tolist())
+        )
+
+
+class TimeRangeArray(object):
+    """An array of TimeRanges, stored as a RationalTimeArray of start times
+    and a RationalTimeArray of durations.
+
+    Supports the same queries as TimeRange, applied element-wise and
+    returning NumPy arrays of booleans.  The other operand may be a single
+    RationalTime or TimeRange (which is broadcast) or an array of the same
+    length.
+    """
+
+    def __init__(self, start_time=None, duration=None):
+        if start_time is None:
+            start_time = RationalTimeArray()
+        if duration is None:
+            duration = RationalTimeArray(
+                _numpy().zeros(len(start_time)),
+                start_time.rate
+            )
+
+        if len(start_time) != len(duration):
+            raise ValueError(
+                "start_time and duration must have the same length, not "
+                "{} and {}".format(len(start_time), len(duration))
+            )
+        if (duration.value < 0).any():
+            raise TypeError("durations must all have value >= 0")
+
+        self.start_time = start_time
+        self.duration = duration
+
+    @classmethod
+    def from_ranges(cls, ranges):
+        """Construct from a list of TimeRange."""
+
+        return cls(
+            RationalTimeArray.from_times([tr.start_time for tr in ranges]),
+            RationalTimeArray.from_times([tr.duration for tr in ranges])
+        )
+
+    def to_ranges(self):
+        """Return a list of TimeRange."""
+
+        return [
+            TimeRange(start_time, duration)
+            for start_time, duration in zip(
+                self.start_time.to_times(),
+                self.duration.to_times()
+            )
+        ]
+
+    def __len__(self):
+        return len(self.start_time)
+
+    def __iter__(self):
+        return iter(self.to_ranges())
+
+    def __getitem__(self, key):
+        start_time = self.start_time[key]
+        duration = self.duration[key]
+        if isinstance(start_time, RationalTime):
+            return TimeRange(start_time, duration)
+
+        return TimeRangeArray(start_time, duration)
+
+    def __copy__(self, memodict=None):
+        return TimeRangeArray(
+            copy.copy(self.start_time),
+            copy.copy(self.duration)
+        )
+
+    __deepcopy__ = __copy__
+
+    def end_time_exclusive(self):
+        """Time of the first sample outside each range."""
+
+        return self.duration + self.start_time.rescaled_to(self.duration)
+
+    def contains(self, other):
+        """Return whether each range completely contains other.
+
+        (RationalTime, RationalTimeArray, TimeRange or TimeRangeArray)
+        """
+
+        if isinstance(other, (RationalTime, RationalTimeArray)):
+            return (
+                (self.start_time <= other) &
+                (self.end_time_exclusive() > other)
+            )
+        elif isinstance(other, (TimeRange, TimeRangeArray)):
+            return (
+                (self.start_time <= other.start_time) &
+                (self.end_time_exclusive() >= other.end_time_exclusive())
+            )
+        raise TypeError(
+            "contains only accepts on otio.opentime.RationalTime, "
+            "RationalTimeArray, TimeRange or TimeRangeArray, not {}".format(
+                type(other)
+            )
+        )
+
+    def overlaps(self, other):
+        """Return whether each range overlaps any part of other.
+
+        (RationalTime, RationalTimeArray, TimeRange or TimeRangeArray)
+        """
+
+        if isinstance(other, (RationalTime, RationalTimeArray)):
+            return self.contains(other)
+        elif isinstance(other, (TimeRange, TimeRangeArray)):
+            return (
+                (self.start_time < other.end_time_exclusive()) &
+                (self.end_time_exclusive() > other.start_time)
+            )
+        raise TypeError(
+            "overlaps only accepts on otio.opentime.RationalTime, "
+            "RationalTimeArray, TimeRange or TimeRangeArray, not {}".format(
+                type(other)
+            )
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, (TimeRange, TimeRangeArray)):
+            return False
+        return (
+            (self.start_time == other.start_time) &
+            (self.duration == other.duration)
+        )
+
+    def __ne__(self, other):
+        if not isinstance(other, (TimeRange, TimeRangeArray)):
+            return True
+        return ~(self == other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return (
+            "otio.opentime.TimeRangeArray(start_time={}, duration={})".format(
+                repr(self.start_time),
+                repr(self.duration),
+            )
+        )
+
+    def __str__(self):
+        return "TimeRangeArray({}, {})".format(
+            str(self.start_time),
+            str(self.duration),
+        )
+# @}
@@ -88,6 +88,9 @@ class Clip(core.Item):
             val = missing_reference.MissingReference()
         self._media_reference = val
 
+        # the available range of the clip comes from its media reference
+        self._invalidate_parent_ranges()
+
     def available_range(self):
         if not self.media_reference:
             raise exceptions.CannotComputeAvailableRangeError(
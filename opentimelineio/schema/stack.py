@@ -76,7 +76,7 @@ class Stack(core.Composition):
     def each_clip(self, search_range=None):
         return self.each_child(search_range, clip.Clip)
 
-    def available_range(self):
+    def _computed_available_range(self):
         if len(self) == 0:
             return opentime.TimeRange()
 
@@ -24,6 +24,7 @@
 
 """Implement Track sublcass of composition."""
 
+import bisect
 import collections
 
 from .. import (
@@ -65,6 +66,13 @@ class Track(core.Composition):
         effects=None,
         metadata=None,
     ):
+        # start time of each child, built lazily by _start_time_of_child()
+        self._child_start_times = None
+
+        # search bounds over the child ranges, built lazily by
+        # _child_range_bounds()
+        self._child_range_bounds_cache = None
+
         core.Composition.__init__(
             self,
             name=name,
@@ -81,21 +89,121 @@ class Track(core.Composition):
         doc="Composition kind (Stack, Track)"
     )
 
+    def _invalidate_cached_ranges(self):
+        self._child_start_times = None
+        self._child_range_bounds_cache = None
+        super(Track, self)._invalidate_cached_ranges()
+
+    def _start_time_of_child(self, index):
+        """Sum of the durations of all the children leading up to the child at
+        index, or None if there are none.
+
+        The running sums are computed for every child at once and cached
+        until the children change, so that looking up the range of each child
+        in turn is linear rather than quadratic in the length of the track.
+        """
+
+        if self._child_start_times is None:
+            start_times = []
+            running_sum = None
+            for child in self._children:
+                start_times.append(running_sum)
+                if child.overlapping():
+                    continue
+                if running_sum is None:
+                    running_sum = child.duration()
+                else:
+                    running_sum = running_sum + child.duration()
+            self._child_start_times = start_times
+
+        return self._child_start_times[index]
+
     def range_of_child_at_index(self, index):
         child = self[index]
+        child_duration = child.duration()
 
         # sum the durations of all the children leading up to the chosen one
-        start_time = sum(
-            (
-                o_c.duration()
-                for o_c in (c for c in self[:index] if not c.overlapping())
-            ),
-            opentime.RationalTime(value=0, rate=child.duration().rate)
-        )
+        start_time = opentime.RationalTime(value=0, rate=child_duration.rate)
+        preceding_duration = self._start_time_of_child(index)
+        if preceding_duration is not None:
+            start_time = start_time + preceding_duration
         if isinstance(child, transition.Transition):
             start_time -= child.in_offset
 
-        return opentime.TimeRange(start_time, child.duration())
+        return opentime.TimeRange(start_time, child_duration)
+
+    def _child_range_bounds(self):
+        """Return a tuple of two lists, (max_end_times, min_start_times),
+        that can be bisected to find the children overlapping a time.
+
+        max_end_times[i] is the latest end time of children[:i + 1] and
+        min_start_times[i] is the earliest start time of children[i:], both
+        as the floats RationalTime uses for comparison.  Both lists are
+        sorted even though Transitions reach back before their start.
+        """
+
+        if self._child_range_bounds_cache is None:
+            end_times = []
+            start_times = []
+            for index in range(len(self._children)):
+                child_range = self.range_of_child_at_index(index)
+                start_times.append(_comparable_float(child_range.start_time))
+                end_times.append(
+                    _comparable_float(child_range.end_time_exclusive())
+                )
+
+            max_end_times = []
+            for end_time in end_times:
+                if max_end_times:
+                    end_time = max(end_time, max_end_times[-1])
+                max_end_times.append(end_time)
+
+            min_start_times = []
+            for start_time in reversed(start_times):
+                if min_start_times:
+                    start_time = min(start_time, min_start_times[-1])
+                min_start_times.append(start_time)
+            min_start_times.reverse()
+
+            self._child_range_bounds_cache = (max_end_times, min_start_times)
+
+        return self._child_range_bounds_cache
+
+    def children_in_range(self, search_range):
+        """Return the children whose range overlaps search_range.
+
+        Children of a Track are ordered in time, so rather than testing the
+        range of every child, the candidates are found by bisecting the cached
+        child ranges.
+        """
+
+        max_end_times, min_start_times = self._child_range_bounds()
+        first = bisect.bisect_right(
+            max_end_times,
+            _comparable_float(search_range.start_time)
+        )
+        last = bisect.bisect_left(
+            min_start_times,
+            _comparable_float(search_range.end_time_exclusive())
+        )
+
+        return [
+            self._children[index] for index in range(first, last)
+            if self.range_of_child_at_index(index).overlaps(search_range)
+        ]
+
+    def children_at_time(self, t):
+        """ Which children overlap time t? """
+
+        max_end_times, min_start_times = self._child_range_bounds()
+        t_float = _comparable_float(t)
+        first = bisect.bisect_right(max_end_times, t_float)
+        last = bisect.bisect_right(min_start_times, t_float)
+
+        return [
+            self._children[index] for index in range(first, last)
+            if self.range_of_child_at_index(index).contains(t)
+        ]
 
     def trimmed_range_of_child_at_index(self, index, reference_space=None):
         child_range = self.range_of_child_at_index(index)
@@ -126,7 +234,7 @@ class Track(core.Composition):
 
         return head, tail
 
-    def available_range(self):
+    def _computed_available_range(self):
         # Sum up our child items' durations
         duration = sum(
             (c.duration() for c in self if isinstance(c, core.Item)),
@@ -237,6 +345,12 @@ class Track(core.Composition):
         return result_map
 
 
+def _comparable_float(rt):
+    """The float used to compare rt with other RationalTimes."""
+
+    return float(rt.value) / rt.rate
+
+
 # the original name for "track" was "sequence" - this will turn "Sequence"
 # found in OTIO files into Track automatically.
 core.register_type(Track, "Sequence")
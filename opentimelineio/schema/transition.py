@@ -93,17 +93,39 @@ class Transition(core.Composable):
     #     "parameters",
     #     doc="Parameters of the transition."
     # )
-    in_offset = core.serializable_field(
+    _in_offset = core.serializable_field(
         "in_offset",
         required_type=opentime.RationalTime,
         doc="Amount of the previous clip this transition overlaps, exclusive."
     )
-    out_offset = core.serializable_field(
+    _out_offset = core.serializable_field(
         "out_offset",
         required_type=opentime.RationalTime,
         doc="Amount of the next clip this transition overlaps, exclusive."
     )
 
+    @property
+    def in_offset(self):
+        """Amount of the previous clip this transition overlaps, exclusive."""
+
+        return self._in_offset
+
+    @in_offset.setter
+    def in_offset(self, val):
+        self._in_offset = val
+        self._invalidate_parent_ranges()
+
+    @property
+    def out_offset(self):
+        """Amount of the next clip this transition overlaps, exclusive."""
+
+        return self._out_offset
+
+    @out_offset.setter
+    def out_offset(self, val):
+        self._out_offset = val
+        self._invalidate_parent_ranges()
+
     def __str__(self):
         return 'Transition("{}", "{}", {}, {}, {})'.format(
             self.name,
@@ -49,4 +49,12 @@ class OTIOAssertions(object):
     def assertIsOTIOEquivalentTo(self, known, test_result):
         """Test using the 'is equivalent to' method on SerializableObject"""
 
-        self.assertTrue(known.is_equivalent_to(test_result))
+        difference = known.first_difference(test_result)
+        if difference is not None:
+            self.fail(
+                "{} differs from {} at {}".format(
+                    known,
+                    test_result,
+                    difference
+                )
+            )
@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+#
+# Copyright 2018 Pixar Animation Studios
+#
+# Licensed under the Apache License, Version 2.0 (the "Apache License")
+# with the following modification; you may not use this file except in
+# compliance with the Apache License and the following modification to it:
+# Section 6. Trademarks. is deleted and replaced with:
+#
+# 6. Trademarks. This License does not grant permission to use the trade
+#    names, trademarks, service marks, or product names of the Licensor
+#    and its affiliates, except as required to comply with Section 4(c) of
+#    the License and to reproduce the content of the NOTICE file.
+#
+# You may obtain a copy of the Apache License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the Apache License with the above modification is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied. See the Apache License for the specific
+# language governing permissions and limitations under the Apache License.
+#
+
+"""Test harness for the batch algorithms."""
+
+import unittest
+
+import opentimelineio as otio
+
+
+def _no_gaps(thing):
+    if isinstance(thing, otio.schema.Gap):
+        return None
+    return thing
+
+
+def _no_timelines(thing):
+    if isinstance(thing, otio.schema.Timeline):
+        return None
+    return thing
+
+
+def _timeline(name, clip_count):
+    tl = otio.schema.Timeline(name=name)
+    for track_index in range(2):
+        tr = otio.schema.Track(name='track{}'.format(track_index))
+        for clip_index in range(clip_count):
+            duration = otio.opentime.RationalTime(10 + clip_index, 24)
+            if (clip_index + track_index) % 3:
+                tr.append(
+                    otio.schema.Clip(
+                        name='{}_cl{}'.format(tr.name, clip_index),
+                        source_range=otio.opentime.TimeRange(
+                            duration=duration
+                        )
+                    )
+                )
+            else:
+                tr.append(
+                    otio.schema.Gap(
+                        source_range=otio.opentime.TimeRange(
+                            duration=duration
+                        )
+                    )
+                )
+        tl.tracks.append(tr)
+
+    return tl
+
+
+class BatchTest(unittest.TestCase, otio.test_utils.OTIOAssertions):
+    maxDiff = None
+
+    def setUp(self):
+        self.collection = otio.schema.SerializableCollection(
+            children=[_timeline('tl{}'.format(i), 4 + i) for i in range(4)]
+        )
+
+    def test_flattened_stacks(self):
+        stacks = [tl.tracks for tl in self.collection]
+        expected = [otio.algorithms.flatten_stack(st) for st in stacks]
+
+        for max_workers in (1, 2):
+            result = otio.algorithms.flattened_stacks(
+                stacks,
+                max_workers=max_workers
+            )
+            self.assertEqual(len(result), len(expected))
+            for flat_track, expected_track in zip(result, expected):
+                self.assertJsonEqual(flat_track, expected_track)
+
+    def test_flattened_lists_of_tracks(self):
+        tracks = [tl.video_tracks() for tl in self.collection]
+
+        result = otio.algorithms.flattened_stacks(tracks, max_workers=2)
+        self.assertJsonEqual(
+            result[-1],
+            otio.algorithms.flatten_stack(tracks[-1])
+        )
+
+    def test_filtered_compositions(self):
+        expected = [
+            otio.algorithms.filtered_composition(tl, _no_gaps)
+            for tl in self.collection
+        ]
+
+        for max_workers in (1, 2):
+            result = otio.algorithms.filtered_compositions(
+                self.collection,
+                _no_gaps,
+                max_workers=max_workers
+            )
+            self.assertEqual(len(result), len(expected))
+            for filtered, expected_timeline in zip(result, expected):
+                self.assertJsonEqual(filtered, expected_timeline)
+
+        # the originals are left alone
+        self.assertIsInstance(
+            self.collection[0].tracks[0][0],
+            otio.schema.Gap
+        )
+
+    def test_filtered_compositions_types_to_prune(self):
+        result = otio.algorithms.filtered_compositions(
+            self.collection,
+            _no_timelines,
+            types_to_prune=(otio.schema.Clip,),
+            max_workers=2
+        )
+        self.assertEqual(result, [None] * len(self.collection))
+
+        result = otio.algorithms.filtered_compositions(
+            [tl.tracks for tl in self.collection],
+            _no_timelines,
+            types_to_prune=(otio.schema.Clip,),
+            max_workers=2
+        )
+        for tracks in result:
+            self.assertEqual(
+                list(tracks.each_clip()),
+                []
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -98,6 +98,70 @@ class BuiltInAdapterTest(unittest.TestCase, otio.test_utils.OTIOAssertions):
         test_str = otio.adapters.write_to_string(tl)
         self.assertJsonEqual(tl, otio.adapters.read_from_string(test_str))
 
+    def test_otio_json_compressed(self):
+        tl = otio.adapters.read_from_file(SCREENING_EXAMPLE_PATH)
+        baseline_json = otio.adapters.write_to_string(tl, 'otio_json')
+
+        temp_dir = tempfile.mkdtemp(prefix='test_otio_adapter')
+        suffixes = ['gz', 'bz2']
+        if otio_json.lzma is not None:
+            suffixes.append('xz')
+
+        for suffix in suffixes:
+            temp_file = os.path.join(temp_dir, 'test.otio.' + suffix)
+            self.assertEqual(
+                otio.adapters.from_filepath(temp_file).name,
+                'otio_json'
+            )
+            otio.adapters.write_to_file(tl, temp_file)
+
+            compressed_type = otio_json._COMPRESSED_FILE_TYPES[suffix]
+            with compressed_type(temp_file, 'rb') as fo:
+                self.assertEqual(fo.read().decode('utf-8'), baseline_json)
+            self.assertLess(
+                os.path.getsize(temp_file) * 5,
+                len(baseline_json)
+            )
+
+            new = otio.adapters.read_from_file(temp_file)
+            self.assertMultiLineEqual(
+                otio.adapters.write_to_string(new, 'otio_json'),
+                baseline_json
+            )
+
+            # compressed files are recognized by their contents
+            renamed_file = os.path.join(temp_dir, 'renamed.otio')
+            os.rename(temp_file, renamed_file)
+            new = otio.adapters.read_from_file(renamed_file)
+            self.assertIsOTIOEquivalentTo(tl, new)
+            os.remove(renamed_file)
+
+        os.rmdir(temp_dir)
+
+    def test_otio_json_xz_without_lzma(self):
+        tl = otio.adapters.read_from_file(SCREENING_EXAMPLE_PATH)
+        temp_dir = tempfile.mkdtemp(prefix='test_otio_adapter')
+        temp_file = os.path.join(temp_dir, 'test.otio.xz')
+
+        # the module the adapter was loaded as, rather than otio_json
+        module = otio.adapters.from_name('otio_json').module()
+        lzma = module.lzma
+        module.lzma = None
+        try:
+            with self.assertRaises(otio.exceptions.WritingNotSupportedError):
+                otio.adapters.write_to_file(tl, temp_file)
+            self.assertFalse(os.path.exists(temp_file))
+
+            with open(temp_file, 'wb') as fo:
+                fo.write(module._XZ_MAGIC + b"\x00" * 32)
+            with self.assertRaises(otio.exceptions.ReadingNotSupportedError):
+                otio.adapters.read_from_file(temp_file)
+        finally:
+            module.lzma = lzma
+
+        os.remove(temp_file)
+        os.rmdir(temp_dir)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -23,6 +23,7 @@
 # language governing permissions and limitations under the Apache License.
 #
 
+import gc
 import unittest
 import os
 import copy
@@ -33,6 +34,16 @@ SAMPLE_DATA_DIR = os.path.join(os.path.dirname(__file__), "sample_data")
 TRANSITION_EXAMPLE_PATH = os.path.join(SAMPLE_DATA_DIR, "transition_test.otio")
 
 
+def _clip(name, duration, start=0):
+    return otio.schema.Clip(
+        name=name,
+        source_range=otio.opentime.TimeRange(
+            otio.opentime.RationalTime(start, 24),
+            otio.opentime.RationalTime(duration, 24)
+        )
+    )
+
+
 class CompositionTests(unittest.TestCase, otio.test_utils.OTIOAssertions):
 
     def test_cons(self):
@@ -186,6 +197,177 @@ class CompositionTests(unittest.TestCase, otio.test_utils.OTIOAssertions):
             all_children
         )
 
+    def test_copy_on_write(self):
+        tr1 = otio.schema.Track(
+            name="tr1",
+            children=[otio.schema.Clip(name="c1"), otio.schema.Clip(name="c2")]
+        )
+        tr2 = otio.schema.Track(
+            name="tr2",
+            children=[otio.schema.Clip(name="c3")]
+        )
+        tl = otio.schema.Timeline(
+            tracks=[tr1, tr2],
+            metadata={"foo": "bar"}
+        )
+
+        copied = tl.copy_on_write()
+        self.assertIsOTIOEquivalentTo(tl, copied)
+        self.assertIsNot(copied.metadata, tl.metadata)
+
+        # until they are accessed, the tracks are shared with the original
+        self.assertIs(copied.tracks.data["children"], tl.tracks.data["children"])
+
+        # ...then they are copied a level at a time
+        copied_tr1 = copied.tracks[0]
+        self.assertIsNot(copied_tr1, tr1)
+        self.assertIs(copied_tr1.parent(), copied.tracks)
+        self.assertIs(copied_tr1.data["children"], tr1.data["children"])
+        self.assertIn(copied_tr1, copied.tracks)
+        self.assertEqual(copied.tracks.index(copied_tr1), 0)
+
+        copied_tr1[0].name = "c1 copy"
+        self.assertEqual(tr1[0].name, "c1")
+        self.assertIs(tr1[0].parent(), tr1)
+        self.assertIs(copied_tr1[0].parent(), copied_tr1)
+
+        # writing to the original makes the copies sharing it copy it first
+        copied_again = tl.copy_on_write()
+        tr2[0].name = "c3 edited"
+        tr2.append(otio.schema.Clip(name="c4"))
+        self.assertEqual(
+            [c.name for c in copied_again.each_clip()],
+            ["c1", "c2", "c3"]
+        )
+        self.assertEqual(
+            [c.name for c in copied.each_clip()],
+            ["c1 copy", "c2", "c3"]
+        )
+        self.assertEqual(
+            [c.name for c in tl.each_clip()],
+            ["c1", "c2", "c3 edited", "c4"]
+        )
+
+        # as do copies of copies
+        copied_twice = copied.copy_on_write()
+        self.assertIsOTIOEquivalentTo(copied, copied_twice)
+        del copied_tr1[1]
+        self.assertEqual(
+            [c.name for c in copied_twice.each_clip()],
+            ["c1 copy", "c2", "c3"]
+        )
+
+    def test_copy_on_write_of_empty_copy(self):
+        tr = otio.schema.Track(name="tr")
+        copied = tr.copy_on_write()
+        copied_twice = copied.copy_on_write()
+        self.assertTrue(tr._copies_on_write_exist)
+
+        tr.append(otio.schema.Clip(name="c1"))
+        self.assertEqual(copied_twice.data["children"], [])
+        self.assertEqual(len(copied_twice), 0)
+        self.assertEqual(len(copied), 0)
+
+        # once no copy shares anything, writes stop looking for them
+        del copied, copied_twice
+        gc.collect()
+        self.assertFalse(tr._copies_on_write_exist)
+
+    def test_content_hash(self):
+        tr = otio.schema.Track(
+            name="tr",
+            children=[
+                otio.schema.Clip(
+                    name="c1",
+                    metadata={"foo": [1, 2]},
+                    source_range=otio.opentime.TimeRange(
+                        otio.opentime.RationalTime(0, 24),
+                        otio.opentime.RationalTime(10, 24)
+                    )
+                ),
+                otio.schema.Clip(name="c2")
+            ]
+        )
+        tl = otio.schema.Timeline(tracks=[tr])
+
+        copied = copy.deepcopy(tl)
+        self.assertEqual(tl.content_hash(), copied.content_hash())
+
+        # equivalent values hash the same
+        copied.tracks[0][0].name = u"c1"
+        copied.tracks[0][0].metadata = {u"foo": (1.0, 2)}
+        copied.tracks[0][0].source_range = otio.opentime.TimeRange(
+            otio.opentime.RationalTime(0.0, 24.0),
+            otio.opentime.RationalTime(10.0, 24)
+        )
+        self.assertEqual(tl.content_hash(), copied.content_hash())
+
+        track_hash = tr.content_hash()
+        tr[1].name = "c2 edited"
+        self.assertNotEqual(tl.content_hash(), copied.content_hash())
+        self.assertNotEqual(tr.content_hash(), track_hash)
+
+        copied.tracks[0][1].name = "c2 edited"
+        self.assertEqual(tl.content_hash(), copied.content_hash())
+
+        del tr[0]
+        self.assertNotEqual(tl.content_hash(), copied.content_hash())
+        tr.insert(0, copy.deepcopy(copied.tracks[0][0]))
+        self.assertEqual(tl.content_hash(), copied.content_hash())
+
+        self.assertNotEqual(
+            otio.schema.Track().content_hash(),
+            otio.schema.Stack().content_hash()
+        )
+
+    def test_content_hash_of_edits_in_place(self):
+        cl = otio.schema.Clip(
+            name="c1",
+            source_range=otio.opentime.TimeRange(
+                duration=otio.opentime.RationalTime(10, 24)
+            ),
+            media_reference=otio.schema.ExternalReference(
+                target_url="/var/tmp/c1.mov"
+            )
+        )
+        tr = otio.schema.Track(name="tr", children=[cl])
+        track_hash = tr.content_hash()
+
+        cl.metadata["foo"] = 1
+        metadata_hash = tr.content_hash()
+        self.assertNotEqual(metadata_hash, track_hash)
+
+        cl.source_range.duration.value = 20
+        duration_hash = tr.content_hash()
+        self.assertNotEqual(duration_hash, metadata_hash)
+
+        cl.media_reference.target_url = "/var/tmp/c1_relinked.mov"
+        self.assertNotEqual(tr.content_hash(), duration_hash)
+
+    def test_content_hash_memo(self):
+        tr = otio.schema.Track(
+            name="tr",
+            children=[
+                otio.schema.Clip(name="c1"),
+                otio.schema.Clip(name="c2")
+            ]
+        )
+
+        hashes = {}
+        track_hash = tr.content_hash(hashes)
+        self.assertEqual(track_hash, tr.content_hash())
+        self.assertEqual(hashes[tr], track_hash)
+        self.assertEqual(hashes[tr[0]], tr[0].content_hash())
+
+        # the hashes in the memo are used as they are, even after edits
+        tr[0].name = "c1 edited"
+        self.assertEqual(tr.content_hash(hashes), track_hash)
+        self.assertNotEqual(tr.content_hash(), track_hash)
+
+        del hashes[tr]
+        del hashes[tr[0]]
+        self.assertEqual(tr.content_hash(hashes), tr.content_hash())
+
 
 class StackTest(unittest.TestCase, otio.test_utils.OTIOAssertions):
 
@@ -1109,6 +1291,87 @@ class TrackTest(unittest.TestCase, otio.test_utils.OTIOAssertions):
             otio.opentime.RationalTime(150, 24)
         )
 
+    def test_transformed_times(self):
+        inner = otio.schema.Track(
+            name="inner",
+            children=[_clip("A", 10, start=100), _clip("B", 20, start=200)]
+        )
+        outer = otio.schema.Track(
+            name="outer",
+            children=[_clip("C", 30), inner]
+        )
+        other = otio.schema.Track(
+            name="other",
+            children=[_clip("D", 40, start=1000), _clip("E", 40, start=50)]
+        )
+        st = otio.schema.Stack(children=[outer, other])
+
+        clip_b = inner[1]
+        clip_e = other[1]
+        times = [otio.opentime.RationalTime(v, 24) for v in (200, 205, 219)]
+
+        # B starts at 40 in the stack with a source start of 200, E at 40 with
+        # a source start of 50
+        for from_item, to_item, expected in [
+            (clip_b, clip_e, (50, 55, 69)),
+            (clip_e, clip_b, (350, 355, 369)),
+            (clip_b, st, (40, 45, 59)),
+            (st, clip_b, (360, 365, 379)),
+            (clip_b, clip_b, (200, 205, 219)),
+            (clip_b, None, (200, 205, 219)),
+        ]:
+            expected = [otio.opentime.RationalTime(v, 24) for v in expected]
+            self.assertEqual(
+                from_item.transformed_times(times, to_item),
+                expected
+            )
+            self.assertEqual(
+                [from_item.transformed_time(t, to_item) for t in times],
+                expected
+            )
+
+            xform = from_item.time_transform_to(to_item)
+            self.assertEqual([xform.applied_to(t) for t in times], expected)
+
+        ranges = [
+            otio.opentime.TimeRange(t, otio.opentime.RationalTime(1, 24))
+            for t in times
+        ]
+        self.assertEqual(
+            clip_b.transformed_time_ranges(ranges, st),
+            [
+                otio.opentime.TimeRange(
+                    otio.opentime.RationalTime(v, 24),
+                    otio.opentime.RationalTime(1, 24)
+                )
+                for v in (40, 45, 59)
+            ]
+        )
+        self.assertEqual(
+            clip_b.time_transform_to(clip_b),
+            otio.opentime.TimeTransform()
+        )
+
+        # F, at 48 fps, starts at 40 / 48 in the stack with a source start of
+        # 400 / 48, so the offset from F to the stack is -360 / 48
+        clip_f = otio.schema.Clip(
+            name="F",
+            source_range=otio.opentime.TimeRange(
+                otio.opentime.RationalTime(400, 48),
+                otio.opentime.RationalTime(40, 48)
+            )
+        )
+        st.append(otio.schema.Track(children=[_clip("G", 20), clip_f]))
+        f_times = [otio.opentime.RationalTime(200, 24)]
+
+        transformed = clip_f.transformed_times(f_times, st)
+        self.assertEqual(transformed, [otio.opentime.RationalTime(40, 48)])
+        self.assertEqual(transformed[0].rate, 48)
+
+        applied = clip_f.time_transform_to(st).applied_to(f_times[0])
+        self.assertEqual(applied, otio.opentime.RationalTime(20, 24))
+        self.assertEqual(applied.rate, 24)
+
     def test_neighbors_of_simple(self):
         seq = otio.schema.Track()
         trans = otio.schema.Transition(
@@ -1224,6 +1487,119 @@ class TrackTest(unittest.TestCase, otio.test_utils.OTIOAssertions):
         track = otio.schema.Track()
         self.assertEqual(track.range_of_all_children(), {})
 
+    def test_range_of_child_at_index_after_edits(self):
+        def _start_values(track):
+            return [
+                track.range_of_child_at_index(i).start_time.value
+                for i in range(len(track))
+            ]
+
+        tr = otio.schema.Track(
+            children=[_clip("A", 10), _clip("B", 20), _clip("C", 30)]
+        )
+        self.assertEqual(_start_values(tr), [0, 10, 30])
+
+        tr.insert(1, _clip("D", 5))
+        self.assertEqual(_start_values(tr), [0, 10, 15, 35])
+
+        del tr[0]
+        self.assertEqual(_start_values(tr), [0, 5, 25])
+
+        tr[0] = _clip("E", 1)
+        self.assertEqual(_start_values(tr), [0, 1, 21])
+
+        tr[1:] = [_clip("F", 2), _clip("G", 3), _clip("H", 4)]
+        self.assertEqual(_start_values(tr), [0, 1, 3, 6])
+
+        tr[0].source_range = otio.opentime.TimeRange(
+            otio.opentime.RationalTime(0, 24),
+            otio.opentime.RationalTime(100, 24)
+        )
+        self.assertEqual(_start_values(tr), [0, 100, 102, 105])
+
+        # edits to a nested composition invalidate the ranges of its parent
+        nested = otio.schema.Track(children=[_clip("I", 7)])
+        outer = otio.schema.Track(children=[nested, _clip("J", 1)])
+        self.assertEqual(_start_values(outer), [0, 7])
+
+        nested.append(_clip("K", 3))
+        self.assertEqual(_start_values(outer), [0, 10])
+
+    def test_children_in_range(self):
+        trx = otio.schema.Transition(
+            name="T",
+            in_offset=otio.opentime.RationalTime(2, 24),
+            out_offset=otio.opentime.RationalTime(3, 24)
+        )
+        tr = otio.schema.Track(
+            children=[_clip("A", 10), trx, _clip("B", 10), _clip("C", 10)]
+        )
+
+        def _names(children):
+            return [c.name for c in children]
+
+        self.assertEqual(
+            _names(
+                tr.children_in_range(
+                    otio.opentime.TimeRange(
+                        otio.opentime.RationalTime(9, 24),
+                        otio.opentime.RationalTime(2, 24)
+                    )
+                )
+            ),
+            ["A", "T", "B"]
+        )
+        self.assertEqual(
+            _names(
+                tr.children_in_range(
+                    otio.opentime.TimeRange(
+                        otio.opentime.RationalTime(20, 24),
+                        otio.opentime.RationalTime(5, 24)
+                    )
+                )
+            ),
+            ["C"]
+        )
+        self.assertEqual(
+            tr.children_in_range(
+                otio.opentime.TimeRange(
+                    otio.opentime.RationalTime(30, 24),
+                    otio.opentime.RationalTime(5, 24)
+                )
+            ),
+            []
+        )
+
+        self.assertEqual(
+            _names(tr.children_at_time(otio.opentime.RationalTime(8, 24))),
+            ["A", "T"]
+        )
+        self.assertEqual(
+            _names(tr.children_at_time(otio.opentime.RationalTime(10, 24))),
+            ["T", "B"]
+        )
+        self.assertEqual(
+            _names(tr.children_at_time(otio.opentime.RationalTime(13, 24))),
+            ["B"]
+        )
+
+        tr.remove(trx)
+        self.assertEqual(
+            _names(tr.children_at_time(otio.opentime.RationalTime(8, 24))),
+            ["A"]
+        )
+        self.assertEqual(
+            _names(
+                tr.each_clip(
+                    otio.opentime.TimeRange(
+                        otio.opentime.RationalTime(15, 24),
+                        otio.opentime.RationalTime(10, 24)
+                    )
+                )
+            ),
+            ["B", "C"]
+        )
+
 
 class EdgeCases(unittest.TestCase):
 
@@ -1646,6 +2022,44 @@ class MembershipTest(unittest.TestCase, otio.test_utils.OTIOAssertions):
         tr.pop()
         self.assertNotIn(cl, tr)
 
+    def test_index_after_edits(self):
+        """Test that index() follows children as they are moved around."""
+        clips = [otio.schema.Clip(name=str(i)) for i in range(6)]
+        tr = otio.schema.Track(children=clips[:3])
+
+        for i, cl in enumerate(clips[:3]):
+            self.assertEqual(tr.index(cl), i)
+
+        tr.insert(0, clips[3])
+        self.assertEqual(tr.index(clips[0]), 1)
+        self.assertEqual(tr.index(clips[2]), 3)
+
+        del tr[1]
+        self.assertEqual(tr.index(clips[1]), 1)
+        with self.assertRaises(ValueError):
+            tr.index(clips[0])
+
+        tr[1:2] = [clips[4], clips[5]]
+        self.assertIn(clips[4], tr)
+        self.assertNotIn(clips[1], tr)
+        self.assertEqual(
+            [tr.index(cl) for cl in tr],
+            list(range(len(tr)))
+        )
+        self.assertEqual(tr.index(clips[2]), 3)
+
+        tr.remove(clips[4])
+        self.assertEqual(tr.index(clips[5]), 1)
+        self.assertEqual(tr.index(clips[5], 1, 2), 1)
+        with self.assertRaises(ValueError):
+            tr.index(clips[5], 2)
+
+        tr_copy = copy.deepcopy(tr)
+        self.assertEqual(
+            [tr_copy.index(cl) for cl in tr_copy],
+            list(range(len(tr_copy)))
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
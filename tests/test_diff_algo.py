@@ -0,0 +1,177 @@
+#
+# Copyright 2017 Pixar Animation Studios
+#
+# Licensed under the Apache License, Version 2.0 (the "Apache License")
+# with the following modification; you may not use this file except in
+# compliance with the Apache License and the following modification to it:
+# Section 6. Trademarks. is deleted and replaced with:
+#
+# 6. Trademarks. This License does not grant permission to use the trade
+#    names, trademarks, service marks, or product names of the Licensor
+#    and its affiliates, except as required to comply with Section 4(c) of
+#    the License and to reproduce the content of the NOTICE file.
+#
+# You may obtain a copy of the Apache License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the Apache License with the above modification is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied. See the Apache License for the specific
+# language governing permissions and limitations under the Apache License.
+#
+
+"""Test file for the diff algorithms."""
+
+import copy
+import unittest
+
+import opentimelineio as otio
+
+
+def _clip(name, duration=10, url=None):
+    return otio.schema.Clip(
+        name=name,
+        media_reference=otio.schema.ExternalReference(
+            target_url=url or name + ".mov"
+        ),
+        source_range=otio.opentime.TimeRange(
+            otio.opentime.RationalTime(0, 24),
+            otio.opentime.RationalTime(duration, 24)
+        )
+    )
+
+
+class DiffAlgoTests(unittest.TestCase, otio.test_utils.OTIOAssertions):
+    """ test harness for the diff algorithm """
+
+    def setUp(self):
+        self.before = otio.schema.Timeline(
+            tracks=[
+                otio.schema.Track(
+                    name="V1",
+                    children=[_clip(name) for name in "ABCDEFG"]
+                ),
+                otio.schema.Track(
+                    name="A1",
+                    kind=otio.schema.TrackKind.Audio,
+                    children=[_clip("music", 70)]
+                ),
+            ]
+        )
+        self.after = copy.deepcopy(self.before)
+
+    def _summary(self, edits):
+        return [
+            (
+                edit.kind,
+                edit.before.name if edit.before else None,
+                edit.after.name if edit.after else None
+            )
+            for edit in edits
+        ]
+
+    def test_no_changes(self):
+        self.assertEqual(otio.algorithms.diff(self.before, self.after), [])
+
+    def test_edits(self):
+        v1 = self.after.tracks[0]
+
+        # delete B, insert X after C, move F to the start, trim D, change
+        # the metadata of E and rename G
+        del v1[1]
+        v1.insert(2, _clip("X"))
+        f = v1[5]
+        del v1[5]
+        v1.insert(0, f)
+        v1[4].source_range = otio.opentime.TimeRange(
+            otio.opentime.RationalTime(5, 24),
+            otio.opentime.RationalTime(5, 24)
+        )
+        v1[5].metadata["note"] = "fix the color"
+        v1[6].name = "G2"
+
+        self.after.tracks[1].name = "Music"
+        self.after.metadata["revision"] = 2
+
+        edits = otio.algorithms.diff(self.before, self.after)
+        self.assertEqual(
+            self._summary(edits),
+            [
+                (otio.algorithms.DiffEditKind.MetadataChange, None, None),
+                (otio.algorithms.DiffEditKind.Delete, "B", None),
+                (otio.algorithms.DiffEditKind.Move, "F", "F"),
+                (otio.algorithms.DiffEditKind.Insert, None, "X"),
+                (otio.algorithms.DiffEditKind.Trim, "D", "D"),
+                (otio.algorithms.DiffEditKind.MetadataChange, "E", "E"),
+                (otio.algorithms.DiffEditKind.Change, "G", "G2"),
+                (otio.algorithms.DiffEditKind.Change, "A1", "Music"),
+            ]
+        )
+        self.assertIs(edits[0].before, self.before)
+        self.assertIs(edits[0].after, self.after)
+        self.assertIs(edits[2].before, self.before.tracks[0][5])
+        self.assertIs(edits[2].after, f)
+
+    def test_nested(self):
+        nested = otio.schema.Stack(name="nested", children=[_clip("N")])
+        self.before.tracks[0].append(nested)
+        self.after = copy.deepcopy(self.before)
+
+        self.after.tracks[0][-1][0].media_reference.target_url = "N_v2.mov"
+
+        self.assertEqual(
+            self._summary(otio.algorithms.diff(self.before, self.after)),
+            [(otio.algorithms.DiffEditKind.Change, "N", "N")]
+        )
+
+    def test_edits_after_hashing(self):
+        self.assertEqual(otio.algorithms.diff(self.before, self.after), [])
+
+        # edits made in place since after was hashed are found
+        self.after.tracks[0][2].metadata["note"] = "fix the color"
+        self.after.tracks[0][3].source_range.duration.value = 5
+        expected = [
+            (otio.algorithms.DiffEditKind.MetadataChange, "C", "C"),
+            (otio.algorithms.DiffEditKind.Trim, "D", "D"),
+        ]
+        self.assertEqual(
+            self._summary(otio.algorithms.diff(self.before, self.after)),
+            expected
+        )
+
+        # the hashes of before are reused
+        hashes = {}
+        self.before.content_hash(hashes)
+        hashes[self.before.tracks[0][2]] = (
+            self.after.tracks[0][2].content_hash()
+        )
+        self.assertEqual(
+            self._summary(
+                otio.algorithms.diff(self.before, self.after, hashes)
+            ),
+            expected[1:]
+        )
+        self.assertIn(self.after.tracks[0], hashes)
+
+    def test_alignment(self):
+        diff_algo = otio.algorithms.diff_algo
+
+        before = list("abcabba")
+        after = list("cbabac")
+        matches = diff_algo._aligned_indices(before, after)
+
+        # the longest common subsequence has 4 keys
+        self.assertEqual(len(matches), 4)
+        for before_index, after_index in matches:
+            self.assertEqual(before[before_index], after[after_index])
+        self.assertEqual(matches, sorted(matches))
+        self.assertEqual(
+            sorted(set(i for i, _ in matches)),
+            [i for i, _ in matches]
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -163,6 +163,65 @@ class FilterTest(unittest.TestCase, otio.test_utils.OTIOAssertions):
         tr.extend([copy.deepcopy(tr[0]), copy.deepcopy(tr[0])])
         self.assertJsonEqual(tr, result)
 
+    def test_root_tuple(self):
+        """test that what the filter returns for the root is returned as is"""
+
+        tr = otio.schema.Track(name='foo')
+        tr.append(otio.schema.Clip(name='cl1'))
+
+        def wrap_track(thing):
+            if isinstance(thing, otio.schema.Track):
+                return (thing,)
+            return thing
+
+        result = otio.algorithms.filtered_composition(tr, wrap_track)
+        self.assertIsInstance(result, tuple)
+        self.assertEqual(len(result), 1)
+        self.assertJsonEqual(result[0], tr)
+
+        result = otio.algorithms.filtered_composition(tr, lambda _: ())
+        self.assertEqual(result, ())
+
+    def test_prune_nested(self):
+        """test that pruning a composition drops everything below it"""
+
+        tl = otio.schema.Timeline(name='foo')
+        for name in ('keep', 'drop'):
+            tr = otio.schema.Track(name=name)
+            tr.append(otio.schema.Clip(name=name + '_cl1'))
+            tr.append(otio.schema.Stack(name=name + '_st'))
+            tr[1].append(otio.schema.Clip(name=name + '_cl2'))
+            tl.tracks.append(tr)
+
+        visited = []
+
+        def drop_track(thing):
+            visited.append(thing.name)
+            if thing.name == 'drop':
+                # the children are there to look at before pruning
+                self.assertEqual(len(thing), 2)
+                return None
+            thing.metadata['filtered'] = True
+            return thing
+
+        result = otio.algorithms.filtered_composition(tl, drop_track)
+
+        self.assertEqual(
+            visited,
+            ['foo', 'tracks', 'keep', 'keep_cl1', 'keep_st', 'keep_cl2', 'drop']
+        )
+        self.assertEqual(len(result.tracks), 1)
+        self.assertEqual(
+            [c.name for c in result.tracks[0].each_child()],
+            ['keep_cl1', 'keep_st', 'keep_cl2']
+        )
+        self.assertIs(result.tracks[0][1][0].parent(), result.tracks[0][1])
+        self.assertTrue(result.tracks[0][1][0].metadata['filtered'])
+
+        # the original is left alone
+        self.assertEqual(len(tl.tracks), 2)
+        self.assertNotIn('filtered', tl.tracks[0][1][0].metadata)
+
 
 class ReduceTest(unittest.TestCase, otio.test_utils.OTIOAssertions):
     maxDiff = None
@@ -338,3 +397,78 @@ class ReduceTest(unittest.TestCase, otio.test_utils.OTIOAssertions):
         self.assertTrue(isinstance(result[1], otio.schema.Gap))
         self.assertTrue(isinstance(result[2], otio.schema.Gap))
         self.assertTrue(isinstance(result[3], otio.schema.Clip))
+
+
+class PipelineTest(unittest.TestCase, otio.test_utils.OTIOAssertions):
+    maxDiff = None
+
+    def test_copy(self):
+        """Test that an empty pipeline results in a copy"""
+
+        md = {'test': 'bar'}
+        tl = otio.schema.Timeline(name='foo', metadata=md)
+        tl.tracks.append(otio.schema.Track(name='track1', metadata=md))
+        tl.tracks[0].append(otio.schema.Clip(name='cl1', metadata=md))
+
+        result = otio.algorithms.FilterPipeline().filtered(tl)
+
+        self.assertJsonEqual(tl, result)
+        self.assertIsNot(tl.tracks[0][0], result.tracks[0][0])
+
+    def test_same_as_chained_filters(self):
+        """test that a pipeline gives the same result as chained filters"""
+
+        tl = otio.schema.Timeline(name='foo')
+        tl.tracks.append(otio.schema.Track(name='track1'))
+        tl.tracks.append(otio.schema.Stack(name='stack1'))
+        for parent in (tl.tracks[0], tl.tracks[1]):
+            for name in ('a', 'b', 'c', 'd'):
+                parent.append(otio.schema.Clip(name=name))
+                parent.append(otio.schema.Gap())
+
+        def double_b(thing):
+            if thing.name == 'b':
+                return (thing, otio.schema.Clip(name='b2'))
+            return thing
+
+        def no_clips_after_b(prev, thing, __):
+            if prev is not None and prev.name == 'b2':
+                return None
+            return thing
+
+        def rename(thing):
+            if isinstance(thing, otio.schema.Clip):
+                thing.name += '_renamed'
+            return thing
+
+        expected = otio.algorithms.filtered_composition(
+            otio.algorithms.filtered_with_sequence_context(
+                otio.algorithms.filtered_composition(
+                    tl,
+                    double_b,
+                    types_to_prune=(otio.schema.Gap,)
+                ),
+                no_clips_after_b
+            ),
+            rename
+        )
+
+        pipeline = otio.algorithms.FilterPipeline()
+        pipeline.add_filter(double_b, types_to_prune=(otio.schema.Gap,))
+        pipeline.add_filter_with_sequence_context(no_clips_after_b)
+        pipeline.add_filter(rename)
+        result = pipeline.filtered(tl)
+
+        self.assertJsonEqual(expected, result)
+        self.assertEqual(
+            [c.name for c in result.tracks[0]],
+            ['a_renamed', 'b_renamed', 'b2_renamed', 'd_renamed']
+        )
+        self.assertEqual(
+            [c.name for c in result.tracks[1]],
+            ['a_renamed', 'b_renamed', 'b2_renamed', 'c_renamed', 'd_renamed']
+        )
+
+        # the original is left alone
+        self.assertEqual(len(tl.tracks[0]), 8)
+        self.assertEqual(tl.tracks[0][0].name, 'a')
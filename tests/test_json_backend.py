@@ -24,6 +24,9 @@
 
 """Unit tests for the JSON format OTIO Serializes to."""
 
+import io
+import os
+import tempfile
 import unittest
 import json
 
@@ -53,6 +56,14 @@ class TestJsonFormat(unittest.TestCase, otio.test_utils.OTIOAssertions):
             raise TypeError("did not deserialize correctly")
         self.assertJsonEqual(obj, baseline_data)
 
+    def assertSameJson(self, result, expected, sort_keys=True):
+        if sort_keys:
+            self.assertEqual(result, expected)
+        else:
+            # without sorting, the order of the keys may differ with the
+            # order of dictionaries
+            self.assertEqual(json.loads(result), json.loads(expected))
+
     def test_rationaltime(self):
         rt = otio.opentime.RationalTime()
         self.check_against_baseline(rt, "empty_rationaltime")
@@ -137,6 +148,233 @@ class TestJsonFormat(unittest.TestCase, otio.test_utils.OTIOAssertions):
         trx = otio.schema.GeneratorReference()
         self.check_against_baseline(trx, "empty_generator_reference")
 
+    def test_streaming_writer(self):
+        tl = otio.schema.Timeline(name="streamed")
+        tr = otio.schema.Track(name="V1")
+        tl.tracks.append(tr)
+        for i in range(200):
+            tr.append(
+                otio.schema.Clip(
+                    name="clip_{}".format(i),
+                    metadata={"index": i, "notes": "x" * 500},
+                    source_range=otio.opentime.TimeRange(
+                        otio.opentime.RationalTime(i, 24),
+                        otio.opentime.RationalTime(10, 24)
+                    )
+                )
+            )
+
+        for kwargs in ({}, {"sort_keys": False, "indent": None}):
+            expected = otio.core.serialize_json_to_string(tl, **kwargs)
+
+            stream = io.StringIO()
+            otio.core.serialize_json_to_stream(tl, stream, **kwargs)
+            self.assertSameJson(
+                stream.getvalue(),
+                expected,
+                sort_keys=kwargs.get("sort_keys", True)
+            )
+
+            fd, path = tempfile.mkstemp(suffix=".otio")
+            os.close(fd)
+            try:
+                otio.core.serialize_json_to_file(tl, path, **kwargs)
+                with open(path) as fi:
+                    self.assertSameJson(
+                        fi.read(),
+                        expected,
+                        sort_keys=kwargs.get("sort_keys", True)
+                    )
+            finally:
+                os.remove(path)
+
+        result = otio.adapters.otio_json.read_from_string(stream.getvalue())
+        self.assertJsonEqual(result, tl)
+
+    def test_writer_matches_json_module(self):
+        clip = otio.schema.Clip(
+            name="clip",
+            metadata={
+                "floats": [1.5, float("inf"), -float("inf"), 1e300],
+                "nested": {"b": (1, True, None), "a": {}, "c": []},
+                "text": u"caf\u00e9 \"quoted\"\n",
+                "OTIO": 2 ** 70,
+                "keys": {1: "int", 2.5: "float"},
+            },
+            source_range=otio.opentime.TimeRange(
+                otio.opentime.RationalTime(1, 24),
+                otio.opentime.RationalTime(10, 24)
+            )
+        )
+        clip.metadata["unknown"] = otio.core.instance_from_schema(
+            "Foo", 2, {"x": 1}
+        )
+        clip.metadata["transform"] = otio.opentime.TimeTransform()
+        tr = otio.schema.Track(children=[clip, clip.deepcopy()])
+
+        for sort_keys in (True, False):
+            for indent in (4, 0, "\t", None):
+                encoder = otio.core.json_serializer._SerializableObjectEncoder(
+                    sort_keys=sort_keys,
+                    indent=indent
+                )
+                try:
+                    expected = encoder.encode(tr)
+                except TypeError:
+                    # the json module of Python 2 only indents by a number
+                    continue
+
+                stream = io.StringIO()
+                otio.core.serialize_json_to_stream(
+                    tr,
+                    stream,
+                    sort_keys=sort_keys,
+                    indent=indent
+                )
+                self.assertSameJson(
+                    stream.getvalue(),
+                    expected,
+                    sort_keys=sort_keys
+                )
+
+        clip.metadata["loop"] = clip.metadata
+        with self.assertRaises(ValueError):
+            otio.core.serialize_json_to_string(tr)
+
+    def test_lazy_loading(self):
+        tl = otio.schema.Timeline(name="lazy")
+        for track_index in range(2):
+            tr = otio.schema.Track(name="V{}".format(track_index + 1))
+            tl.tracks.append(tr)
+            for i in range(5):
+                tr.append(
+                    otio.schema.Clip(
+                        name="clip_{}".format(i),
+                        source_range=otio.opentime.TimeRange(
+                            otio.opentime.RationalTime(i, 24),
+                            otio.opentime.RationalTime(10, 24)
+                        )
+                    )
+                )
+            nested = otio.schema.Stack(name="nested")
+            nested.append(otio.schema.Track())
+            tr.append(nested)
+        text = otio.adapters.otio_json.write_to_string(tl)
+
+        result = otio.adapters.otio_json.read_from_string(text, lazy=True)
+        self.assertEqual([t.name for t in result.tracks], ["V1", "V2"])
+        undecoded = result.tracks[1]
+        self.assertIsNotNone(undecoded._children_decoder)
+        self.assertIsInstance(undecoded.data["children"][0], dict)
+
+        # accessing the children decodes one level
+        first = result.tracks[0]
+        self.assertEqual(first[2].name, "clip_2")
+        self.assertIs(first[2].parent(), first)
+        self.assertEqual(first.index(first[4]), 4)
+        self.assertIsNotNone(first[5]._children_decoder)
+
+        # copies of undecoded compositions stay undecoded
+        copied = undecoded.deepcopy()
+        self.assertIsNotNone(copied._children_decoder)
+        self.assertIsOTIOEquivalentTo(copied, tl.tracks[1])
+        self.assertIsNotNone(undecoded._children_decoder)
+
+        self.assertEqual(result.duration(), tl.duration())
+        self.assertIsOTIOEquivalentTo(result, tl)
+        self.assertEqual(
+            otio.adapters.otio_json.read_from_string(
+                text,
+                lazy=True
+            ).content_hash(),
+            tl.content_hash()
+        )
+        self.assertMultiLineEqual(
+            otio.adapters.otio_json.write_to_string(
+                otio.adapters.otio_json.read_from_string(text, lazy=True)
+            ),
+            text
+        )
+
+    def test_streaming_reader(self):
+        tl = otio.schema.Timeline(name="streamed")
+        for track_index in range(2):
+            tr = otio.schema.Track(name="V{}".format(track_index + 1))
+            tl.tracks.append(tr)
+            tr.append(otio.schema.Gap())
+            for i in range(50):
+                tr.append(
+                    otio.schema.Clip(
+                        name="clip_{}".format(i),
+                        metadata={"children": [i], "notes": "x" * i}
+                    )
+                )
+            nested = otio.schema.Stack(name="nested")
+            nested.append(otio.schema.Track())
+            nested[0].append(otio.schema.Clip(name="inner"))
+            tr.append(nested)
+
+        leaves = [
+            child for child in tl.tracks.each_child()
+            if not isinstance(child, otio.core.Composition)
+        ]
+
+        for kwargs in ({}, {"sort_keys": False, "indent": None}):
+            stream = io.StringIO()
+            otio.core.serialize_json_to_stream(tl, stream, **kwargs)
+            stream.seek(0)
+            result = list(
+                otio.core.deserialize_json_items_from_stream(stream)
+            )
+            self.assertEqual(len(result), len(leaves))
+            for (item, path), leaf in zip(result, leaves):
+                self.assertJsonEqual(item, leaf)
+                self.assertEqual(path[:2], (("Timeline", None), ("Stack", None)))
+                self.assertEqual(
+                    path[-1],
+                    (leaf.schema_name(), leaf.parent().index(leaf))
+                )
+
+        self.assertEqual(
+            result[-1][1],
+            (
+                ("Timeline", None),
+                ("Stack", None),
+                ("Track", 1),
+                ("Stack", 51),
+                ("Track", 0),
+                ("Clip", 0),
+            )
+        )
+
+        stream.seek(0)
+        clips = list(
+            otio.core.deserialize_json_items_from_stream(
+                stream,
+                descended_from_type=otio.schema.Clip
+            )
+        )
+        self.assertEqual(len(clips), 102)
+
+        # the schema of a composition may come after its children
+        result = list(
+            otio.core.deserialize_json_items_from_stream(
+                io.StringIO(
+                    u'{"children": [{"OTIO_SCHEMA": "Gap.1"}], '
+                    u'"OTIO_SCHEMA": "Track.1", "name": "late"}'
+                )
+            )
+        )
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0][1], (("Track", None), ("Gap", 0)))
+
+        with self.assertRaises(ValueError):
+            list(
+                otio.core.deserialize_json_items_from_stream(
+                    io.StringIO(u'{"children": [{"name": "a"} {}]}')
+                )
+            )
+
 
 if __name__ == '__main__':
     unittest.main()
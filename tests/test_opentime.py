@@ -28,6 +28,13 @@ import opentimelineio as otio
 
 import unittest
 import copy
+import pickle
+
+try:
+    import numpy # noqa
+    could_import_numpy = True
+except ImportError:
+    could_import_numpy = False
 
 
 class TestTime(unittest.TestCase):
@@ -314,6 +321,54 @@ class TestTime(unittest.TestCase):
         with self.assertRaises(ValueError):
             otio.opentime.to_timecode(t)
 
+        with self.assertRaises(ValueError):
+            otio.opentime.to_timecodes([t], 29.98)
+
+        with self.assertRaises(ValueError):
+            otio.opentime.from_timecodes(['00:00:00:00'], 29.98)
+
+    def test_bulk_timecodes(self):
+        for rate in (24, 23.976, 25, 29.97, 30, 59.94):
+            # a short batch and one long enough to take the numpy path, both
+            # running past the 24 hour rollover
+            for count, step in ((10, 1000037), (300, 10007)):
+                times = [
+                    otio.opentime.RationalTime(value, rate)
+                    for value in range(0, count * step, step)
+                ]
+
+                timecodes = otio.opentime.to_timecodes(times, rate)
+                self.assertEqual(
+                    timecodes,
+                    [otio.opentime.to_timecode(t, rate) for t in times]
+                )
+                self.assertEqual(
+                    otio.opentime.to_timecodes([t.value for t in times], rate),
+                    timecodes
+                )
+
+                self.assertEqual(
+                    otio.opentime.from_timecodes(timecodes, rate),
+                    [otio.opentime.from_timecode(tc, rate) for tc in timecodes]
+                )
+
+        self.assertEqual(
+            otio.opentime.to_timecodes(
+                [otio.opentime.RationalTime(1, 24), None],
+                24
+            ),
+            ["00:00:00:01", None]
+        )
+
+        with self.assertRaises(ValueError):
+            otio.opentime.to_timecodes([-1], 24)
+
+        with self.assertRaises(ValueError):
+            otio.opentime.to_timecodes([-1] * 100, 24)
+
+        with self.assertRaises(ValueError):
+            otio.opentime.from_timecodes(['00:00:00;00'], 24)
+
     def test_time_string_24(self):
 
         time_string = "00:00:00.041667"
@@ -667,6 +722,41 @@ class TestTimeRange(unittest.TestCase):
         with self.assertRaises(TypeError):
             setattr(tr, "duration", bad_t)
 
+    def test_pickle(self):
+        tr = otio.opentime.TimeRange(
+            otio.opentime.RationalTime(1, 24),
+            otio.opentime.RationalTime(5, 30)
+        )
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            for value in (tr, tr.start_time):
+                result = pickle.loads(pickle.dumps(value, protocol))
+                self.assertIs(type(result), type(value))
+                self.assertEqual(result, value)
+            self.assertEqual(result.rate, 24)
+
+    def test_value_semantics(self):
+        start = otio.opentime.RationalTime(1, 24)
+        duration = otio.opentime.RationalTime(5, 24)
+        tr = otio.opentime.TimeRange(start, duration)
+
+        # the range holds copies of the times it was constructed with
+        start.value = 10
+        duration += otio.opentime.RationalTime(5, 24)
+        self.assertEqual(tr.start_time, otio.opentime.RationalTime(1, 24))
+        self.assertEqual(tr.duration, otio.opentime.RationalTime(5, 24))
+
+        tr_copy = copy.copy(tr)
+        self.assertEqual(tr_copy, tr)
+        self.assertIsNot(tr_copy.start_time, tr.start_time)
+        self.assertIsNot(tr_copy.duration, tr.duration)
+
+        with self.assertRaises(TypeError):
+            otio.opentime.TimeRange(start, otio.opentime.RationalTime(-1, 24))
+
+        # both types are slotted to keep them small
+        self.assertFalse(hasattr(tr, "__dict__"))
+        self.assertFalse(hasattr(start, "__dict__"))
+
     def test_extended_by(self):
         # base 25 is just for testing
 
@@ -949,5 +1039,119 @@ class TestTimeRange(unittest.TestCase):
         self.assertNotEqual(frame, otio.opentime.to_frames(t, 12))
 
 
+@unittest.skipIf(not could_import_numpy, "numpy not available")
+class TestTimeArrays(unittest.TestCase):
+
+    def setUp(self):
+        self.times = [
+            otio.opentime.RationalTime(v, r)
+            for v, r in [(0, 24), (12, 24), (100, 25), (7.5, 30), (48, 48)]
+        ]
+        self.other_times = [
+            otio.opentime.RationalTime(v, r)
+            for v, r in [(3, 24), (12, 24), (4, 24), (8, 30), (24, 24)]
+        ]
+
+    def test_round_trip(self):
+        times = otio.opentime.RationalTimeArray.from_times(self.times)
+        self.assertEqual(len(times), len(self.times))
+        self.assertEqual(times.to_times(), self.times)
+        self.assertEqual(list(times), self.times)
+        self.assertEqual(times[2], self.times[2])
+        self.assertEqual(times[1:3].to_times(), self.times[1:3])
+
+        ranges = [
+            otio.opentime.TimeRange(t, d)
+            for t, d in zip(self.times, self.other_times)
+        ]
+        range_array = otio.opentime.TimeRangeArray.from_ranges(ranges)
+        self.assertEqual(range_array.to_ranges(), ranges)
+        self.assertEqual(range_array[0], ranges[0])
+
+    def test_arithmetic(self):
+        times = otio.opentime.RationalTimeArray.from_times(self.times)
+        others = otio.opentime.RationalTimeArray.from_times(self.other_times)
+        offset = otio.opentime.RationalTime(10, 24)
+
+        pairs = list(zip(self.times, self.other_times))
+        self.assertEqual((times + others).to_times(), [a + b for a, b in pairs])
+        self.assertEqual((times - others).to_times(), [a - b for a, b in pairs])
+        self.assertEqual(
+            (times + offset).to_times(),
+            [t + offset for t in self.times]
+        )
+        self.assertEqual(
+            times.rescaled_to(48).to_times(),
+            [t.rescaled_to(48) for t in self.times]
+        )
+
+    def test_comparison(self):
+        times = otio.opentime.RationalTimeArray.from_times(self.times)
+        others = otio.opentime.RationalTimeArray.from_times(self.other_times)
+
+        pairs = list(zip(self.times, self.other_times))
+        self.assertEqual(list(times < others), [a < b for a, b in pairs])
+        self.assertEqual(list(times >= others), [a >= b for a, b in pairs])
+        self.assertEqual(list(times == others), [a == b for a, b in pairs])
+        self.assertEqual(list(times != others), [a != b for a, b in pairs])
+
+        with self.assertRaises(TypeError):
+            times < 5
+
+    def test_conversion(self):
+        times = otio.opentime.RationalTimeArray.from_times(self.times)
+
+        self.assertEqual(
+            list(times.to_frames()),
+            [otio.opentime.to_frames(t) for t in self.times]
+        )
+        self.assertEqual(
+            list(times.to_frames(24)),
+            [otio.opentime.to_frames(t, 24) for t in self.times]
+        )
+        self.assertEqual(
+            list(times.to_seconds()),
+            [otio.opentime.to_seconds(t) for t in self.times]
+        )
+
+    def test_range_queries(self):
+        ranges = [
+            otio.opentime.TimeRange(
+                otio.opentime.RationalTime(start, 24),
+                otio.opentime.RationalTime(duration, 24)
+            )
+            for start, duration in [(0, 10), (10, 10), (5, 30), (40, 0)]
+        ]
+        range_array = otio.opentime.TimeRangeArray.from_ranges(ranges)
+        search = otio.opentime.TimeRange(
+            otio.opentime.RationalTime(8, 24),
+            otio.opentime.RationalTime(4, 24)
+        )
+        point = otio.opentime.RationalTime(10, 24)
+
+        self.assertEqual(
+            list(range_array.overlaps(search)),
+            [tr.overlaps(search) for tr in ranges]
+        )
+        self.assertEqual(
+            list(range_array.contains(search)),
+            [tr.contains(search) for tr in ranges]
+        )
+        self.assertEqual(
+            list(range_array.contains(point)),
+            [tr.contains(point) for tr in ranges]
+        )
+        self.assertEqual(
+            range_array.end_time_exclusive().to_times(),
+            [tr.end_time_exclusive() for tr in ranges]
+        )
+
+        with self.assertRaises(TypeError):
+            otio.opentime.TimeRangeArray(
+                otio.opentime.RationalTimeArray([0], 24),
+                otio.opentime.RationalTimeArray([-1], 24)
+            )
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+#
+# Copyright 2017 Pixar Animation Studios
+#
+# Licensed under the Apache License, Version 2.0 (the "Apache License")
+# with the following modification; you may not use this file except in
+# compliance with the Apache License and the following modification to it:
+# Section 6. Trademarks. is deleted and replaced with:
+#
+# 6. Trademarks. This License does not grant permission to use the trade
+#    names, trademarks, service marks, or product names of the Licensor
+#    and its affiliates, except as required to comply with Section 4(c) of
+#    the License and to reproduce the content of the NOTICE file.
+#
+# You may obtain a copy of the Apache License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the Apache License with the above modification is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied. See the Apache License for the specific
+# language governing permissions and limitations under the Apache License.
+
+"""Test the otio binary adapter."""
+
+# python
+import os
+import tempfile
+import unittest
+
+import opentimelineio as otio
+from opentimelineio.adapters import otio_binary
+
+SAMPLE_DATA_DIR = os.path.join(os.path.dirname(__file__), "sample_data")
+MULTITRACK_PATH = os.path.join(SAMPLE_DATA_DIR, "multitrack.otio")
+TRANSITION_PATH = os.path.join(SAMPLE_DATA_DIR, "transition_test.otio")
+
+
+class OTIOBinaryAdapterTest(unittest.TestCase, otio.test_utils.OTIOAssertions):
+
+    def assertRoundTrips(self, obj):
+        result = otio_binary.read_from_string(otio_binary.write_to_string(obj))
+        self.assertMultiLineEqual(
+            otio.adapters.write_to_string(result, "otio_json"),
+            otio.adapters.write_to_string(obj, "otio_json")
+        )
+        return result
+
+    def test_sample_data(self):
+        for path in (MULTITRACK_PATH, TRANSITION_PATH):
+            timeline = otio.adapters.read_from_file(path)
+            self.assertRoundTrips(timeline)
+
+            # much smaller than the json
+            self.assertLess(
+                len(otio_binary.write_to_string(timeline)) * 5,
+                len(otio.adapters.write_to_string(timeline, "otio_json"))
+            )
+
+    def test_values(self):
+        clip = otio.schema.Clip(
+            name=u"caf\u00e9",
+            metadata={
+                "numbers": [0, -1, 2 ** 70, -2 ** 70, 1.5, -0.0, 3.0, 1e300],
+                "special": [float("inf"), -float("inf")],
+                "constants": (True, False, None),
+                "nested": {"a": {"b": []}, "c": {}},
+                "keys": {1: "int", 2.5: "float"},
+                "text": {u"caf\u00e9": u"caf\u00e9 cr\u00e8me"},
+                "transform": otio.opentime.TimeTransform(
+                    otio.opentime.RationalTime(3, 24.0),
+                    2.0
+                ),
+                "looks_like_time": {
+                    "OTIO_SCHEMA": "RationalTime.1",
+                    "value": 5,
+                    "rate": 25,
+                },
+                "unknown": otio.core.instance_from_schema(
+                    "NotARealSchema", 3, {"a": 1}
+                ),
+            },
+            source_range=otio.opentime.TimeRange(
+                otio.opentime.RationalTime(86400.5, 23.976),
+                otio.opentime.RationalTime(10, 24)
+            )
+        )
+        result = self.assertRoundTrips(clip)
+
+        self.assertEqual(
+            result.metadata["looks_like_time"],
+            otio.opentime.RationalTime(5, 25)
+        )
+        self.assertTrue(result.metadata["unknown"].is_unknown_schema)
+        self.assertEqual(repr(result.metadata["numbers"][5]), "-0.0")
+        self.assertIsInstance(result.metadata["numbers"][6], float)
+
+    def test_upgrades(self):
+        data = otio_binary.write_to_string(
+            otio.schema.Marker(name="m", metadata={"k": "v"})
+        )
+
+        # rewrite the string table into that of the previous Marker schema
+        data = data.replace(b"\x08Marker.2", b"\x08Marker.1")
+        data = data.replace(b"\x0cmarked_range", b"\x05range")
+
+        self.assertIsOTIOEquivalentTo(
+            otio_binary.read_from_string(data),
+            otio.schema.Marker(name="m", metadata={"k": "v"})
+        )
+
+    def test_disk_io(self):
+        timeline = otio.adapters.read_from_file(MULTITRACK_PATH)
+        fd, path = tempfile.mkstemp(suffix=".otiob")
+        os.close(fd)
+        try:
+            otio.adapters.write_to_file(timeline, path)
+            with open(path, "rb") as fi:
+                self.assertEqual(
+                    fi.read(),
+                    otio.adapters.write_to_string(timeline, "otio_binary")
+                )
+
+            result = otio.adapters.read_from_file(path)
+            self.assertJsonEqual(result, timeline)
+        finally:
+            os.remove(path)
+
+    def test_corrupt_data(self):
+        data = otio_binary.write_to_string(
+            otio.adapters.read_from_file(TRANSITION_PATH)
+        )
+
+        for bad in (b"", b"{}", data[:-1], data + b"\0", data[:-20]):
+            with self.assertRaises(otio.exceptions.CouldNotReadFileError):
+                otio_binary.read_from_string(bad)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -93,6 +93,51 @@ class SerializableObjTest(unittest.TestCase, otio.test_utils.OTIOAssertions):
         so_cp.data["foo"] = "bar"
         self.assertNotEqual(so, so_cp)
 
+    def test_equivalence(self):
+        so = otio.core.SerializableObject()
+        so.data["metadata"] = {"foo": [1, 2.0, {"bar": None}]}
+        so.data["range"] = otio.opentime.TimeRange(
+            otio.opentime.RationalTime(1, 24),
+            otio.opentime.RationalTime(10, 24)
+        )
+
+        import copy
+
+        so_cp = copy.deepcopy(so)
+        self.assertIsNone(so.first_difference(so_cp))
+
+        # numbers compare by value, and tuples like lists, as in JSON
+        so_cp.data["metadata"]["foo"] = (1.0, 2, {"bar": None})
+        so_cp.data["range"].duration = otio.opentime.RationalTime(10.0, 24.0)
+        self.assertIsOTIOEquivalentTo(so, so_cp)
+
+        so_cp.data["range"].duration = otio.opentime.RationalTime(10, 25)
+        self.assertEqual(
+            so.first_difference(so_cp),
+            "SerializableObject.range.duration.rate"
+        )
+        self.assertFalse(so.is_equivalent_to(so_cp))
+
+        so_cp = copy.deepcopy(so)
+        so_cp.data["metadata"]["foo"][2]["baz"] = None
+        self.assertEqual(
+            so.first_difference(so_cp),
+            "SerializableObject.metadata.foo[2].baz"
+        )
+
+        so_cp = copy.deepcopy(so)
+        so_cp.data["metadata"]["foo"].append(3)
+        self.assertEqual(
+            so.first_difference(so_cp),
+            "SerializableObject.metadata.foo[3]"
+        )
+
+        self.assertEqual(
+            otio.schema.Track().first_difference(otio.schema.Stack()),
+            "Track.OTIO_SCHEMA"
+        )
+        self.assertFalse(so.is_equivalent_to("foo"))
+
     def test_copy_subclass(self):
         @otio.core.register_type
         class Foo(otio.core.SerializableObject):
@@ -149,6 +194,72 @@ class SerializableObjTest(unittest.TestCase, otio.test_utils.OTIOAssertions):
         ft = otio.core.instance_from_schema("Stuff", "4", {"foo_3": "bar"})
         self.assertEqual(ft.data['foo_3'], "bar")
 
+    def test_schema_plans(self):
+        plans = otio.core.type_registry._SCHEMA_PLANS
+
+        marker_json = (
+            '{"OTIO_SCHEMA": "Marker.1", "name": "m", "range": '
+            '{"OTIO_SCHEMA": "TimeRange.1", '
+            '"start_time": {"OTIO_SCHEMA": "RationalTime.1", '
+            '"value": 1, "rate": 24}, '
+            '"duration": {"OTIO_SCHEMA": "RationalTime.1", '
+            '"value": 2, "rate": 24}}}'
+        )
+        markers = [
+            otio.adapters.read_from_string(marker_json, "otio_json")
+            for _ in range(2)
+        ]
+        self.assertIn("Marker.1", plans)
+        for marker in markers:
+            self.assertEqual(
+                marker.marked_range,
+                otio.opentime.TimeRange(
+                    otio.opentime.RationalTime(1, 24),
+                    otio.opentime.RationalTime(2, 24)
+                )
+            )
+            self.assertNotIn("range", marker.data)
+
+        # defaults for fields missing from the data are not shared
+        clips = [
+            otio.core.instance_from_schema_label("Clip.1", {"name": "c"})
+            for _ in range(2)
+        ]
+        self.assertIsOTIOEquivalentTo(clips[0], otio.schema.Clip(name="c"))
+        self.assertIsNone(clips[0].parent())
+        self.assertIsNot(clips[0].metadata, clips[1].metadata)
+        self.assertIsNot(
+            clips[0].media_reference,
+            clips[1].media_reference
+        )
+
+        # compositions still set the parents of their children
+        track = otio.core.instance_from_schema_label(
+            "Track.1",
+            {"children": clips}
+        )
+        self.assertIs(clips[1].parent(), track)
+
+        # changes to the registry are picked up
+        marker_upgrades = otio.core.type_registry._UPGRADE_FUNCTIONS[
+            otio.schema.Marker
+        ]
+        upgrade_to_two = marker_upgrades[2]
+
+        @otio.core.upgrade_function_for(otio.schema.Marker, 2)
+        def upgrade_marker_again(data_dict):
+            data_dict = upgrade_to_two(data_dict)
+            data_dict["metadata"] = {"upgraded": True}
+            return data_dict
+
+        self.assertEqual(plans, {})
+        try:
+            marker = otio.adapters.read_from_string(marker_json, "otio_json")
+            self.assertEqual(marker.metadata, {"upgraded": True})
+        finally:
+            marker_upgrades[2] = upgrade_to_two
+            plans.clear()
+
     def test_equality(self):
         o1 = otio.core.SerializableObject()
         o2 = otio.core.SerializableObject()
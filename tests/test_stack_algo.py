@@ -477,3 +477,45 @@ class StackAlgoTests(unittest.TestCase, otio.test_utils.OTIOAssertions):
         self.assertEqual(4, len(stack[1]))
         self.assertEqual(4, len(flat_track))
         self.assertEqual(flat_track[1].name, "test_transition")
+
+    def test_flatten_does_not_modify_tracks(self):
+        stack = otio.schema.Stack(children=[
+            self.trackZ,
+            self.trackgFg,
+            self.trackDgE
+        ])
+        before = otio.adapters.write_to_string(stack, 'otio_json')
+        flat_track = otio.algorithms.flatten_stack(stack)
+        self.assertMultiLineEqual(
+            otio.adapters.write_to_string(stack, 'otio_json'),
+            before
+        )
+
+        # D and E cover the middle track's gaps, which leaves F over Z
+        self.assertEqual(
+            [item.name for item in flat_track],
+            ["D", "F", "E"]
+        )
+        self.assertIsNot(flat_track[1], self.trackgFg[1])
+
+    def test_flatten_cannot_trim_transition(self):
+        self.trackZ.insert(
+            1,
+            otio.schema.Transition(
+                in_offset=otio.opentime.RationalTime(60, 24),
+                out_offset=otio.opentime.RationalTime(10, 24)
+            )
+        )
+        self.trackZ.append(
+            otio.schema.Gap(
+                source_range=otio.opentime.TimeRange(
+                    duration=otio.opentime.RationalTime(50, 24)
+                )
+            )
+        )
+        stack = otio.schema.Stack(children=[
+            self.trackZ,
+            self.trackDgE
+        ])
+        with self.assertRaises(otio.exceptions.CannotTrimTransitionsError):
+            otio.algorithms.flatten_stack(stack)
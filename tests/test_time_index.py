@@ -0,0 +1,184 @@
+#
+# Copyright 2017 Pixar Animation Studios
+#
+# Licensed under the Apache License, Version 2.0 (the "Apache License")
+# with the following modification; you may not use this file except in
+# compliance with the Apache License and the following modification to it:
+# Section 6. Trademarks. is deleted and replaced with:
+#
+# 6. Trademarks. This License does not grant permission to use the trade
+#    names, trademarks, service marks, or product names of the Licensor
+#    and its affiliates, except as required to comply with Section 4(c) of
+#    the License and to reproduce the content of the NOTICE file.
+#
+# You may obtain a copy of the Apache License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the Apache License with the above modification is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied. See the Apache License for the specific
+# language governing permissions and limitations under the Apache License.
+#
+
+"""Test file for the timeline index."""
+
+import unittest
+
+import opentimelineio as otio
+
+
+def _clip(name, duration):
+    return otio.schema.Clip(
+        name=name,
+        source_range=otio.opentime.TimeRange(
+            otio.opentime.RationalTime(10, 24),
+            otio.opentime.RationalTime(duration, 24)
+        )
+    )
+
+
+def _range(start, duration):
+    return otio.opentime.TimeRange(
+        otio.opentime.RationalTime(start, 24),
+        otio.opentime.RationalTime(duration, 24)
+    )
+
+
+class TimeIndexTests(unittest.TestCase, otio.test_utils.OTIOAssertions):
+    """ test harness for the TimeIndex """
+
+    def setUp(self):
+        # V1: [A 0-10][B 10-30][nested 30-50: [C 30-35][D 35-50]]
+        # V2: [E 0-40]
+        self.nested = otio.schema.Track(
+            name="nested",
+            children=[_clip("C", 5), _clip("D", 15)]
+        )
+        self.v1 = otio.schema.Track(
+            name="V1",
+            children=[_clip("A", 10), _clip("B", 20), self.nested]
+        )
+        self.v2 = otio.schema.Track(name="V2", children=[_clip("E", 40)])
+        self.timeline = otio.schema.Timeline(tracks=[self.v1, self.v2])
+        self.index = otio.algorithms.TimeIndex(
+            self.timeline,
+            descended_from_type=otio.schema.Clip
+        )
+
+    def _names(self, items):
+        return [item.name for item in items]
+
+    def test_ranges(self):
+        self.assertEqual(len(self.index), 5)
+        self.assertNotIn(self.nested, self.index)
+
+        for name, expected in (
+            ("A", _range(0, 10)),
+            ("B", _range(10, 20)),
+            ("C", _range(30, 5)),
+            ("D", _range(35, 15)),
+            ("E", _range(0, 40)),
+        ):
+            clip = next(
+                c for c in self.timeline.each_clip() if c.name == name
+            )
+            self.assertEqual(self.index.range_of(clip), expected)
+
+        with self.assertRaises(otio.exceptions.NotAChildError):
+            self.index.range_of(self.v1)
+
+    def test_queries(self):
+        self.assertEqual(
+            self._names(self.index.items_in_range(_range(5, 31))),
+            ["A", "B", "C", "D", "E"]
+        )
+        self.assertEqual(
+            self._names(self.index.items_in_range(_range(10, 20))),
+            ["B", "E"]
+        )
+        self.assertEqual(
+            self._names(
+                self.index.items_at_time(otio.opentime.RationalTime(35, 24))
+            ),
+            ["D", "E"]
+        )
+        self.assertEqual(
+            self.index.items_at_time(otio.opentime.RationalTime(50, 24)),
+            []
+        )
+
+        # an index of all the items includes the nested track
+        index = otio.algorithms.TimeIndex(self.timeline)
+        self.assertEqual(
+            self._names(
+                index.items_at_time(otio.opentime.RationalTime(35, 24))
+            ),
+            ["V1", "nested", "D", "V2", "E"]
+        )
+
+    def test_nearest_item(self):
+        index = otio.algorithms.TimeIndex(self.v1)
+
+        def nearest(value):
+            return index.nearest_item(
+                otio.opentime.RationalTime(value, 24)
+            ).name
+
+        self.assertEqual(nearest(12), "B")
+        self.assertEqual(nearest(-3), "A")
+        self.assertEqual(nearest(60), "nested")
+
+        self.assertIsNone(
+            otio.algorithms.TimeIndex(
+                otio.schema.Track()
+            ).nearest_item(otio.opentime.RationalTime())
+        )
+
+    def test_trimmed_parents(self):
+        # only 32-40 of the nested track is visible, so C is cut down and D
+        # is hidden entirely
+        self.nested.source_range = _range(0, 8)
+        self.index.update(self.nested)
+
+        c = self.nested[0]
+        d = self.nested[1]
+        self.assertEqual(self.index.range_of(c), _range(30, 5))
+        self.assertEqual(self.index.range_of(d), _range(35, 3))
+
+        self.nested.source_range = _range(0, 4)
+        self.index.update(self.nested)
+        self.assertEqual(self.index.range_of(c), _range(30, 4))
+        self.assertNotIn(d, self.index)
+
+    def test_update(self):
+        # growing B moves everything after it in V1, but not V2
+        b = self.v1[1]
+        b.source_range = _range(10, 30)
+        self.index.update(b)
+        self.assertEqual(
+            self._names(self.index.items_in_range(_range(40, 10))),
+            ["C", "D"]
+        )
+        self.assertEqual(self.index.range_of(self.nested[1]), _range(45, 15))
+
+        # removing and inserting children
+        del self.nested[0]
+        self.nested.append(_clip("F", 10))
+        self.index.update(self.nested)
+        self.assertEqual(
+            self._names(self.index.items_in_range(_range(40, 100))),
+            ["D", "F"]
+        )
+        self.assertEqual(len(self.index), 5)
+
+        self.index.update()
+        self.assertEqual(len(self.index), 5)
+
+        with self.assertRaises(otio.exceptions.NotAChildError):
+            self.index.update(_clip("G", 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
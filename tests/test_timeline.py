@@ -27,6 +27,15 @@ import unittest
 import opentimelineio as otio
 
 
+def _clip(duration):
+    return otio.schema.Clip(
+        source_range=otio.opentime.TimeRange(
+            otio.opentime.RationalTime(0, 24),
+            otio.opentime.RationalTime(duration, 24)
+        )
+    )
+
+
 class TimelineTests(unittest.TestCase, otio.test_utils.OTIOAssertions):
 
     def test_init(self):
@@ -83,6 +92,49 @@ class TimelineTests(unittest.TestCase, otio.test_utils.OTIOAssertions):
             tl.tracks[0].range_of_child_at_index(0)
         )
 
+    def test_duration_after_edits(self):
+        tr = otio.schema.Track(children=[_clip(10), _clip(20)])
+        nested = otio.schema.Stack(
+            children=[otio.schema.Track(children=[_clip(5)])]
+        )
+        tr.append(nested)
+        tl = otio.schema.Timeline(tracks=[tr])
+        self.assertEqual(tl.duration().value, 35)
+
+        # repeated queries are answered from the cache
+        self.assertIsNotNone(tl.tracks._available_range_cache)
+        self.assertEqual(tl.duration().value, 35)
+
+        tr.append(_clip(1))
+        self.assertEqual(tl.duration().value, 36)
+
+        tr[0].source_range = otio.opentime.TimeRange(
+            otio.opentime.RationalTime(0, 24),
+            otio.opentime.RationalTime(1, 24)
+        )
+        self.assertEqual(tl.duration().value, 27)
+
+        # edits deep in the tree propagate up to the timeline
+        nested[0].append(_clip(4))
+        self.assertEqual(tl.duration().value, 31)
+
+        trx = otio.schema.Transition(
+            in_offset=otio.opentime.RationalTime(2, 24),
+            out_offset=otio.opentime.RationalTime(3, 24)
+        )
+        tr.append(trx)
+        self.assertEqual(tl.duration().value, 34)
+
+        trx.out_offset = otio.opentime.RationalTime(6, 24)
+        self.assertEqual(tl.duration().value, 37)
+
+        del tr[-1]
+        self.assertEqual(tl.duration().value, 31)
+
+        # the cached range is not shared with the caller
+        tl.tracks.available_range().duration.value = 100
+        self.assertEqual(tl.duration().value, 31)
+
     def test_iterators(self):
         self.maxDiff = None
         track = otio.schema.Track(name="test_track")
@@ -532,3 +532,36 @@ class TrackTrimmingTests(unittest.TestCase, otio.test_utils.OTIOAssertions):
         """, "otio_json")
 
         self.assertJsonEqual(expected, trimmed)
+
+    def test_trim_middle_leaves_original_alone(self):
+        original_track = self.make_sample_track()
+        original_track.metadata["foo"] = {"bar": 1}
+        before = otio.adapters.write_to_string(original_track, "otio_json")
+
+        # trim to the middle of clip B
+        trimmed = otio.algorithms.track_trimmed_to_range(
+            original_track,
+            otio.opentime.TimeRange(
+                start_time=otio.opentime.RationalTime(60, 24),
+                duration=otio.opentime.RationalTime(20, 24)
+            )
+        )
+        self.assertEqual(len(trimmed), 1)
+        self.assertEqual(trimmed[0].name, "B")
+        self.assertIsNot(trimmed[0], original_track[1])
+        self.assertIs(trimmed[0].parent(), trimmed)
+        self.assertEqual(
+            trimmed[0].trimmed_range(),
+            otio.opentime.TimeRange(
+                start_time=otio.opentime.RationalTime(10, 24),
+                duration=otio.opentime.RationalTime(20, 24)
+            )
+        )
+
+        # the fields of the track are copied, not shared
+        self.assertEqual(trimmed.metadata, original_track.metadata)
+        trimmed.metadata["foo"]["bar"] = 2
+        self.assertMultiLineEqual(
+            otio.adapters.write_to_string(original_track, "otio_json"),
+            before
+        )